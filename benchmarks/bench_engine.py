@@ -0,0 +1,494 @@
+"""
+3psLCCA engine benchmarks
+-------------------------
+Times every engine stage on the example inputs (detailed and global mode),
+along the scaling axes used by the nightly jobs and, with numpy, the
+vectorized paths against the scalar engine. Writes the result as JSON so
+runs can be compared over time.
+
+Run from the project root:
+
+    python benchmarks/bench_engine.py --output bench.json
+    python benchmarks/bench_engine.py --quick
+
+All inputs are derived deterministically from src/examples, so two runs on
+the same machine measure the same work.
+"""
+
+import argparse
+import copy
+import importlib.util
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from examples.from_dict.Input import Input  # noqa: E402
+from examples.from_dict.Input_global import Input_global  # noqa: E402
+from examples.from_dict.wpi import wpi  # noqa: E402
+
+from three_ps_lcca_core.core.main import (  # noqa: E402
+    _normalise_inputs,
+    _program_inputs,
+    _road_user_costs,
+    _stage_params,
+    run_full_lcc_analysis,
+)
+from three_ps_lcca_core.core.batch import run_batch_lcc_analysis  # noqa: E402
+from three_ps_lcca_core.core.road_user_cost.main import (  # noqa: E402
+    calculate_road_user_costs,
+)
+from three_ps_lcca_core.core.road_user_cost.carriage_width_info.carriagewayStandards import (  # noqa: E402
+    CarriagewayStandards,
+)
+from three_ps_lcca_core.core.road_user_cost.vehicle_operation_cost import (  # noqa: E402
+    core as voc_core,
+    route,
+)
+from three_ps_lcca_core.core.road_user_cost.vehicle_operation_cost.batch import (  # noqa: E402
+    compute_voc_batch,
+)
+from three_ps_lcca_core.core.road_user_cost.congestion import (  # noqa: E402
+    core as congestion_core,
+)
+from three_ps_lcca_core.core.stage_cost.stage_cost import (  # noqa: E402
+    StageCostCalculator,
+)
+from three_ps_lcca_core.core.stage_cost.vectorized import (  # noqa: E402
+    VECTOR_COSTS,
+    VectorizedStageCostCalculator,
+)
+from three_ps_lcca_core.core.stage_cost.utils.present_worth_factor import (  # noqa: E402
+    sum_of_present_worth_factor,
+    demolition_spwi,
+)
+from three_ps_lcca_core.core.utils.input_validator import (  # noqa: E402
+    ironclad_validator,
+)
+from three_ps_lcca_core.core.utils.list_suggestions import (  # noqa: E402
+    get_IRC_standard_suggestions,
+)
+
+SCHEMA_VERSION = 1
+
+CONSTRUCTION_COSTS = {
+    "initial_construction_cost": 12843979.44,
+    "initial_carbon_emissions_cost": 2065434.91,
+    "superstructure_construction_cost": 9356038.92,
+    "total_scrap_value": 2164095.02,
+}
+
+ANALYSIS_PERIODS = (50, 100, 200, 400, 800)
+INTERVALS = (1, 2, 5, 10, 25)
+PEAK_HOURS = (1, 2, 4, 8, 16, 23)
+PORTFOLIO_SIZES = (1, 10, 50, 200)
+SWEEP_POINTS = 1000
+ROUTE_SEGMENTS = 200
+
+
+def measure(fn, repeat, number=None, budget=0.2):
+    """
+    Times fn() and returns per-call statistics in seconds.
+
+    Args:
+        fn (callable): Zero-argument callable to time.
+        repeat (int): Number of timed samples.
+        number (int, optional): Calls per sample. Calibrated so that one
+            sample takes roughly budget / repeat seconds when omitted.
+        budget (float, optional): Target wall time of the whole measurement.
+
+    Returns:
+        dict: 'min', 'median', 'mean', 'stdev' per call, plus 'repeat' and 'number'.
+    """
+    fn()  # warm-up: imports, caches, first-call allocation
+
+    if number is None:
+        start = time.perf_counter()
+        fn()
+        single = max(time.perf_counter() - start, 1e-7)
+        number = max(1, int(budget / repeat / single))
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def _environment():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "git_commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+def _with(data, path, value):
+    """
+    Deep copy of data with data[path] = value.
+    """
+    data = copy.deepcopy(data)
+    target = data
+    for key in path[:-1]:
+        target = target[key]
+    target[path[-1]] = value
+    return data
+
+
+def bench_components(repeat):
+    """
+    Times each engine stage individually on the example inputs.
+    """
+    traffic = Input["traffic_and_road_data"]
+    general = Input_global["general_parameters"]
+    suggestions = get_IRC_standard_suggestions()
+    voc_raw, _ = voc_core.main(copy.deepcopy(traffic), wpi)
+
+    pwf_args = dict(
+        inflation_rate=general["inflation_rate_percent"],
+        discount_rate=general["discount_rate_percent"],
+        analysis_period=general["analysis_period_years"],
+        service_life=general["service_life_years"],
+        construction_period=general["construction_period_months"] / 12,
+    )
+
+    cases = {
+        "run_full_lcc_analysis.detailed": lambda: run_full_lcc_analysis(
+            Input, CONSTRUCTION_COSTS, wpi=wpi
+        ),
+        "run_full_lcc_analysis.detailed.instrumented": lambda: run_full_lcc_analysis(
+            Input, CONSTRUCTION_COSTS, wpi=wpi, instrumentation=True
+        ),
+        "run_full_lcc_analysis.global": lambda: run_full_lcc_analysis(
+            Input_global, CONSTRUCTION_COSTS
+        ),
+        "calculate_road_user_costs": lambda: calculate_road_user_costs(traffic, wpi),
+        "vehicle_operation_cost.core.main": lambda: voc_core.main(traffic, wpi),
+        "congestion.core.calculate_total_adjusted_costs": lambda: (
+            congestion_core.calculate_total_adjusted_costs(voc_raw, traffic)
+        ),
+        "present_worth_factor.sum_of_present_worth_factor": lambda: (
+            sum_of_present_worth_factor(interval=5, **pwf_args)
+        ),
+        "present_worth_factor.demolition_spwi": lambda: demolition_spwi(
+            demolition_duration_years=1 / 12, **pwf_args
+        ),
+        "ironclad_validator.detailed": lambda: ironclad_validator(
+            Input, suggestions, wpi, eval_wpi=True
+        ),
+        "ironclad_validator.global": lambda: ironclad_validator(
+            Input_global, suggestions, None, eval_wpi=False
+        ),
+    }
+
+    return {name: measure(fn, repeat) for name, fn in cases.items()}
+
+
+def bench_scaling(repeat, quick=False):
+    """
+    Times the engine along the scaling axes.
+    """
+    general = Input_global["general_parameters"]
+    results = {}
+
+    results["analysis_period_years"] = {
+        str(period): measure(
+            lambda data=_with(
+                Input_global, ("general_parameters", "analysis_period_years"), period
+            ): run_full_lcc_analysis(data, CONSTRUCTION_COSTS),
+            repeat,
+        )
+        for period in ANALYSIS_PERIODS
+    }
+
+    results["interval_years"] = {
+        str(interval): measure(
+            lambda interval=interval: sum_of_present_worth_factor(
+                inflation_rate=general["inflation_rate_percent"],
+                discount_rate=general["discount_rate_percent"],
+                analysis_period=max(ANALYSIS_PERIODS),
+                interval=interval,
+                service_life=general["service_life_years"],
+                construction_period=general["construction_period_months"] / 12,
+            ),
+            repeat,
+        )
+        for interval in INTERVALS
+    }
+
+    peak_path = (
+        "traffic_and_road_data",
+        "additional_inputs",
+        "peak_hour_traffic_percent_per_hour",
+    )
+    results["peak_hours"] = {
+        str(hours): measure(
+            lambda data=_with(Input, peak_path, [0.9 / hours] * hours): (
+                run_full_lcc_analysis(data, CONSTRUCTION_COSTS, wpi=wpi)
+            ),
+            repeat,
+        )
+        for hours in PEAK_HOURS
+    }
+
+    # Distinct projects (traffic varies) so deduplication does not kick in;
+    # in-process so the numbers measure the engine, not the pool.
+    sizes = PORTFOLIO_SIZES[:2] if quick else PORTFOLIO_SIZES
+    results["portfolio_size"] = {}
+    for size in sizes:
+        projects = [
+            (
+                _with(
+                    Input,
+                    ("traffic_and_road_data", "vehicle_data", "small_cars", "vehicles_per_day"),
+                    7000 + i,
+                ),
+                CONSTRUCTION_COSTS,
+                wpi,
+            )
+            for i in range(size)
+        ]
+        timing = measure(
+            lambda projects=projects: run_batch_lcc_analysis(projects, max_workers=1),
+            repeat=max(1, min(repeat, 3)),
+            number=1,
+        )
+        timing["per_project"] = timing["median"] / size
+        results["portfolio_size"][str(size)] = timing
+
+    return results
+
+
+def _sweep_inputs(points, seed=0):
+    """
+    Stage cost inputs of the detailed example, with rates, schedule and
+    construction costs swept over points random values.
+    """
+    import numpy as np
+
+    input_data, is_global, wpi_data = _normalise_inputs(Input, wpi)
+    ruc = _road_user_costs(input_data, is_global, wpi_data, False, None)
+    stage_params = _stage_params(input_data)
+    program_inputs = _program_inputs(CONSTRUCTION_COSTS, ruc)
+
+    rng = np.random.default_rng(seed)
+    general = dict(stage_params["general"])
+    general["discount_rate_percent"] = np.round(rng.uniform(0, 15, points), 2)
+    general["inflation_rate_percent"] = np.round(rng.uniform(0, 12, points), 2)
+    general["interest_rate_percent"] = np.round(rng.uniform(0, 12, points), 2)
+    general["service_life_years"] = rng.choice([20, 30, 50, 75, 100], points)
+    general["analysis_period_years"] = rng.choice([25, 50, 60, 100, 120], points)
+    costs = dict(program_inputs)
+    for key in VECTOR_COSTS:
+        costs[key] = program_inputs[key] * rng.uniform(0.5, 1.5, points)
+
+    scalar_points = []
+    for k in range(points):
+        point_general = {
+            key: value[k].item() if hasattr(value, "shape") else value
+            for key, value in general.items()
+        }
+        point_costs = {
+            key: value[k].item() if key in VECTOR_COSTS else value
+            for key, value in costs.items()
+        }
+        scalar_points.append((dict(stage_params, general=point_general), point_costs))
+    return dict(stage_params, general=general), costs, scalar_points
+
+
+def _scalar_stage_costs(points):
+    for stage_params, program_inputs in points:
+        calc = StageCostCalculator(stage_params, program_inputs)
+        calc.initial_cost_calculator()
+        calc.use_stage_cost_calculator()
+        calc.reconstruction()
+        calc.end_of_life_stage_costs()
+
+
+def _voc_geometries(count, seed=0):
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    lane_types, _ = CarriagewayStandards.list_types()
+    geometry = {
+        "rg_roughness_factor": np.round(rng.uniform(1000, 6000, count), 1),
+        "fl_fall_factor": np.round(rng.uniform(0, 20, count), 2),
+        "rs_rise_factor": np.round(rng.uniform(0, 20, count), 2),
+        "carriageway_width": np.round(rng.uniform(5.5, 25, count), 2),
+        "lane_type": rng.choice(lane_types, count),
+    }
+    traffic_inputs = []
+    for k in range(count):
+        traffic = copy.deepcopy(Input["traffic_and_road_data"])
+        traffic["additional_inputs"].update(
+            {
+                "road_roughness_mm_per_km": geometry["rg_roughness_factor"][k].item(),
+                "road_fall_m_per_km": geometry["fl_fall_factor"][k].item(),
+                "road_rise_m_per_km": geometry["rs_rise_factor"][k].item(),
+                "carriage_width_in_m": geometry["carriageway_width"][k].item(),
+                "alternate_road_carriageway": geometry["lane_type"][k].item(),
+            }
+        )
+        traffic_inputs.append(traffic)
+    return geometry, traffic_inputs
+
+
+def _route(segments, seed=0):
+    rng = random.Random(seed)
+    traffic = copy.deepcopy(Input["traffic_and_road_data"])
+    traffic["additional_inputs"]["segments"] = [
+        {
+            "length_km": round(rng.uniform(0.05, 3), 3),
+            "alternate_road_carriageway": rng.choice(["2L", "4L"]),
+            "carriage_width_in_m": round(rng.uniform(7, 25), 2),
+            "road_roughness_mm_per_km": round(rng.uniform(1000, 6000), 1),
+            "road_rise_m_per_km": round(rng.uniform(0, 20), 2),
+            "road_fall_m_per_km": round(rng.uniform(0, 20), 2),
+        }
+        for _ in range(segments)
+    ]
+    return traffic
+
+
+def _segment_by_segment(traffic):
+    with mock.patch.object(route, "_has_numpy", return_value=False):
+        voc_core.main(traffic, wpi)
+
+
+def bench_vectorized(repeat, quick=False):
+    """
+    Times the numpy paths against the scalar engine on the same work: a
+    stage cost parameter sweep, a batch of VOC geometries and a multi-segment
+    route. Empty when numpy is not installed. tests/ check that both paths
+    give identical results.
+    """
+    if importlib.util.find_spec("numpy") is None:
+        return {}
+
+    points = SWEEP_POINTS // 10 if quick else SWEEP_POINTS
+    slow_repeat = max(1, min(repeat, 3))
+    results = {}
+
+    params, costs, scalar_points = _sweep_inputs(points)
+    results["stage_cost_sweep"] = {
+        "points": points,
+        "vectorized": measure(
+            lambda: VectorizedStageCostCalculator(params, costs).summary(), repeat
+        ),
+        "scalar": measure(
+            lambda: _scalar_stage_costs(scalar_points), slow_repeat, number=1
+        ),
+    }
+
+    geometry, traffic_inputs = _voc_geometries(points)
+    results["voc_batch"] = {
+        "geometries": points,
+        "batch": measure(
+            lambda: compute_voc_batch(
+                wpi,
+                geometry["rg_roughness_factor"],
+                geometry["fl_fall_factor"],
+                geometry["rs_rise_factor"],
+                geometry["carriageway_width"],
+                geometry["lane_type"],
+                power_weight_ratio_pwr={
+                    vehicle: data["pwr"]
+                    for vehicle, data in Input["traffic_and_road_data"]["vehicle_data"].items()
+                    if "pwr" in data
+                },
+            ),
+            repeat,
+        ),
+        "scalar": measure(
+            lambda: [voc_core.main(traffic, wpi) for traffic in traffic_inputs],
+            slow_repeat,
+            number=1,
+        ),
+    }
+
+    long_route = _route(ROUTE_SEGMENTS)
+    results["route_voc"] = {
+        "segments": ROUTE_SEGMENTS,
+        "single_geometry": measure(
+            lambda: voc_core.main(Input["traffic_and_road_data"], wpi), repeat
+        ),
+        "vectorized": measure(lambda: voc_core.main(long_route, wpi), repeat),
+        "segment_by_segment": measure(
+            lambda: _segment_by_segment(long_route), slow_repeat, number=1
+        ),
+    }
+
+    return results
+
+
+def run(quick=False, repeat=None):
+    """
+    Runs the whole suite and returns the JSON-serialisable report.
+    """
+    repeat = repeat or (3 if quick else 7)
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "unit": "seconds",
+        "environment": _environment(),
+        "quick": quick,
+        "components": bench_components(repeat),
+        "scaling": bench_scaling(repeat, quick),
+        "vectorized": bench_vectorized(repeat, quick),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="3psLCCA engine benchmarks")
+    parser.add_argument("--output", "-o", help="Write the JSON report to this file.")
+    parser.add_argument(
+        "--quick", action="store_true", help="Fewer samples and smaller portfolios."
+    )
+    parser.add_argument("--repeat", type=int, help="Timed samples per case.")
+    args = parser.parse_args(argv)
+
+    report = run(quick=args.quick, repeat=args.repeat)
+    text = json.dumps(report, indent=2)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+3psLCCA import-time benchmark and guard
+---------------------------------------
+Measures the cold-start cost of a worker process (fresh interpreter, import
+the engine, run one global-mode project) and checks that a global-mode run
+does not import the Road User Cost engine.
+
+Run from the project root:
+
+    python benchmarks/bench_imports.py              # prints JSON, exits 1 on regression
+    python benchmarks/bench_imports.py --max-import-ms 150
+
+The guard fails if any module under FORBIDDEN_IN_GLOBAL_MODE is loaded by a
+global-mode run, or if the median import time exceeds --max-import-ms.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+
+# Modules a global-mode run must not load.
+FORBIDDEN_IN_GLOBAL_MODE = (
+    "three_ps_lcca_core.core.road_user_cost.main",
+    "three_ps_lcca_core.core.road_user_cost.vehicle_operation_cost.core",
+    "three_ps_lcca_core.core.road_user_cost.vehicle_operation_cost.utils.vocEngine",
+    "three_ps_lcca_core.core.road_user_cost.congestion",
+    "three_ps_lcca_core.core.road_user_cost.accident_cost",
+    "three_ps_lcca_core.core.road_user_cost.value_of_time",
+    "three_ps_lcca_core.core.road_user_cost.total_carbon_emission",
+)
+
+_PROBE = r"""
+import json, sys, time
+start = time.perf_counter()
+from three_ps_lcca_core.core.main import run_full_lcc_analysis
+imported = time.perf_counter()
+if {run!r}:
+    from examples.from_dict.Input_global import Input_global
+    run_full_lcc_analysis(Input_global, {{
+        "initial_construction_cost": 12843979.44,
+        "initial_carbon_emissions_cost": 2065434.91,
+        "superstructure_construction_cost": 9356038.92,
+        "total_scrap_value": 2164095.02,
+    }})
+done = time.perf_counter()
+print(json.dumps({{
+    "import_seconds": imported - start,
+    "first_run_seconds": done - imported,
+    "modules": sorted(m for m in sys.modules if m.startswith("three_ps_lcca_core")),
+}}))
+"""
+
+
+def _probe(run_global):
+    env = dict(os.environ, PYTHONPATH=SRC, PYTHONDONTWRITEBYTECODE="")
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(run=run_global)],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout)
+
+
+def run(samples=5):
+    """
+    Returns:
+        dict: Median import and first-run times (seconds), the modules loaded
+              by a global-mode run and the forbidden ones among them.
+    """
+    probes = [_probe(run_global=True) for _ in range(samples)]
+    modules = probes[-1]["modules"]
+    forbidden = [
+        m
+        for m in modules
+        if any(m == f or m.startswith(f + ".") for f in FORBIDDEN_IN_GLOBAL_MODE)
+    ]
+
+    return {
+        "unit": "seconds",
+        "samples": samples,
+        "import_seconds": statistics.median(p["import_seconds"] for p in probes),
+        "global_first_run_seconds": statistics.median(
+            p["first_run_seconds"] for p in probes
+        ),
+        "global_mode_module_count": len(modules),
+        "global_mode_modules": modules,
+        "forbidden_modules_loaded": forbidden,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="3psLCCA import-time guard")
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument(
+        "--max-import-ms",
+        type=float,
+        help="Fail if the median import time exceeds this many milliseconds.",
+    )
+    parser.add_argument("--output", "-o", help="Write the JSON report to this file.")
+    args = parser.parse_args(argv)
+
+    report = run(args.samples)
+
+    failures = []
+    if report["forbidden_modules_loaded"]:
+        failures.append(
+            "global-mode run imported: "
+            + ", ".join(report["forbidden_modules_loaded"])
+        )
+    if (
+        args.max_import_ms is not None
+        and report["import_seconds"] * 1000 > args.max_import_ms
+    ):
+        failures.append(
+            f"import took {report['import_seconds'] * 1000:.1f} ms "
+            f"(limit {args.max_import_ms} ms)"
+        )
+    report["failures"] = failures
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
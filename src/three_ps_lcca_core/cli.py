@@ -0,0 +1,258 @@
+"""
+3psLCCA command-line runner
+---------------------------
+Reads projects as JSON Lines and writes one result line per project:
+
+    three-ps-lcca projects.jsonl -o results.jsonl --errors errors.jsonl
+    cat projects.jsonl | three-ps-lcca --workers 8 --ordered --lean
+
+Each input line is an object with 'input_data', 'construction_costs' and,
+for detailed road user cost, 'wpi' (or pass --wpi for a shared index). An
+optional 'id' is copied to the output. Each output line is
+{"index", "id", "status", "seconds", "result"} on success or
+{"index", "id", "status": "error", "seconds", "error_type", "error"} on
+failure. A JSON summary with throughput and latency percentiles is printed
+to stderr at the end. The exit status is 1 if any project failed.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+
+def _evaluate_line(task):
+    """
+    Worker entry point: parses one JSONL line and runs it. Never raises.
+
+    Args:
+        task (tuple): (index, line, wpi, options).
+
+    Returns:
+        dict: Output record (see module docstring).
+    """
+    from .core.main import run_full_lcc_analysis
+
+    index, line, default_wpi, options = task
+    start = time.perf_counter()
+    record = {"index": index, "id": None}
+
+    try:
+        project = json.loads(line)
+        if not isinstance(project, dict):
+            raise TypeError("Each line must be a JSON object.")
+        record["id"] = project.get("id")
+        result = run_full_lcc_analysis(
+            project["input_data"],
+            project["construction_costs"],
+            wpi=project.get("wpi", default_wpi),
+            **options,
+        )
+    except KeyError as exc:
+        record.update(status="error", error_type="KeyError", error=f"missing field {exc}")
+    except Exception as exc:
+        record.update(status="error", error_type=type(exc).__name__, error=str(exc))
+    else:
+        record.update(status="ok", result=result)
+
+    record["seconds"] = time.perf_counter() - start
+    return record
+
+
+def _percentile(sorted_values, q):
+    """
+    Nearest-rank percentile of an ascending list; None when empty.
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _summary(latencies, failed, elapsed):
+    latencies = sorted(latencies)
+    n = len(latencies)
+    return {
+        "projects": n,
+        "succeeded": n - failed,
+        "failed": failed,
+        "elapsed_seconds": round(elapsed, 6),
+        "projects_per_second": round(n / elapsed, 3) if elapsed > 0 else None,
+        "latency_seconds": {
+            "p50": _percentile(latencies, 50),
+            "p90": _percentile(latencies, 90),
+            "p99": _percentile(latencies, 99),
+            "max": latencies[-1] if latencies else None,
+            "mean": sum(latencies) / n if n else None,
+        },
+    }
+
+
+def _lines(stream):
+    """
+    Yields the non-blank lines of stream, stripped.
+    """
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def run(
+    source,
+    sink,
+    errors=None,
+    workers=1,
+    max_in_flight=None,
+    ordered=False,
+    wpi=None,
+    options=None,
+):
+    """
+    Streams projects from source to sink.
+
+    At most max_in_flight projects are read but not yet written at any time
+    (including results held back for --ordered), so memory stays bounded
+    for arbitrarily long inputs.
+
+    Args:
+        source (iterable of str): JSONL lines.
+        sink (file): Receives one JSON line per project.
+        errors (file, optional): Additionally receives the failed records.
+        workers (int, optional): Worker processes; 1 runs in-process.
+        max_in_flight (int, optional): Defaults to 4 * workers.
+        ordered (bool, optional): Write results in input order instead of
+            completion order.
+        wpi (dict, optional): WPI for lines that do not carry one.
+        options (dict, optional): Keyword arguments of run_full_lcc_analysis.
+
+    Returns:
+        dict: Summary (counts, throughput and latency percentiles).
+    """
+    options = options or {}
+    max_in_flight = max_in_flight or 4 * workers
+    if workers < 1 or max_in_flight < 1:
+        raise ValueError("workers and max_in_flight must be >= 1.")
+
+    latencies = []
+    failed = 0
+    start = time.perf_counter()
+
+    def emit(record):
+        nonlocal failed
+        latencies.append(record["seconds"])
+        text = json.dumps(record)
+        sink.write(text + "\n")
+        if record["status"] == "error":
+            failed += 1
+            if errors is not None:
+                errors.write(text + "\n")
+
+    tasks = (
+        (index, line, wpi, options) for index, line in enumerate(_lines(source))
+    )
+
+    if workers == 1:
+        for task in tasks:
+            emit(_evaluate_line(task))
+        return _summary(latencies, failed, time.perf_counter() - start)
+
+    held = {}  # index -> record, waiting for earlier indexes (ordered mode)
+    next_index = 0
+    pending = set()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) + len(held) < max_in_flight:
+                task = next(tasks, None)
+                if task is None:
+                    exhausted = True
+                    break
+                pending.add(pool.submit(_evaluate_line, task))
+
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                record = future.result()
+                if not ordered:
+                    emit(record)
+                    continue
+                held[record["index"]] = record
+                while next_index in held:
+                    emit(held.pop(next_index))
+                    next_index += 1
+            sink.flush()
+
+    return _summary(latencies, failed, time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="three-ps-lcca",
+        description="Run life cycle cost analyses on JSON Lines projects.",
+    )
+    parser.add_argument(
+        "input", nargs="?", default="-", help="JSONL file of projects ('-' for stdin)."
+    )
+    parser.add_argument("--output", "-o", default="-", help="Results JSONL ('-' for stdout).")
+    parser.add_argument("--errors", help="Also write failed records to this JSONL file.")
+    parser.add_argument("--summary", help="Write the summary JSON here instead of stderr.")
+    parser.add_argument(
+        "--workers", "-j", type=int, default=os.cpu_count() or 1,
+        help="Worker processes (1 runs in-process).",
+    )
+    parser.add_argument(
+        "--max-in-flight", type=int,
+        help="Projects read but not yet written (default 4 * workers).",
+    )
+    parser.add_argument(
+        "--ordered", action="store_true", help="Write results in input order."
+    )
+    parser.add_argument("--wpi", help="JSON file with the WPI for lines without one.")
+    parser.add_argument(
+        "--lean", action="store_true", help="Return flat stage totals only."
+    )
+    args = parser.parse_args(argv)
+
+    wpi = None
+    if args.wpi:
+        with open(args.wpi, encoding="utf-8") as f:
+            wpi = json.load(f)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    errors = open(args.errors, "w", encoding="utf-8") if args.errors else None
+
+    try:
+        summary = run(
+            source,
+            sink,
+            errors=errors,
+            workers=args.workers,
+            max_in_flight=args.max_in_flight,
+            ordered=args.ordered,
+            wpi=wpi,
+            options={"lean": args.lean},
+        )
+    finally:
+        for stream in (source, sink, errors):
+            if stream is not None and stream not in (sys.stdin, sys.stdout):
+                stream.close()
+
+    text = json.dumps(summary, indent=2)
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text, file=sys.stderr)
+
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+import importlib
+
+# Public entry points, resolved lazily so that importing the package does not
+# pull in the Road User Cost engine (or anything else) until it is used.
+_LAZY_ATTRIBUTES = {
+    "run_full_lcc_analysis": ".main",
+    "get_IRC_standard_suggestions": ".main",
+    "run_batch_lcc_analysis": ".batch",
+    "compare_design_alternatives": ".compare",
+    "IncrementalStageCostCalculator": ".incremental",
+    "calculate_road_user_costs": ".road_user_cost.main",
+    "RUCCache": ".road_user_cost.cache",
+    "arun_full_lcc_analysis": ".aio",
+    "arun_batch_lcc_analysis": ".aio",
+    "LCCExecutor": ".aio",
+    "CheckpointStore": ".checkpoint",
+    "ResultAccumulator": ".accumulator",
+    "VectorizedStageCostCalculator": ".stage_cost.vectorized",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
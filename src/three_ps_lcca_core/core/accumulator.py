@@ -0,0 +1,190 @@
+import csv
+import math
+from array import array
+
+# Top-level result keys that are not cost figures.
+_SKIP_KEYS = ("warnings", "notes", "timings")
+
+_NUMPY_MISSING = (
+    "numpy is required for NumPy export. Install it with "
+    "'pip install three_ps_lcca_core[numpy]'."
+)
+
+
+def _leaves(data, prefix=""):
+    """
+    Yields (dotted path, float) for every numeric leaf of a result.
+    """
+    for key, value in data.items():
+        if not prefix and key in _SKIP_KEYS:
+            continue
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from _leaves(value, name + ".")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield name, value
+
+
+class ResultAccumulator:
+    """
+    Column store for many run_full_lcc_analysis results.
+
+    Every numeric leaf of a result becomes a column named by its dotted path
+    (e.g. 'use_stage.economic.periodic_maintenance'); lean records give
+    their flat keys. Each column is a contiguous array('d'), so 100k projects
+    cost 8 bytes per figure instead of a nested dict each. Columns that
+    appear later are back-filled with NaN, and figures missing from a result
+    are stored as NaN.
+
+    Example:
+        acc = ResultAccumulator()
+        for record in run_batch_lcc_analysis(projects)["results"]:
+            acc.add_record(record)
+        acc.to_csv("portfolio.csv")
+        acc.to_npz("portfolio.npz")
+    """
+
+    def __init__(self):
+        self._columns = {}  # dotted path -> array('d')
+        self._keys = []
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def columns(self):
+        """
+        Returns:
+            list: Column names in first-seen order.
+        """
+        return list(self._columns)
+
+    @property
+    def keys(self):
+        """
+        Returns:
+            list: Row keys (project ids / indexes) as passed to add().
+        """
+        return list(self._keys)
+
+    def column(self, name):
+        """
+        Returns:
+            array.array: The column (typecode 'd'); not a copy.
+        """
+        return self._columns[name]
+
+    def add(self, result, key=None):
+        """
+        Appends one result as a row.
+
+        Args:
+            result (dict): run_full_lcc_analysis result (full or lean).
+            key (any, optional): Row key, e.g. a project id.
+        """
+        row = self._size
+        columns = self._columns
+        for name, value in _leaves(result):
+            column = columns.get(name)
+            if column is None:
+                column = columns[name] = array("d", [math.nan]) * row
+            if len(column) == row:
+                column.append(value)
+
+        # Pad columns this result did not have.
+        for column in columns.values():
+            if len(column) == row:
+                column.append(math.nan)
+
+        self._keys.append(key)
+        self._size += 1
+
+    def add_record(self, record):
+        """
+        Appends a run_batch_lcc_analysis record keyed by its index. Failed
+        records are skipped.
+
+        Returns:
+            bool: True if a row was added.
+        """
+        if record.get("status") != "ok":
+            return False
+        self.add(record["result"], key=record.get("index"))
+        return True
+
+    def rows(self):
+        """
+        Yields (key, tuple of values) per row, in column order.
+        """
+        columns = list(self._columns.values())
+        for row, key in enumerate(self._keys):
+            yield key, tuple(column[row] for column in columns)
+
+    # --- Export ---
+
+    def to_csv(self, path_or_file):
+        """
+        Writes a CSV with a 'key' column followed by every result column.
+        Missing values are written as empty cells.
+        """
+        if isinstance(path_or_file, str):
+            with open(path_or_file, "w", encoding="utf-8", newline="") as f:
+                self._write_csv(f)
+        else:
+            self._write_csv(path_or_file)
+
+    def _write_csv(self, f):
+        writer = csv.writer(f)
+        writer.writerow(["key"] + self.columns)
+        for key, values in self.rows():
+            writer.writerow(
+                ["" if key is None else key]
+                + ["" if value != value else repr(value) for value in values]
+            )
+
+    def to_numpy(self):
+        """
+        Returns:
+            numpy.ndarray: (rows, columns) float64 matrix, columns ordered as
+            self.columns.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        np = _numpy()
+        if not self._columns:
+            return np.empty((self._size, 0))
+        return np.column_stack(
+            [np.frombuffer(column, dtype=np.float64) for column in self._columns.values()]
+        )
+
+    def to_npy(self, path):
+        """
+        Saves to_numpy() as a .npy file. Column names are self.columns.
+        """
+        _numpy().save(path, self.to_numpy())
+
+    def to_npz(self, path, compressed=False):
+        """
+        Saves one array per column (keyed by column name) plus '__keys__'
+        when row keys were given. Columns are written without copying.
+        """
+        np = _numpy()
+        arrays = {
+            name: np.frombuffer(column, dtype=np.float64)
+            for name, column in self._columns.items()
+        }
+        if any(key is not None for key in self._keys):
+            arrays["__keys__"] = np.asarray(
+                ["" if key is None else str(key) for key in self._keys]
+            )
+        (np.savez_compressed if compressed else np.savez)(path, **arrays)
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(_NUMPY_MISSING) from exc
+    return numpy
@@ -0,0 +1,240 @@
+import asyncio
+import contextvars
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .batch import _evaluate_project
+from .main import run_full_lcc_analysis
+
+
+async def _aiter_projects(projects):
+    """
+    Async iterator over a sync or async iterable of projects.
+    """
+    if hasattr(projects, "__aiter__"):
+        async for project in projects:
+            yield project
+    else:
+        for project in projects:
+            yield project
+
+
+class LCCExecutor:
+    """
+    Runs the engine from asyncio code without blocking the event loop.
+
+    Owns a thread or process pool and limits the number of analyses running
+    at once across every caller sharing the executor, so one gateway
+    process can serve many concurrent requests.
+
+    Example:
+        async with LCCExecutor(kind="process", max_workers=4) as engine:
+            result = await engine.run(input_data, construction_costs, wpi=wpi)
+
+            async for record in engine.stream(projects):
+                ...  # records arrive in completion order
+    """
+
+    def __init__(self, kind="thread", max_workers=None, max_concurrency=None, mp_context=None):
+        """
+        Args:
+            kind (str, optional): 'thread' or 'process'. Threads start
+                instantly and share caches (PWF, RUC memory tier) but the
+                engine holds the GIL; processes give CPU parallelism.
+            max_workers (int, optional): Pool size. Defaults to os.cpu_count().
+            max_concurrency (int, optional): Analyses submitted to the pool at
+                once. Defaults to max_workers.
+            mp_context (multiprocessing.context.BaseContext, optional): Start
+                method context for a process pool.
+
+        Raises:
+            ValueError: If kind is unknown or a limit is < 1.
+        """
+        if kind not in ("thread", "process"):
+            raise ValueError("kind must be 'thread' or 'process'.")
+        max_workers = max_workers or os.cpu_count() or 1
+        max_concurrency = max_concurrency or max_workers
+        if max_workers < 1 or max_concurrency < 1:
+            raise ValueError("max_workers and max_concurrency must be >= 1.")
+
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        if kind == "thread":
+            self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix="lcca")
+        else:
+            self._pool = ProcessPoolExecutor(max_workers, mp_context=mp_context)
+        self._semaphore = None
+
+    async def _submit(self, fn, *args, **kwargs):
+        """
+        Runs fn(*args, **kwargs) on the pool once a concurrency slot is free.
+
+        Cancelling the awaiting task releases the slot and cancels the pool
+        job if it has not started yet. A job that is already running is
+        left to finish in the background; its result is discarded.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        loop = asyncio.get_running_loop()
+        call = functools.partial(fn, *args, **kwargs)
+        if self.kind == "thread":
+            # Keep context variables (e.g. the active debug sink) visible in
+            # the worker thread, as asyncio.to_thread does.
+            call = functools.partial(contextvars.copy_context().run, call)
+
+        async with self._semaphore:
+            return await loop.run_in_executor(self._pool, call)
+
+    async def run(self, input_data, construction_costs, wpi=None, **options):
+        """
+        Awaitable run_full_lcc_analysis.
+
+        Args:
+            input_data, construction_costs, wpi: As for run_full_lcc_analysis.
+            **options: Keyword arguments of run_full_lcc_analysis (debug,
+                ruc_cache, lean, ...). With kind='process' they must be
+                picklable and a MemorySink is filled in the worker, not here.
+
+        Returns:
+            dict: The run_full_lcc_analysis result.
+
+        Raises:
+            Whatever run_full_lcc_analysis raises.
+        """
+        return await self._submit(
+            run_full_lcc_analysis, input_data, construction_costs, wpi=wpi, **options
+        )
+
+    async def stream(self, projects, with_traceback=True, **options):
+        """
+        Evaluates projects and yields one record per project as soon as it
+        finishes.
+
+        Projects are pulled from the iterable lazily, keeping at most
+        max_concurrency of them in flight, so an unbounded (async) source
+        is consumed with bounded memory.
+
+        Args:
+            projects (iterable | async iterable): (input_data,
+                construction_costs, wpi) triples.
+            with_traceback (bool, optional): Capture tracebacks of failures.
+            **options: Keyword arguments of run_full_lcc_analysis.
+
+        Yields:
+            dict: Records as produced by run_batch_lcc_analysis:
+                  {"index", "status": "ok", "result"} or
+                  {"index", "status": "error", "error_type", "error",
+                  "traceback"}, in completion order.
+        """
+        source = _aiter_projects(projects)
+        pending = set()
+        index = 0
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(pending) < self.max_concurrency:
+                    try:
+                        project = await anext(source)
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    task = (index, project, options, with_traceback)
+                    pending.add(asyncio.ensure_future(self._submit(_evaluate_project, task)))
+                    index += 1
+
+                if not pending:
+                    return
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield future.result()
+        finally:
+            # Consumer stopped early (break, aclose) or was cancelled.
+            for future in pending:
+                future.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def close(self, wait=True):
+        """
+        Shuts the pool down. Not-yet-started jobs are cancelled.
+        """
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    async def aclose(self):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+        return False
+
+
+async def arun_full_lcc_analysis(
+    input_data, construction_costs, wpi=None, executor=None, **options
+):
+    """
+    Async entry point. Runs run_full_lcc_analysis off the event loop.
+
+    Args:
+        input_data, construction_costs, wpi: As for run_full_lcc_analysis.
+        executor (LCCExecutor, optional): Shared executor. Defaults to the
+            event loop's default thread pool (no concurrency limit).
+        **options: Keyword arguments of run_full_lcc_analysis.
+
+    Returns:
+        dict: The run_full_lcc_analysis result.
+    """
+    if executor is not None:
+        return await executor.run(input_data, construction_costs, wpi=wpi, **options)
+    return await asyncio.to_thread(
+        run_full_lcc_analysis, input_data, construction_costs, wpi=wpi, **options
+    )
+
+
+async def arun_batch_lcc_analysis(
+    projects,
+    executor=None,
+    kind="thread",
+    max_workers=None,
+    max_concurrency=None,
+    **options,
+):
+    """
+    Async portfolio entry point. Yields per-project records in completion
+    order (see LCCExecutor.stream).
+
+    Args:
+        projects (iterable | async iterable): (input_data, construction_costs,
+            wpi) triples.
+        executor (LCCExecutor, optional): Shared executor. If omitted, one is
+            created from kind / max_workers / max_concurrency and shut down
+            when the stream ends.
+        kind, max_workers, max_concurrency: See LCCExecutor.
+        **options: Keyword arguments of run_full_lcc_analysis.
+
+    Yields:
+        dict: {"index", "status", "result" | "error_type", "error", ...}.
+
+    Example:
+        async for record in arun_batch_lcc_analysis(projects, max_concurrency=8):
+            await send(record)
+    """
+    owned = executor is None
+    if owned:
+        executor = LCCExecutor(kind, max_workers, max_concurrency)
+
+    try:
+        async for record in executor.stream(projects, **options):
+            yield record
+    finally:
+        if owned:
+            executor.close(wait=False)
@@ -0,0 +1,288 @@
+import copy
+import math
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from .main import run_full_lcc_analysis
+from .utils.canonical import input_digest
+from .utils.debug_sink import DirectorySink
+
+
+def _evaluate_project(task):
+    """
+    Worker entry point. Runs a single project and never raises: any exception
+    is captured into the returned record so one bad project cannot abort the
+    whole batch.
+
+    Args:
+        task (tuple): (index, project, options, with_traceback) where
+            project is an (input_data, construction_costs, wpi) triple and
+            options holds the keyword arguments of run_full_lcc_analysis.
+            With options['debug_dir'] set, debug dumps of the project go to
+            '<debug_dir>/<index>'.
+
+    Returns:
+        dict: Per-project record with 'index', 'status' and either 'result'
+              or 'error_type' / 'error' (and optionally 'traceback').
+    """
+    index, project, options, with_traceback = task
+
+    options = dict(options)
+    debug_dir = options.pop("debug_dir", None)
+    if debug_dir is not None and options.get("debug"):
+        options["debug_sink"] = DirectorySink(os.path.join(debug_dir, str(index)))
+
+    try:
+        input_data, construction_costs, wpi = project
+        result = run_full_lcc_analysis(
+            input_data, construction_costs, wpi=wpi, **options
+        )
+    except Exception as exc:
+        record = {
+            "index": index,
+            "status": "error",
+            "error_type": type(exc).__name__,
+            "error": str(exc),
+        }
+        if with_traceback:
+            record["traceback"] = traceback.format_exc()
+        return record
+
+    return {"index": index, "status": "ok", "result": result}
+
+
+def _default_chunksize(n_projects, workers):
+    # Roughly four chunks per worker keeps the pool balanced while amortising
+    # the pickling/IPC cost of small projects.
+    return max(1, math.ceil(n_projects / (workers * 4)))
+
+
+def _deduplicate(projects):
+    """
+    Groups projects by input_digest.
+
+    Returns:
+        tuple: (unique, owner) where unique is a list of (index, project)
+               pairs, one per distinct input, holding its first occurrence
+               as given, and owner[i] is the position in unique that
+               project i maps to.
+    """
+    unique = []
+    owner = []
+    seen = {}
+
+    for index, project in enumerate(projects):
+        try:
+            key = input_digest(*project)
+        except (TypeError, ValueError):
+            # Malformed or unhashable input: evaluate on its own so the
+            # error is reported against this project.
+            key = ("index", index)
+
+        if key not in seen:
+            seen[key] = len(unique)
+            unique.append((index, project))
+        owner.append(seen[key])
+
+    return unique, owner
+
+
+def _project_ids(projects, project_ids):
+    """
+    Checkpoint keys: the given ids, or the input_digest of each project
+    (None for a project that cannot be digested, which is never stored).
+    """
+    if project_ids is not None:
+        ids = [None if pid is None else str(pid) for pid in project_ids]
+        if len(ids) != len(projects):
+            raise ValueError("project_ids must have one id per project.")
+        return ids
+
+    ids = []
+    for project in projects:
+        try:
+            ids.append(input_digest(*project))
+        except (TypeError, ValueError):
+            ids.append(None)
+    return ids
+
+
+def run_batch_lcc_analysis(
+    projects,
+    max_workers=None,
+    chunksize=None,
+    throughput=False,
+    debug=False,
+    mp_context=None,
+    ruc_cache=None,
+    dedupe=True,
+    lean=False,
+    debug_dir=None,
+    checkpoint=None,
+    project_ids=None,
+):
+    """
+    Portfolio entry point. Runs run_full_lcc_analysis for many projects on a
+    process pool.
+
+    Args:
+        projects (iterable): (input_data, construction_costs, wpi) triples.
+            Each element accepts the same types as run_full_lcc_analysis.
+        max_workers (int, optional): Pool size. Defaults to os.cpu_count().
+            With max_workers=1 the batch runs in-process, without a pool.
+        chunksize (int, optional): Projects sent to a worker per round-trip.
+            Defaults to 1, or to an automatically sized value in throughput mode.
+        throughput (bool, optional): If True, debug dumps are disabled for every
+            project, tracebacks are not captured and chunksize is sized
+            automatically. Use this for large nightly runs.
+        debug (bool, optional): Passed to each run when throughput is False.
+        mp_context (multiprocessing.context.BaseContext, optional): Start method
+            context for the pool (e.g. multiprocessing.get_context("spawn")).
+        ruc_cache (RUCCache, optional): Road User Cost cache shared by all
+            projects. Give it a path so worker processes share the disk tier.
+        dedupe (bool, optional): If True (default), projects whose inputs are
+            identical up to key order (ints and floats are kept distinct)
+            are evaluated once, as given in its first occurrence, and the
+            result is copied to every duplicate (see core.utils.canonical).
+        lean (bool, optional): If True, each result is the flat stage-total
+            record of run_full_lcc_analysis(lean=True). Implies debug=False.
+        debug_dir (str, optional): With debug, write the dumps of project i
+            to '<debug_dir>/<i>' instead of the shared ./debug folder, so
+            parallel workers do not overwrite each other's files.
+        checkpoint (CheckpointStore, optional): Persists each successful
+            result (core.checkpoint) in periodic atomic commits. Projects
+            already in the checkpoint are not evaluated again, so an
+            interrupted batch resumes where it stopped. Failed projects are
+            not stored and are retried on resume.
+        project_ids (iterable of str, optional): Checkpoint key of each
+            project. Defaults to its input_digest. With dedupe, the result
+            of a distinct input is stored under the id of every project
+            that has it.
+
+    Returns:
+        dict: {
+            "results": per-project records in input order,
+            "summary": counts, distinct inputs, dedup ratio, projects
+                       restored from the checkpoint, worker count and
+                       elapsed time,
+        }
+        A record is {"index", "status": "ok", "result"} on success or
+        {"index", "status": "error", "error_type", "error", "traceback"} on
+        failure ('traceback' is omitted in throughput mode).
+    """
+    projects = list(projects)
+    n_projects = len(projects)
+
+    if dedupe:
+        unique, owner = _deduplicate(projects)
+    else:
+        unique, owner = list(enumerate(projects)), list(range(n_projects))
+    n_unique = len(unique)
+
+    workers = max_workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("max_workers must be >= 1.")
+    workers = min(workers, max(n_unique, 1))
+
+    if throughput or lean:
+        debug = False
+    if throughput:
+        with_traceback = False
+        if chunksize is None:
+            chunksize = _default_chunksize(n_unique, workers)
+    else:
+        with_traceback = True
+        if chunksize is None:
+            chunksize = 1
+
+    options = {
+        "debug": debug,
+        "ruc_cache": ruc_cache,
+        "lean": lean,
+        "debug_dir": debug_dir,
+    }
+
+    start = time.perf_counter()
+
+    # Distinct projects restored from the checkpoint are not evaluated again.
+    # A result is stored under the id of every project that shares it, and
+    # a distinct project is restored when any of its ids is stored.
+    results = [None] * n_unique
+    group_ids = None
+    if checkpoint is not None:
+        checkpoint.bind_options({"lean": lean})
+        ids = _project_ids(projects, project_ids)
+        group_ids = [[] for _ in range(n_unique)]
+        for index, position in enumerate(owner):
+            if ids[index] is not None and ids[index] not in group_ids[position]:
+                group_ids[position].append(ids[index])
+
+        restored = checkpoint.load(pid for pids in group_ids for pid in pids)
+        for position, (index, _) in enumerate(unique):
+            found = [pid for pid in group_ids[position] if pid in restored]
+            if not found:
+                continue
+            result = restored[found[0]]
+            results[position] = {"index": index, "status": "ok", "result": result}
+            for pid in group_ids[position]:
+                if pid not in restored:
+                    checkpoint.add(pid, result)
+    todo = [position for position, record in enumerate(results) if record is None]
+    n_restored = n_unique - len(todo)
+
+    tasks = (
+        (unique[position][0], unique[position][1], options, with_traceback)
+        for position in todo
+    )
+
+    def collect(records):
+        try:
+            for position, record in zip(todo, records):
+                results[position] = record
+                if checkpoint is not None and record["status"] == "ok":
+                    for project_id in group_ids[position]:
+                        checkpoint.add(project_id, record["result"])
+        finally:
+            if checkpoint is not None:
+                checkpoint.commit()
+
+    if workers == 1 or not todo:
+        collect(_evaluate_project(task) for task in tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+            # map() yields in submission order, which keeps results aligned
+            # with the input regardless of completion order.
+            collect(pool.map(_evaluate_project, tasks, chunksize=chunksize))
+
+    if n_unique != n_projects:
+        # Fan each distinct result back out to its duplicates.
+        evaluated = results
+        results = []
+        for index, position in enumerate(owner):
+            record = evaluated[position]
+            if record["index"] != index:
+                record = {**copy.deepcopy(record), "index": index}
+            results.append(record)
+
+    elapsed = time.perf_counter() - start
+    failed = sum(1 for r in results if r["status"] == "error")
+
+    return {
+        "results": results,
+        "summary": {
+            "projects": n_projects,
+            "succeeded": n_projects - failed,
+            "failed": failed,
+            "unique_projects": n_unique,
+            "restored_from_checkpoint": n_restored,
+            "dedup_ratio": (
+                round((n_projects - n_unique) / n_projects, 6) if n_projects else 0.0
+            ),
+            "workers": workers,
+            "chunksize": chunksize,
+            "throughput_mode": throughput,
+            "elapsed_seconds": round(elapsed, 6),
+        },
+    }
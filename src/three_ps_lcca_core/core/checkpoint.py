@@ -0,0 +1,199 @@
+import json
+import os
+import sqlite3
+import time
+
+from .utils.canonical import canonical_json, canonicalize
+from .utils.engine_version import engine_version
+
+FORMAT_VERSION = 1
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS meta (
+        key   TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS results (
+        project_id   TEXT PRIMARY KEY,
+        completed_at REAL NOT NULL,
+        result       TEXT NOT NULL
+    )
+    """,
+)
+
+
+class CheckpointStore:
+    """
+    SQLite checkpoint of a batch run: completed project ids and their
+    results.
+
+    Results are buffered in memory and written in one transaction every
+    commit_every results or commit_seconds seconds (and on commit() /
+    close()), so a crash loses at most one commit window and never leaves a
+    partially written batch of rows.
+
+    The store records the checkpoint format and the engine version (a
+    fingerprint of the engine sources). Opening a checkpoint written by
+    different engine code or with different run options raises ValueError
+    instead of silently mixing results.
+
+    Example:
+        with CheckpointStore("portfolio.ckpt") as checkpoint:
+            report = run_batch_lcc_analysis(projects, checkpoint=checkpoint)
+        # After a crash, the same call skips every committed project.
+    """
+
+    def __init__(self, path, commit_every=100, commit_seconds=5.0, reset=False):
+        """
+        Args:
+            path (str): SQLite file, created if missing.
+            commit_every (int, optional): Results per commit.
+            commit_seconds (float, optional): Maximum age of uncommitted
+                results.
+            reset (bool, optional): Discard an existing checkpoint instead of
+                rejecting it when its version does not match.
+
+        Raises:
+            ValueError: If a limit is < 1 / negative, or the existing
+                checkpoint belongs to another format or engine version.
+        """
+        if commit_every < 1 or commit_seconds < 0:
+            raise ValueError("commit_every must be >= 1 and commit_seconds >= 0.")
+
+        self.path = path
+        self.commit_every = commit_every
+        self.commit_seconds = commit_seconds
+
+        self._pending = []  # (project_id, completed_at, result json)
+        self._last_commit = time.monotonic()
+        self._conn = self._open(reset)
+
+    # --- Public API ---
+
+    def bind_options(self, options):
+        """
+        Records the run options that shape the results (e.g. lean) on first
+        use and checks them on resume.
+
+        Raises:
+            ValueError: If the checkpoint was written with other options.
+        """
+        text = canonical_json(canonicalize(options))
+        stored = self._meta("run_options")
+        if stored is None:
+            with self._conn:
+                self._set_meta("run_options", text)
+        elif stored != text:
+            raise ValueError(
+                f"Checkpoint {self.path!r} was written with run options {stored}, "
+                f"not {text}."
+            )
+
+    def load(self, project_ids):
+        """
+        Returns:
+            dict: {project_id: result} for the ids already completed.
+        """
+        ids = list(dict.fromkeys(pid for pid in project_ids if pid is not None))
+        found = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start : start + 500]
+            rows = self._conn.execute(
+                "SELECT project_id, result FROM results WHERE project_id IN (%s)"
+                % ",".join("?" * len(chunk)),
+                chunk,
+            )
+            for project_id, result in rows:
+                found[project_id] = json.loads(result)
+        return found
+
+    def add(self, project_id, result):
+        """
+        Buffers a completed project; commits when the window is full.
+        """
+        self._pending.append((project_id, time.time(), json.dumps(result)))
+        if (
+            len(self._pending) >= self.commit_every
+            or time.monotonic() - self._last_commit >= self.commit_seconds
+        ):
+            self.commit()
+
+    def commit(self):
+        """
+        Atomically writes every buffered result.
+        """
+        if self._pending:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO results (project_id, completed_at, result) "
+                    "VALUES (?, ?, ?)",
+                    self._pending,
+                )
+            self._pending = []
+        self._last_commit = time.monotonic()
+
+    def completed_ids(self):
+        """
+        Returns:
+            set: Ids of the committed projects.
+        """
+        return {row[0] for row in self._conn.execute("SELECT project_id FROM results")}
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self):
+        if self._conn is not None:
+            self.commit()
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    # --- Internals ---
+
+    def _open(self, reset):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        self._conn = conn
+
+        expected = {"format": str(FORMAT_VERSION), "engine": engine_version()}
+        with conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            stored = {key: self._meta(key) for key in expected}
+
+        if stored["format"] is not None and stored != expected and not reset:
+            conn.close()
+            raise ValueError(
+                f"Checkpoint {self.path!r} is stale: it was written by "
+                f"format {stored['format']} / engine {stored['engine']}, "
+                f"the current engine is format {expected['format']} / "
+                f"engine {expected['engine']}. Delete it or pass reset=True."
+            )
+
+        if stored != expected:
+            with conn:
+                conn.execute("DELETE FROM results")
+                conn.execute("DELETE FROM meta")
+                for key, value in expected.items():
+                    self._set_meta(key, value)
+        return conn
+
+    def _meta(self, key):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
@@ -0,0 +1,92 @@
+from .main import (
+    _normalise_inputs,
+    _validate,
+    _road_user_costs,
+    _stage_params,
+    _program_inputs,
+    _stage_results,
+)
+from .stage_cost.stage_cost import StageCostCalculator
+from .stage_cost.summary import summarize_stage_costs, PILLARS
+
+
+def compare_design_alternatives(input_data, alternatives, wpi=None):
+    """
+    Compares design alternatives (e.g. hot-rolled, cold-formed and built-up
+    sections) that share one project input and differ only in their
+    construction costs.
+
+    Validation, Road User Cost and every present worth factor are computed
+    once. Each alternative then only evaluates its construction,
+    superstructure and scrap dependent terms.
+
+    Args:
+        input_data (dict | InputMetaData | InputGlobalMetaData): Shared project input.
+        alternatives (dict | iterable): {name: construction_costs} or an
+            iterable of (name, construction_costs) pairs.
+        wpi (dict | WPIMetaData, optional): Wholesale price index. Required when
+            use_global_road_user_calculations is False.
+
+    Returns:
+        dict: {
+            "ranking": rows sorted by ascending total life cycle cost, each with
+                       'rank', 'alternative', per-pillar totals and 'total',
+            "results": {name: stage-wise results as from run_full_lcc_analysis},
+            "warnings": validation warnings,
+            "notes": validation info messages,
+        }
+
+    Raises:
+        TypeError: If input_data or wpi are of unexpected types.
+        ValueError: If input fails validation, no alternatives are given or
+            two alternatives have the same name.
+    """
+    if isinstance(alternatives, dict):
+        alternatives = alternatives.items()
+    alternatives = list(alternatives)
+    if not alternatives:
+        raise ValueError("At least one design alternative is required.")
+    names = set()
+    for name, _ in alternatives:
+        if name in names:
+            raise ValueError(f"Duplicate design alternative name: {name!r}.")
+        names.add(name)
+
+    # --- Shared work: normalisation, validation, RUC, stage parameters ---
+    input_data, is_global, wpi = _normalise_inputs(input_data, wpi)
+    validation_report = _validate(input_data, is_global, wpi)
+    ruc_results = _road_user_costs(input_data, is_global, wpi)
+    stage_params = _stage_params(input_data)
+
+    # --- Per-alternative work; present worth factors are shared ---
+    base_calc = None
+    results = {}
+    rows = []
+    for name, construction_costs in alternatives:
+        program_inputs = _program_inputs(construction_costs, ruc_results)
+        if base_calc is None:
+            base_calc = StageCostCalculator(stage_params, program_inputs)
+            stage_calc = base_calc
+        else:
+            stage_calc = base_calc.with_program_inputs(program_inputs)
+
+        results[name] = _stage_results(stage_calc, validation_report)
+
+        summary = summarize_stage_costs(results[name])
+        rows.append(
+            {
+                "alternative": name,
+                **{pillar: summary[pillar] for pillar in PILLARS},
+                "total": summary["total"],
+            }
+        )
+
+    rows.sort(key=lambda row: row["total"])
+    ranking = [{"rank": rank, **row} for rank, row in enumerate(rows, start=1)]
+
+    return {
+        "ranking": ranking,
+        "results": results,
+        "warnings": validation_report["warnings"],
+        "notes": validation_report["info"],
+    }
@@ -0,0 +1,393 @@
+import copy
+
+from .main import (
+    _normalise_inputs,
+    _validate,
+    _road_user_costs,
+    _stage_params,
+    _program_inputs,
+)
+from .stage_cost.stage_cost import StageCostCalculator
+from .stage_cost.utils.pwf_cache import cached_build_timeline as build_timeline
+
+# Input paths are tuples rooted at "input" (input_data), "costs"
+# (construction_costs) or "wpi".
+_GENERAL = ("input", "general_parameters")
+_STAGE = ("input", "maintenance_and_stage_parameters")
+_USE = _STAGE + ("use_stage_cost",)
+_END_OF_LIFE = _STAGE + ("end_of_life_stage_costs",)
+
+# Everything the present worth factors are discounted with.
+_PWF_BASE = tuple(
+    _GENERAL + (key,)
+    for key in (
+        "service_life_years",
+        "analysis_period_years",
+        "discount_rate_percent",
+        "inflation_rate_percent",
+        "construction_period_months",
+    )
+)
+
+# Everything _road_user_cost_and_carbon_emissions_cost reads besides daily RUC.
+_SOCIAL = tuple(
+    _GENERAL + (key,)
+    for key in (
+        "social_cost_of_carbon_per_mtco2e",
+        "currency_conversion",
+        "days_per_month",
+    )
+)
+
+_CONSTRUCTION = ("costs", "initial_construction_cost")
+_CARBON = ("costs", "initial_carbon_emissions_cost")
+
+# Interval path of every use-stage present worth factor node.
+_PWF_INTERVALS = {
+    "pwf.routine_inspection": _USE + ("routine", "inspection", "interval_in_years"),
+    "pwf.periodic_maintenance": _USE + ("routine", "maintenance", "interval_in_years"),
+    "pwf.major_inspection": _USE
+    + ("major", "inspection", "interval_for_repair_and_rehabitation_in_years"),
+    "pwf.major_repair": _USE
+    + ("major", "repair", "interval_for_repair_and_rehabitation_in_years"),
+    "pwf.replacement": _USE
+    + (
+        "replacement_costs_for_bearing_and_expansion_joint",
+        "interval_of_replacement_in_years",
+    ),
+}
+
+# Dependency graph, in topological order. Each node lists the input paths it
+# reads and the nodes it consumes; a change to any path that overlaps a read
+# path invalidates the node and, transitively, everything downstream of it.
+NODES = {
+    "validation": {
+        "reads": (("input",), ("wpi",)),
+        "after": (),
+    },
+    "ruc.daily": {
+        "reads": (
+            ("input", "traffic_and_road_data"),
+            ("input", "daily_road_user_cost_with_vehicular_emissions"),
+            _GENERAL + ("use_global_road_user_calculations",),
+            ("wpi",),
+        ),
+        "after": (),
+    },
+    **{
+        name: {"reads": _PWF_BASE + (interval,), "after": ()}
+        for name, interval in _PWF_INTERVALS.items()
+    },
+    "pwf.demolition": {
+        "reads": _PWF_BASE
+        + (
+            _END_OF_LIFE
+            + ("demolition_and_disposal", "duration_for_demolition_and_disposal_in_months"),
+        ),
+        "after": (),
+    },
+    "use_stage.routine_inspection": {
+        "reads": (_USE + ("routine", "inspection"), _CONSTRUCTION),
+        "after": ("pwf.routine_inspection",),
+    },
+    "use_stage.periodic_maintenance": {
+        "reads": (_USE + ("routine", "maintenance"), _CONSTRUCTION, _CARBON),
+        "after": ("pwf.periodic_maintenance",),
+    },
+    "use_stage.major_inspection": {
+        "reads": (_USE + ("major", "inspection"), _CONSTRUCTION),
+        "after": ("pwf.major_inspection",),
+    },
+    "use_stage.major_repair": {
+        "reads": (_USE + ("major", "repair"), _CONSTRUCTION, _CARBON) + _SOCIAL,
+        "after": ("pwf.major_repair", "ruc.daily"),
+    },
+    "use_stage.replacement": {
+        "reads": (
+            _USE + ("replacement_costs_for_bearing_and_expansion_joint",),
+            ("costs", "superstructure_construction_cost"),
+        )
+        + _SOCIAL,
+        "after": ("pwf.replacement", "ruc.daily"),
+    },
+    "initial_stage": {
+        "reads": (
+            _CONSTRUCTION,
+            _CARBON,
+            _GENERAL + ("construction_period_months",),
+            _GENERAL + ("interest_rate_percent",),
+            _GENERAL + ("investment_ratio",),
+        )
+        + _SOCIAL,
+        "after": ("ruc.daily",),
+    },
+    "use_stage": {
+        "reads": (),
+        "after": (
+            "use_stage.routine_inspection",
+            "use_stage.periodic_maintenance",
+            "use_stage.major_inspection",
+            "use_stage.major_repair",
+            "use_stage.replacement",
+        ),
+    },
+    "reconstruction": {
+        "reads": (
+            ("costs",),
+            _END_OF_LIFE,
+            _GENERAL + ("interest_rate_percent",),
+            _GENERAL + ("investment_ratio",),
+        )
+        + _PWF_BASE
+        + _SOCIAL,
+        "after": ("pwf.demolition", "ruc.daily"),
+    },
+    "end_of_life": {
+        "reads": (("costs",), _END_OF_LIFE) + _SOCIAL,
+        "after": ("pwf.demolition", "ruc.daily"),
+    },
+}
+
+
+def _flatten(changes, prefix):
+    """
+    Yields (path, value) for the leaves of a nested change dict. Lists are leaves.
+    """
+    for key, value in changes.items():
+        path = prefix + (key,)
+        if isinstance(value, dict) and value:
+            yield from _flatten(value, path)
+        else:
+            yield path, value
+
+
+_MISSING = object()
+
+
+def _assign(target, path, value):
+    """
+    Sets target[path] = value, creating intermediate dicts, and returns
+    (path, previous value or _MISSING) describing how to undo the edit.
+    """
+    for depth, key in enumerate(path[:-1]):
+        if not isinstance(target.get(key), dict):
+            # Undo must drop (or restore) the whole branch created here.
+            undo = (path[: depth + 1], target.get(key, _MISSING))
+            branch = value
+            for inner in reversed(path[depth + 1 :]):
+                branch = {inner: branch}
+            target[key] = copy.deepcopy(branch)
+            return undo
+        target = target[key]
+    previous = target.get(path[-1], _MISSING)
+    target[path[-1]] = copy.deepcopy(value)
+    return path, previous
+
+
+def _unassign(target, path, previous):
+    for key in path[:-1]:
+        target = target[key]
+    if previous is _MISSING:
+        del target[path[-1]]
+    else:
+        target[path[-1]] = previous
+
+
+def _copy_stage(stage):
+    return {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in stage.items()
+    }
+
+
+def _overlaps(path, prefix):
+    n = min(len(path), len(prefix))
+    return path[:n] == prefix[:n]
+
+
+class IncrementalStageCostCalculator:
+    """
+    Keeps the intermediate quantities of one project (validation, daily RUC,
+    present worth factors, use stage components and stage totals) as nodes of
+    a dependency graph, so that a what-if edit only recomputes what it
+    invalidates.
+
+    Example:
+        calc = IncrementalStageCostCalculator(input_data, construction_costs, wpi)
+        calc.results  # same as run_full_lcc_analysis(...)
+        calc.update({"general_parameters": {"discount_rate_percent": 7.5}})
+    """
+
+    def __init__(self, input_data, construction_costs, wpi=None):
+        """
+        Args:
+            input_data (dict | InputMetaData | InputGlobalMetaData): Project input.
+            construction_costs (dict): Initial construction costs.
+            wpi (dict | WPIMetaData, optional): Wholesale price index. Required when
+                use_global_road_user_calculations is False.
+
+        Raises:
+            TypeError: If input_data or wpi are of unexpected types.
+            ValueError: If input fails validation.
+        """
+        input_data, _, wpi = _normalise_inputs(input_data, wpi)
+
+        self._state = {
+            "input": copy.deepcopy(input_data),
+            "costs": dict(construction_costs),
+            "wpi": copy.deepcopy(wpi),
+        }
+        self._values = {}
+        self._evaluate(list(NODES))
+
+    @property
+    def results(self):
+        """
+        dict: Stage-wise LCC results, as returned by run_full_lcc_analysis.
+        """
+        return self._results()
+
+    def update(self, changes=None, construction_costs=None, wpi=None):
+        """
+        Applies an edit and recomputes only the invalidated nodes.
+
+        Args:
+            changes (dict, optional): Nested dict merged into input_data,
+                e.g. {"general_parameters": {"discount_rate_percent": 7.5}}.
+            construction_costs (dict, optional): Construction cost items to
+                replace, e.g. {"initial_construction_cost": 1.3e7}.
+            wpi (dict, optional): Nested dict merged into the WPI.
+
+        Returns:
+            dict: {
+                "results": stage-wise LCC results,
+                "recomputed": names of the recomputed nodes, in evaluation order,
+            }
+
+        Raises:
+            TypeError: If the edited input_data or wpi are of unexpected types.
+            ValueError: If the edited input fails validation. The calculator
+                keeps its previous state in that case.
+        """
+        edits = {"input": changes, "costs": construction_costs, "wpi": wpi}
+        edits = {root: edit for root, edit in edits.items() if edit}
+
+        leaves = [
+            leaf for root, edit in edits.items() for leaf in _flatten(edit, (root,))
+        ]
+        if not leaves:
+            return {"results": self._results(), "recomputed": []}
+
+        paths = [path for path, _ in leaves]
+        undo = []
+        for path, value in leaves:
+            if self._state[path[0]] is None:
+                self._state[path[0]] = {}
+                undo.append(((path[0],), None))
+            undo.append(_assign(self._state, path, value))
+
+        dirty = set()
+        for name, node in NODES.items():
+            if any(_overlaps(p, r) for p in paths for r in node["reads"]) or any(
+                dep in dirty for dep in node["after"]
+            ):
+                dirty.add(name)
+
+        recomputed = [name for name in NODES if name in dirty]
+        previous_values = dict(self._values)
+        try:
+            self._evaluate(recomputed, check_wpi="wpi" in edits)
+        except Exception:
+            for path, previous in reversed(undo):
+                _unassign(self._state, path, previous)
+            self._values = previous_values
+            raise
+
+        return {"results": self._results(), "recomputed": recomputed}
+
+    def _results(self):
+        validation_report = self._values["validation"]
+        return {
+            "initial_stage": _copy_stage(self._values["initial_stage"]),
+            "use_stage": _copy_stage(self._values["use_stage"]),
+            "reconstruction": _copy_stage(self._values["reconstruction"]),
+            "end_of_life": _copy_stage(self._values["end_of_life"]),
+            "warnings": list(validation_report["warnings"]),
+            "notes": list(validation_report["info"]),
+        }
+
+    def _evaluate(self, names, check_wpi=True):
+        calc = None
+        for name in names:
+            if name == "validation":
+                # The structural WPI check is only repeated when the WPI changed.
+                _, is_global, _ = _normalise_inputs(
+                    self._state["input"], self._state["wpi"] if check_wpi else None
+                )
+                self._is_global = is_global
+                self._values[name] = _validate(
+                    self._state["input"], is_global, self._state["wpi"]
+                )
+            elif name == "ruc.daily":
+                self._values[name] = _road_user_costs(
+                    self._state["input"], self._is_global, self._state["wpi"]
+                )
+            elif name.startswith("pwf."):
+                self._values[name] = self._present_worth_factor(name)
+            else:
+                if calc is None:
+                    calc = self._calculator()
+                self._values[name] = self._stage_node(calc, name)
+
+    def _present_worth_factor(self, name):
+        # Read from the same (process-wide cached) event timeline as
+        # StageCostCalculator.timeline, so seeded factors are identical.
+        timeline = build_timeline(_stage_params(self._state["input"]))
+
+        if name == "pwf.demolition":
+            values = {
+                "reconstruction_demolition": timeline.pwf("demolition"),
+                "final_demolition": timeline.pwf("final_demolition"),
+            }
+            return {"key": ("demolition_spwi",), "memo": {"values": values, "debug": None}}
+
+        kind = name[len("pwf."):]
+        return {"key": ("pwf", kind), "memo": {"value": timeline.pwf(kind), "debug": None}}
+
+    def _calculator(self):
+        """
+        A StageCostCalculator over the current state whose present worth
+        factor memo is seeded from the pwf.* nodes.
+        """
+        calc = StageCostCalculator(
+            _stage_params(self._state["input"]),
+            _program_inputs(self._state["costs"], self._values["ruc.daily"]),
+        )
+        for name in NODES:
+            if name.startswith("pwf."):
+                factor = self._values[name]
+                calc._pwf_memo[factor["key"]] = factor["memo"]
+        return calc
+
+    def _stage_node(self, calc, name):
+        if name == "use_stage.routine_inspection":
+            return calc._routine_inspection_costs()
+        if name == "use_stage.periodic_maintenance":
+            return calc._periodic_maintenance_and_carbon_costs()
+        if name == "use_stage.major_inspection":
+            return calc._major_inspection_costs()
+        if name == "use_stage.major_repair":
+            return calc._major_repair_cost_breakdown()
+        if name == "use_stage.replacement":
+            return calc._replacement_costs_for_bearing_and_expansion_joint()
+        if name == "use_stage":
+            return calc._use_stage_summary(
+                *(self._values[dep] for dep in NODES["use_stage"]["after"])
+            )
+        if name == "initial_stage":
+            return calc.initial_cost_calculator()
+        if name == "reconstruction":
+            return calc.reconstruction()
+        if name == "end_of_life":
+            return calc.end_of_life_stage_costs()
+        raise KeyError(f"Unknown node: {name}")
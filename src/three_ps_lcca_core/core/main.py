@@ -1,38 +1,36 @@
-from .road_user_cost.main import calculate_road_user_costs
 from .stage_cost.stage_cost import StageCostCalculator
+from .utils.debug_sink import use_debug_sink
 from .utils.dump_to_file import dump_to_file
 from .utils.list_suggestions import get_IRC_standard_suggestions
 from .utils.input_validator import ironclad_validator
+from .utils.instrumentation import NULL_INSTRUMENTATION, resolve_instrumentation
 from three_ps_lcca_core.inputs.input import InputMetaData
 from three_ps_lcca_core.inputs.input_global import InputGlobalMetaData
 from three_ps_lcca_core.inputs.wpi import WPIMetaData
 
 
-def run_full_lcc_analysis(input_data, construction_costs, wpi=None, debug=False):
-    """
-    Entry point for the OSDAG LCC module.
-    Validates input, coordinates Road User Cost (RUC) calculations, and
-    computes Life Cycle Stage Costs.
+def __getattr__(name):
+    # Kept importable from here for existing callers; loaded on first access.
+    if name == "calculate_road_user_costs":
+        from .road_user_cost.main import calculate_road_user_costs
+
+        return calculate_road_user_costs
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    Args:
-        input_data (dict | InputMetaData | InputGlobalMetaData): Project input.
-        construction_costs (dict): Initial construction costs.
-        wpi (dict | WPIMetaData, optional): Wholesale price index. Required when
-            use_global_road_user_calculations is False.
-        debug (bool, optional): If True, dumps intermediate inputs to JSON.
+
+def _normalise_inputs(input_data, wpi):
+    """
+    Normalises input_data and wpi to dicts and resolves the calculation mode.
 
     Returns:
-        dict: Stage-wise LCC results (initial, use, reconstruction, end-of-life).
+        tuple: (input_data dict, is_global bool, wpi dict or None)
 
     Raises:
         TypeError: If input_data or wpi are of unexpected types.
-        ValueError: If input fails validation or required fields are missing.
+        ValueError: If the structural (dataclass) validation fails.
     """
 
-    # --- 1. Load standard suggestions for validation ---
-    suggestions = get_IRC_standard_suggestions()
-
-    # --- 2. Normalise input_data to dict and resolve is_global ---
+    # --- Normalise input_data to dict and resolve is_global ---
     if isinstance(input_data, dict):
         gp = input_data.get("general_parameters")
         if gp is None:
@@ -58,7 +56,7 @@ def run_full_lcc_analysis(input_data, construction_costs, wpi=None, debug=False)
             "input_data must be a dict, InputMetaData, or InputGlobalMetaData."
         )
 
-    # --- 3. Normalise wpi to dict ---
+    # --- Normalise wpi to dict ---
     if isinstance(wpi, dict):
         WPIMetaData.from_dict(
             wpi
@@ -70,19 +68,18 @@ def run_full_lcc_analysis(input_data, construction_costs, wpi=None, debug=False)
     # wpi=None is valid: when is_global=True, eval_wpi=False so wpi is never inspected;
     # when is_global=False, eval_wpi=True and the validator will raise if wpi is required but absent.
 
-    # --- 3b. Dump all normalised inputs for debugging ---
-    if debug:
-        dump_to_file(
-            "A0_Core_Inputs.json",
-            {
-                "is_global": is_global,
-                "input_data": input_data,
-                "construction_costs": construction_costs,
-                "wpi": wpi,
-            },
-        )
+    return input_data, is_global, wpi
+
+
+def _validate(input_data, is_global, wpi):
+    """
+    Runs the ecosystem validator and raises on errors.
+
+    Returns:
+        dict: Validation report with 'errors', 'warnings' and 'info'.
+    """
+    suggestions = get_IRC_standard_suggestions()
 
-    # --- 4. Validate Input ---
     # eval_wpi=False when is_global is True — WPI is not needed and may not be provided
     validation_report = ironclad_validator(
         input_data, suggestions, wpi, eval_wpi=not is_global
@@ -93,24 +90,187 @@ def run_full_lcc_analysis(input_data, construction_costs, wpi=None, debug=False)
             f"Input validation failed with errors:\n{validation_report['errors']}"
         )
 
-    # --- 5. Calculate or fetch RUC ---
+    return validation_report
+
+
+def _road_user_costs(
+    input_data,
+    is_global,
+    wpi,
+    debug=False,
+    ruc_cache=None,
+    instrumentation=NULL_INSTRUMENTATION,
+):
+    """
+    Calculates the daily RUC block, or fetches it from input_data in global mode.
+    The cache is bypassed in debug mode so the RUC debug dumps are written.
+    """
     if is_global:
         # Use provided RUC from input_data
-        ruc_results = input_data.get(
-            "daily_road_user_cost_with_vehicular_emissions", {}
-        )
+        return input_data.get("daily_road_user_cost_with_vehicular_emissions", {})
 
-    else:
-        # Calculate RUC normally
-        traffic_data = input_data.get("traffic_and_road_data", {})
-        ruc_results = calculate_road_user_costs(traffic_data, wpi, debug)
+    # Calculate RUC normally
+    traffic_data = input_data.get("traffic_and_road_data", {})
+    if ruc_cache is not None and not debug:
+        return ruc_cache.get_or_compute(traffic_data, wpi, instrumentation)
+
+    # Deferred: the RUC engine (seven vehicle models, congestion, accident,
+    # VOT) is only imported by the first detailed-mode run.
+    from .road_user_cost.main import calculate_road_user_costs
 
-    # --- 6. Prepare Stage Cost Parameters ---
+    return calculate_road_user_costs(traffic_data, wpi, debug, instrumentation)
+
+
+def _stage_params(input_data):
+    """
+    Builds the StageCostCalculator parameter block from input_data.
+    """
     stage_params = input_data.get("maintenance_and_stage_parameters", {}).copy()
     stage_params["general"] = input_data.get("general_parameters", {})
+    return stage_params
+
+
+def _program_inputs(construction_costs, ruc_results):
+    """
+    Adds RUC results to construction costs. A new dict is returned so the
+    caller's dict is left untouched and can be reused across runs.
+    """
+    return {
+        **construction_costs,
+        "daily_road_user_cost_with_vehicular_emissions": ruc_results,
+    }
+
+
+def _stage_results(stage_calc, validation_report, instrumentation=NULL_INSTRUMENTATION):
+    """
+    Runs every stage of a StageCostCalculator and assembles the result dict.
+    """
+    span = instrumentation.span
+
+    with span("stage.initial_stage"):
+        initial_stage = stage_calc.initial_cost_calculator()
+    with span("stage.use_stage"):
+        use_stage = stage_calc.use_stage_cost_calculator()
+    with span("stage.reconstruction"):
+        reconstruction = stage_calc.reconstruction()
+    with span("stage.end_of_life"):
+        end_of_life = stage_calc.end_of_life_stage_costs()
+
+    return {
+        "initial_stage": initial_stage,
+        "use_stage": use_stage,
+        "reconstruction": reconstruction,
+        "end_of_life": end_of_life,
+        "warnings": validation_report["warnings"],
+        "notes": validation_report["info"],
+    }
 
-    # Add RUC results to construction costs
-    construction_costs["daily_road_user_cost_with_vehicular_emissions"] = ruc_results
+
+def run_full_lcc_analysis(
+    input_data,
+    construction_costs,
+    wpi=None,
+    debug=False,
+    ruc_cache=None,
+    instrumentation=None,
+    lean=False,
+    debug_sink=None,
+    cash_flow=False,
+):
+    """
+    Entry point for the OSDAG LCC module.
+    Validates input, coordinates Road User Cost (RUC) calculations, and
+    computes Life Cycle Stage Costs.
+
+    Args:
+        input_data (dict | InputMetaData | InputGlobalMetaData): Project input.
+        construction_costs (dict): Initial construction costs.
+        wpi (dict | WPIMetaData, optional): Wholesale price index. Required when
+            use_global_road_user_calculations is False.
+        debug (bool, optional): If True, dumps intermediate inputs to JSON.
+        ruc_cache (RUCCache, optional): Road User Cost cache
+            (core.road_user_cost.cache). Not used in debug mode.
+        instrumentation (bool | callable | Instrumentation, optional): Opt-in
+            component timing (core.utils.instrumentation). True collects
+            timings, a callable receives start/stop events.
+        lean (bool, optional): If True, return only the flat stage totals of
+            stage_cost.summary.summarize_stage_costs. No breakdown or debugger
+            structures are built. Cannot be combined with debug.
+        debug_sink (DebugSink, optional): Destination of the debug dumps
+            (core.utils.debug_sink: MemorySink, DirectorySink, NullSink).
+            Defaults to JSON files under ./debug. Only used with debug=True.
+        cash_flow (bool, optional): If True, add 'cash_flow': the year by
+            year undiscounted and discounted cash flow of every cost category
+            (stage_cost.cash_flow.CashFlowLedger.to_dict()).
+
+    Returns:
+        dict: Stage-wise LCC results (initial, use, reconstruction, end-of-life).
+              With lean=True, a flat {'<stage>_<pillar>', '<pillar>', 'total'}
+              record instead. With instrumentation, 'timings' maps component
+              names to the seconds spent in this run. With cash_flow, 'cash_flow' holds the ledger.
+
+    Raises:
+        TypeError: If input_data or wpi are of unexpected types.
+        ValueError: If input fails validation or required fields are missing,
+            or if lean and debug are both set.
+    """
+    if lean and debug:
+        raise ValueError("lean and debug cannot be combined.")
+
+    instrumentation = resolve_instrumentation(instrumentation)
+    # The instance may be shared between concurrent runs: record this run
+    # on its own and add it to the shared totals afterwards.
+    run_instrumentation = instrumentation.child()
+    try:
+        with use_debug_sink(debug_sink if debug else None):
+            return _run_full_lcc_analysis(
+                input_data,
+                construction_costs,
+                wpi,
+                debug,
+                ruc_cache,
+                run_instrumentation,
+                lean,
+                cash_flow,
+            )
+    finally:
+        instrumentation.merge(run_instrumentation)
+
+
+def _run_full_lcc_analysis(
+    input_data, construction_costs, wpi, debug, ruc_cache, instrumentation, lean, cash_flow
+):
+    span = instrumentation.span
+
+    # --- 1. Normalise input_data / wpi and resolve is_global ---
+    with span("normalise"):
+        input_data, is_global, wpi = _normalise_inputs(input_data, wpi)
+
+    # --- 1b. Dump all normalised inputs for debugging ---
+    if debug:
+        dump_to_file(
+            "A0_Core_Inputs.json",
+            {
+                "is_global": is_global,
+                "input_data": input_data,
+                "construction_costs": construction_costs,
+                "wpi": wpi,
+            },
+        )
+
+    # --- 2. Validate Input ---
+    with span("validation"):
+        validation_report = _validate(input_data, is_global, wpi)
+
+    # --- 3. Calculate or fetch RUC ---
+    with span("ruc"):
+        ruc_results = _road_user_costs(
+            input_data, is_global, wpi, debug, ruc_cache, instrumentation
+        )
+
+    # --- 4. Prepare Stage Cost Parameters ---
+    stage_params = _stage_params(input_data)
+    construction_costs = _program_inputs(construction_costs, ruc_results)
 
     if debug:
         dump_to_file(
@@ -119,14 +279,19 @@ def run_full_lcc_analysis(input_data, construction_costs, wpi=None, debug=False)
         )
         dump_to_file("A0_Validation_report.json", validation_report)
 
-    # --- 7. Initialize and Run LCC Calculations ---
+    # --- 5. Initialize and Run LCC Calculations ---
     stage_calc = StageCostCalculator(stage_params, construction_costs, debug)
+    if lean:
+        with span("stage.totals"):
+            results = stage_calc.stage_totals()
+    else:
+        results = _stage_results(stage_calc, validation_report, instrumentation)
 
-    return {
-        "initial_stage": stage_calc.initial_cost_calculator(),
-        "use_stage": stage_calc.use_stage_cost_calculator(),
-        "reconstruction": stage_calc.reconstruction(),
-        "end_of_life": stage_calc.end_of_life_stage_costs(),
-        "warnings": validation_report["warnings"],
-        "notes": validation_report["info"],
-    }
+    if cash_flow:
+        with span("cash_flow"):
+            results["cash_flow"] = stage_calc.cash_flow_ledger().to_dict()
+
+    if instrumentation.enabled:
+        results["timings"] = instrumentation.timings()
+
+    return results
@@ -1,17 +1,16 @@
-from .IRCSP302019Table8_Table9 import (
-    table8_Economic_Cost_for_Different_Type_of_Accidents,
-    table9_Economic_Cost_of_Quantum_of_Vehicle_Damage_due_to_Accidents
-)
 from ... import standard_keys as c
 from ...utils.dump_to_file import dump_to_file
+from ..unit_costs import prepare_unit_costs, raise_stored
 
 
-def accident_cost(traffic_input, wpi, debug=False):
+def accident_cost(traffic_input, wpi, debug=False, unit_costs=None):
     """
     Calculates total accident cost (INR/day)
     - Uses exposure-based accident calculation
     - Uses severity distribution for human cost
     - Uses vehicle accident % distribution for vehicle damage cost
+    - Reads the WPI-adjusted Table 8 / 9 costs from unit_costs
+      (unit_costs.prepare_unit_costs(wpi) when omitted)
     """
 
     # ------------------------------------------------------------------
@@ -37,7 +36,8 @@ def accident_cost(traffic_input, wpi, debug=False):
     # ------------------------------------------------------------------
     # 3. Human Cost Calculation
     # ------------------------------------------------------------------
-    human_cost_table = table8_Economic_Cost_for_Different_Type_of_Accidents()
+    if unit_costs is None:
+        unit_costs = prepare_unit_costs(wpi, use_cache=not debug)
     human_cost = 0
     calculated_severity_counts = {}
     human_breakdown = {}
@@ -46,9 +46,9 @@ def accident_cost(traffic_input, wpi, debug=False):
         severity_count = total_daily_accidents * weight / 100
         calculated_severity_counts[severity] = round(severity_count, 8)
 
-        base_cost = human_cost_table[severity]
-        wpi_factor = next(iter(wpi["WPI"].values()))[severity]
-        adjusted_cost = base_cost * wpi_factor
+        base_cost, wpi_factor, adjusted_cost = raise_stored(
+            unit_costs.human_cost[severity]
+        )
 
         total_sev_cost = severity_count * adjusted_cost
         human_cost += total_sev_cost
@@ -66,7 +66,6 @@ def accident_cost(traffic_input, wpi, debug=False):
     # ------------------------------------------------------------------
     # 4. Vehicle Damage Cost (using accident % distribution)
     # ------------------------------------------------------------------
-    damage_table = table9_Economic_Cost_of_Quantum_of_Vehicle_Damage_due_to_Accidents()
     vehicle_damage_cost = 0
     damage_breakdown = {}
 
@@ -82,9 +81,9 @@ def accident_cost(traffic_input, wpi, debug=False):
 
         veh_accident_count = total_daily_accidents * accident_pct / 100
 
-        base_dmg_cost = damage_table[lookup_key]
-        wpi_factor = wpi["WPI"][lookup_key]["property_damage"]
-        adj_dmg_cost = base_dmg_cost * wpi_factor
+        base_dmg_cost, wpi_factor, adj_dmg_cost = raise_stored(
+            unit_costs.property_damage[lookup_key]
+        )
 
         total_veh_dmg_cost = veh_accident_count * adj_dmg_cost
         vehicle_damage_cost += total_veh_dmg_cost
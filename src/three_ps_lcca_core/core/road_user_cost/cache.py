@@ -0,0 +1,257 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from ..utils.canonical import digest, wpi_vehicle_order
+from ..utils.engine_version import ruc_engine_version
+from ..utils.instrumentation import NULL_INSTRUMENTATION
+from .main import calculate_road_user_costs
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ruc_cache (
+    key         TEXT PRIMARY KEY,
+    engine      TEXT NOT NULL,
+    created_at  REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    value       TEXT NOT NULL
+)
+"""
+
+
+class RUCCache:
+    """
+    Two-tier cache for calculate_road_user_costs results: an in-process LRU
+    in front of an optional on-disk SQLite store.
+
+    Entries are addressed by a SHA-256 digest of the canonical traffic input,
+    the WPI and the RUC engine version (a fingerprint of the road_user_cost
+    sources, including the IRC tables). Editing the engine or its tables
+    therefore changes every key; stale rows are purged when the store is
+    opened.
+
+    The cache can be passed to worker processes: the SQLite connection is
+    reopened lazily in each process and the memory tier starts empty.
+    """
+
+    def __init__(
+        self,
+        path=None,
+        memory_size=256,
+        max_entries=100_000,
+        ttl_seconds=None,
+    ):
+        """
+        Args:
+            path (str, optional): SQLite file. If None, only the memory tier is used.
+            memory_size (int, optional): Maximum entries kept in memory.
+            max_entries (int, optional): Maximum rows kept on disk. The least
+                recently used rows are removed beyond this.
+            ttl_seconds (float, optional): Entries older than this are
+                treated as missing. None disables expiry.
+
+        Raises:
+            ValueError: If a size or the TTL is negative.
+        """
+        if memory_size < 0 or max_entries < 0:
+            raise ValueError("memory_size and max_entries must be >= 0.")
+        if ttl_seconds is not None and ttl_seconds < 0:
+            raise ValueError("ttl_seconds must be >= 0 or None.")
+
+        self.path = path
+        self.memory_size = memory_size
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()  # key -> (created_at, json text)
+        self._conn = None
+        self._stats = dict.fromkeys(
+            (
+                "memory_hits",
+                "disk_hits",
+                "misses",
+                "expired",
+                "memory_evictions",
+                "disk_evictions",
+            ),
+            0,
+        )
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        state["_conn"] = None
+        state["_memory"] = OrderedDict()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    # --- Keys ---
+
+    @staticmethod
+    def key(traffic_input, wpi) -> str:
+        """
+        Content address of a RUC computation. Includes the WPI vehicle order,
+        see wpi_vehicle_order.
+        """
+        return digest(
+            {
+                "engine": ruc_engine_version(),
+                "traffic": traffic_input,
+                "wpi": wpi,
+                "wpi_vehicle_order": wpi_vehicle_order(wpi),
+            }
+        )
+
+    # --- Public API ---
+
+    def get_or_compute(self, traffic_input, wpi, instrumentation=NULL_INSTRUMENTATION):
+        """
+        Returns the cached RUC result, computing and storing it on a miss.
+        Every call returns a fresh copy.
+        """
+        key = self.key(traffic_input, wpi)
+
+        text = self._lookup(key)
+        if text is not None:
+            return json.loads(text)
+
+        result = calculate_road_user_costs(
+            traffic_input, wpi, instrumentation=instrumentation
+        )
+        self._store(key, json.dumps(result))
+        return result
+
+    def clear(self) -> None:
+        """
+        Drops all entries from both tiers and resets the statistics.
+        """
+        with self._lock:
+            self._memory.clear()
+            for name in self._stats:
+                self._stats[name] = 0
+            conn = self._connection()
+            if conn is not None:
+                with conn:
+                    conn.execute("DELETE FROM ruc_cache")
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Hit/miss counters, tier sizes and limits.
+        """
+        with self._lock:
+            conn = self._connection()
+            disk_size = (
+                conn.execute("SELECT COUNT(*) FROM ruc_cache").fetchone()[0]
+                if conn is not None
+                else 0
+            )
+            return {
+                **self._stats,
+                "memory_size": len(self._memory),
+                "memory_maxsize": self.memory_size,
+                "disk_size": disk_size,
+                "disk_maxsize": self.max_entries if conn is not None else 0,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # --- Internals ---
+
+    def _expired(self, created_at, now):
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _connection(self):
+        if self.path is None:
+            return None
+        if self._conn is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            with conn:
+                conn.execute(_SCHEMA)
+                # Rows written by another engine version can never be hit again.
+                conn.execute(
+                    "DELETE FROM ruc_cache WHERE engine != ?", (ruc_engine_version(),)
+                )
+            self._conn = conn
+        return self._conn
+
+    def _remember(self, key, created_at, text):
+        if not self.memory_size:
+            return
+        self._memory[key] = (created_at, text)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+            self._stats["memory_evictions"] += 1
+
+    def _lookup(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[0], now):
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return entry[1]
+                del self._memory[key]
+                self._stats["expired"] += 1
+
+            conn = self._connection()
+            if conn is not None:
+                row = conn.execute(
+                    "SELECT created_at, value FROM ruc_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    created_at, text = row
+                    with conn:
+                        if self._expired(created_at, now):
+                            conn.execute("DELETE FROM ruc_cache WHERE key = ?", (key,))
+                            self._stats["expired"] += 1
+                        else:
+                            conn.execute(
+                                "UPDATE ruc_cache SET accessed_at = ? WHERE key = ?",
+                                (now, key),
+                            )
+                            self._remember(key, created_at, text)
+                            self._stats["disk_hits"] += 1
+                            return text
+
+            self._stats["misses"] += 1
+            return None
+
+    def _store(self, key, text):
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, text)
+
+            conn = self._connection()
+            if conn is None:
+                return
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO ruc_cache VALUES (?, ?, ?, ?, ?)",
+                    (key, ruc_engine_version(), now, now, text),
+                )
+                excess = (
+                    conn.execute("SELECT COUNT(*) FROM ruc_cache").fetchone()[0]
+                    - self.max_entries
+                )
+                if excess > 0:
+                    conn.execute(
+                        "DELETE FROM ruc_cache WHERE key IN ("
+                        "SELECT key FROM ruc_cache ORDER BY accessed_at LIMIT ?)",
+                        (excess,),
+                    )
+                    self._stats["disk_evictions"] += excess
@@ -109,14 +109,15 @@ def calculate_total_adjusted_costs(a, Traffic_Input, debug=False):
             )
             t_factors = cf.time_congestion_factors(lane_type, vc=state["vc_considered"])
 
-        state_result = {
-            "state": state["id"],
-            "v_c_calculated": round(state["vc_cal"], 4),
-            "v_c_considered": round(state["vc_considered"], 4),
-            "traffic_share": state["share"],
-            "free_flow_applied": (not state["is_peak"] and force_free_flow),
-            "vehicle_impacts": {},
-        }
+        if debug:
+            state_result = {
+                "state": state["id"],
+                "v_c_calculated": round(state["vc_cal"], 4),
+                "v_c_considered": round(state["vc_considered"], 4),
+                "traffic_share": state["share"],
+                "free_flow_applied": (not state["is_peak"] and force_free_flow),
+                "vehicle_impacts": {},
+            }
 
         for v_key in input_vehicles:
             formula_key = "buses" if v_key in ["o_buses", "d_buses"] else v_key
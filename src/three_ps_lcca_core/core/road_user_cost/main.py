@@ -4,13 +4,20 @@ from .value_of_time import main as value_of_time
 from .accident_cost import core as accident_cost
 from .total_carbon_emission import core as total_carbon_emission
 from .calculate_total_ruc_per_day import calculate_total_ruc_per_day
+from .unit_costs import prepare_unit_costs
 from ..utils.dump_to_file import dump_to_file
+from ..utils.instrumentation import NULL_INSTRUMENTATION
 
 
-def calculate_road_user_costs(traffic_input, wpi, debug=False):
+def calculate_road_user_costs(
+    traffic_input, wpi, debug=False, instrumentation=NULL_INSTRUMENTATION
+):
     """
     Coordinator for Road User Cost (RUC).
     Optimized to return only the final, congestion-adjusted VOC.
+    Each sub-calculator runs inside an instrumentation span ('ruc.accident',
+    'ruc.voc', 'ruc.congestion', 'ruc.value_of_time', 'ruc.carbon',
+    'ruc.total').
     """
     # Get additional reroute distance in km
     additional_rerouting_distance_km = traffic_input["additional_inputs"]["additional_reroute_distance_km"]
@@ -47,25 +54,36 @@ def calculate_road_user_costs(traffic_input, wpi, debug=False):
             "total_daily_ruc": 0.0
         }
 
+    span = instrumentation.span
+
+    # WPI-adjusted unit costs, shared by projects with the same WPI block
+    # (rebuilt in debug mode so the dumps show the WPI values as given)
+    unit_costs = prepare_unit_costs(wpi, use_cache=not debug)
+
     # 1. Accident Cost
-    ac = accident_cost.accident_cost(traffic_input, wpi, debug)
+    with span("ruc.accident"):
+        ac = accident_cost.accident_cost(traffic_input, wpi, debug, unit_costs)
 
     # 2. Base VOC Calculation (Internal)
     # We need voc_raw to get the Rs/km per vehicle type based on road geometry
-    voc_raw, _ = VOC.main(traffic_input, wpi, debug)
+    with span("ruc.voc"):
+        voc_raw, _ = VOC.main(traffic_input, wpi, debug, unit_costs)
 
     # 3. Final VOC (Congestion Adjusted)
     # This is your true Vehicle Operating Cost including temporal traffic impacts
-    voc_final = congestion.calculate_total_adjusted_costs(
-        voc_raw, traffic_input, debug)
+    with span("ruc.congestion"):
+        voc_final = congestion.calculate_total_adjusted_costs(
+            voc_raw, traffic_input, debug)
 
     # 4. Value of Time (VOT)
-    vot = value_of_time.calculate_additional_time_cost(
-        traffic_input, wpi, debug)
+    with span("ruc.value_of_time"):
+        vot = value_of_time.calculate_additional_time_cost(
+            traffic_input, wpi, debug, unit_costs)
 
     # 5. Total Carbon Emission
-    tce = total_carbon_emission.calculate_total_carbon_emission(
-        traffic_input["vehicle_data"], additional_rerouting_distance_km, debug)
+    with span("ruc.carbon"):
+        tce = total_carbon_emission.calculate_total_carbon_emission(
+            traffic_input["vehicle_data"], additional_rerouting_distance_km, debug)
 
     result = {
         "accident_cost": ac,
@@ -73,4 +91,5 @@ def calculate_road_user_costs(traffic_input, wpi, debug=False):
         "value_of_time": vot,
         "total_carbon_emission": tce
     }
-    return calculate_total_ruc_per_day(result, additional_rerouting_distance_km)
\ No newline at end of file
+    with span("ruc.total"):
+        return calculate_total_ruc_per_day(result, additional_rerouting_distance_km)
\ No newline at end of file
@@ -0,0 +1,181 @@
+from typing import Any, Dict, NamedTuple, Optional
+
+from .. import standard_keys as c
+from ..utils.lru_cache import LRUCache
+from .accident_cost.IRCSP302019Table8_Table9 import (
+    table8_Economic_Cost_for_Different_Type_of_Accidents,
+    table9_Economic_Cost_of_Quantum_of_Vehicle_Damage_due_to_Accidents,
+)
+from .value_of_time import IRCSP302019Table6_Table7 as table6_7
+from .vehicle_operation_cost.utils.c_wpi_adjustment import compile_multipliers
+
+DEFAULT_MAXSIZE = 64
+
+# Velocity classes of IRC Table 6 / 7 (CarriagewayStandards.get_velocity_class).
+LANE_CLASSES = (c.SL, c.IL, c.L2, c.L4, c.L6, c.L8, c.EW)
+
+
+class UnitCosts(NamedTuple):
+    """
+    IRC unit costs adjusted by one WPI block. Shared between projects, so
+    read-only. An entry whose WPI factor is missing or unusable holds the
+    lookup error instead; consumers raise it (see raise_stored) only when
+    they use that entry.
+    """
+
+    # compile_multipliers(WPI): one tuple of VOC multipliers per vehicle.
+    voc: tuple
+    # lane class -> vehicle -> (base VOT, vot_cost factor, adjusted VOT).
+    value_of_time: Dict[str, Dict[str, Any]]
+    # severity -> (Table 8 cost, factor, adjusted cost).
+    human_cost: Dict[str, Any]
+    # vehicle -> (Table 9 damage cost, property_damage factor, adjusted cost).
+    property_damage: Dict[str, Any]
+
+
+def raise_stored(entry):
+    """
+    Returns a UnitCosts entry, re-raising it if it is a stored lookup error.
+    """
+    if isinstance(entry, Exception):
+        raise type(entry)(*entry.args)
+    return entry
+
+
+def _adjusted(base, factor):
+    try:
+        return (base, factor, base * factor)
+    except Exception as exc:
+        return exc
+
+
+def _value_of_time(block):
+    tables = {}
+    for lane in LANE_CLASSES:
+        table = tables[lane] = {}
+        for vehicle, base_vot in table6_7.valueofTravelTime(lane).items():
+            try:
+                factor = block.get(vehicle, {}).get("vot_cost")
+            except Exception as exc:
+                table[vehicle] = exc
+                continue
+            table[vehicle] = (
+                _adjusted(base_vot, factor)
+                if factor is not None
+                else ValueError(f"Missing WPI factor for vehicle type: '{vehicle}'")
+            )
+    return tables
+
+
+def _human_cost(block):
+    try:
+        factors = next(iter(block.values()))
+    except Exception as exc:
+        factors = exc
+    table = {}
+    for severity, base_cost in table8_Economic_Cost_for_Different_Type_of_Accidents().items():
+        try:
+            table[severity] = _adjusted(base_cost, raise_stored(factors)[severity])
+        except Exception as exc:
+            table[severity] = exc
+    return table
+
+
+def _property_damage(block):
+    table = {}
+    for vehicle, base_cost in (
+        table9_Economic_Cost_of_Quantum_of_Vehicle_Damage_due_to_Accidents().items()
+    ):
+        try:
+            table[vehicle] = _adjusted(base_cost, block[vehicle]["property_damage"])
+        except Exception as exc:
+            table[vehicle] = exc
+    return table
+
+
+def build_unit_costs(block: Dict[str, Any]) -> UnitCosts:
+    """
+    Applies a WPI block ({vehicle: {cost_key: value}}) to IRC Table C.1,
+    Tables 6 / 7 and Tables 8 / 9.
+
+    The VOC entry stays a table of multipliers: Table C.1 prices are first
+    combined with the geometry dependent consumption, and multiplying them by
+    the WPI factor beforehand would change the rounding of every result.
+    """
+    return UnitCosts(
+        voc=compile_multipliers(block),
+        value_of_time=_value_of_time(block),
+        human_cost=_human_cost(block),
+        property_damage=_property_damage(block),
+    )
+
+
+class _WPIKey(tuple):
+    """
+    Tuple that hashes its items once; a cache lookup hashes the key several
+    times and a WPI block has over a hundred values.
+    """
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = tuple.__hash__(self)
+            return self._hash
+
+
+def wpi_key(block: Dict[str, Any]) -> Optional[tuple]:
+    """
+    Cache key of a WPI block: every (vehicle, cost_key, value) in insertion
+    order. Order matters, accident human cost uses the first vehicle's
+    factors. Equal values of different types (1 and 1.0) share a key; they
+    only differ in the factors shown by debug dumps, which bypass the cache.
+
+    Returns:
+        tuple | None: None if the block is not a dict of dicts.
+    """
+    try:
+        return _WPIKey((vehicle, tuple(values.items())) for vehicle, values in block.items())
+    except AttributeError:
+        return None
+
+
+# Process-wide cache; most projects of one year share their WPI block. Each
+# worker process of a batch run holds its own copy.
+_cache = LRUCache(DEFAULT_MAXSIZE)
+
+
+def prepare_unit_costs(wpi: Dict[str, Any], use_cache: bool = True) -> UnitCosts:
+    """
+    Memoised build_unit_costs(wpi['WPI']), keyed by wpi_key. The tables are
+    shared, not copied.
+
+    Args:
+        wpi (dict): WPI data ({'WPI': {vehicle: {cost_key: value}}}).
+        use_cache (bool, optional): False builds fresh tables (debug runs).
+
+    Returns:
+        UnitCosts: Adjusted unit costs.
+
+    Raises:
+        KeyError: If the root 'WPI' key is missing.
+    """
+    block = wpi["WPI"]
+    key = wpi_key(block) if use_cache else None
+    if key is None:
+        return build_unit_costs(block)
+    return _cache.get_or_compute(key, lambda: build_unit_costs(block), copy_value=False)
+
+
+def unit_cost_cache_stats() -> dict:
+    """
+    Hit/miss/eviction statistics of the process-wide cache. See LRUCache.stats.
+    """
+    return _cache.stats()
+
+
+def clear_unit_cost_cache() -> None:
+    """
+    Empties the process-wide cache and resets its statistics.
+    """
+    _cache.clear()
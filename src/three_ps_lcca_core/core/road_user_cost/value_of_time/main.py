@@ -1,12 +1,16 @@
 from . import IRCSP302019Table6_Table7 as IRC
 from ...utils.dump_to_file import dump_to_file
 from ..carriage_width_info.carriagewayStandards import CarriagewayStandards
+from ..unit_costs import prepare_unit_costs, raise_stored
 
 
-def calculate_additional_time_cost(traffic_input, wpi, debug=False):
+def calculate_additional_time_cost(traffic_input, wpi, debug=False, unit_costs=None):
     """
     Calculate additional travel time cost (Rs./day) using ADTD.
 
+    unit_costs (UnitCosts, optional): WPI-adjusted tables of wpi, as given by
+    unit_costs.prepare_unit_costs (used when omitted).
+
     If debug=True:
         - Saves a detailed JSON in /debug folder
         - Returns detailed breakdown
@@ -21,13 +25,14 @@ def calculate_additional_time_cost(traffic_input, wpi, debug=False):
     additional_travel_time_min = traffic_input['additional_inputs']['additional_travel_time_min']
     additional_hours = additional_travel_time_min / 60  # convert minutes to hours
 
-    # Set up travel time and occupancy values
-    travel_time_values = IRC.valueofTravelTime(CarriagewayStandards.get_velocity_class(
-        traffic_input["additional_inputs"]["alternate_road_carriageway"]))
+    # Set up WPI-adjusted travel time and occupancy values
+    lane_class = CarriagewayStandards.get_velocity_class(
+        traffic_input["additional_inputs"]["alternate_road_carriageway"])
+    if unit_costs is None:
+        unit_costs = prepare_unit_costs(wpi, use_cache=not debug)
+    travel_time_values = unit_costs.value_of_time[lane_class]
     occupancy = IRC.average_occupancy()
 
-    wpi_block = wpi["WPI"]
-
     total_cost = 0
     breakdown = {}
 
@@ -38,16 +43,10 @@ def calculate_additional_time_cost(traffic_input, wpi, debug=False):
 
         # Extract vehicle-specific data
         count = vehicle_info["vehicles_per_day"]
-        base_vot = travel_time_values[vehicle]  # Rs./hour
         persons = occupancy.get(vehicle, 1)     # persons/vehicle
 
-        # Adjust based on WPI factor
-        wpi_factor = wpi_block.get(vehicle, {}).get("vot_cost")
-        if wpi_factor is None:
-            raise ValueError(
-                f"Missing WPI factor for vehicle type: '{vehicle}'")
-
-        adjusted_vot = base_vot * wpi_factor  # Rs./hour
+        # Base VOT (Rs./hour), its WPI factor and the adjusted VOT (Rs./hour)
+        base_vot, wpi_factor, adjusted_vot = raise_stored(travel_time_values[vehicle])
         cost = adjusted_vot * additional_hours * persons * count
 
         total_cost += cost
@@ -0,0 +1,162 @@
+import itertools
+import math
+from typing import Any, Dict, Iterable, Optional
+
+from ..carriage_width_info.carriagewayStandards import CarriagewayStandards
+from .utils import IRCSP302019TableC1
+from .utils import vocCoefficients as table
+from .utils import vocEngine
+from .utils.c_wpi_adjustment import VOCPostProcessor
+from .utils.constants import vehicle_type_list
+from .utils.vocOutputBuilder import build_voc_output
+from ... import standard_keys as c
+
+_NUMPY_MISSING = (
+    "numpy is required for compute_voc_batch. Install it with "
+    "'pip install three_ps_lcca_core[numpy]'."
+)
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(_NUMPY_MISSING) from exc
+    return numpy
+
+
+def _elementwise(function):
+    """
+    Applies a math function element by element with Python floats. numpy's
+    exp and power can differ from math.exp and ** in the last bit.
+    """
+
+    def apply(x, *args):
+        np = _numpy()
+        x = np.asarray(x, dtype=float)
+        values = x.ravel().tolist()
+        results = map(function, values, *(itertools.repeat(arg, len(values)) for arg in args))
+        return np.fromiter(results, dtype=float, count=len(values)).reshape(x.shape)
+
+    return apply
+
+
+_EXP = _elementwise(math.exp)
+_POW = _elementwise(pow)
+
+
+def _program(vehicle, lane):
+    # Cached by vocEngine under these element-wise exp / pow.
+    return vocEngine.get_program(vehicle, lane, exp=_EXP, pow=_POW)
+
+
+def compute_voc_batch(
+    wpi: Dict[str, Any],
+    rg_roughness_factor,
+    fl_fall_factor,
+    rs_rise_factor,
+    carriageway_width,
+    lane_type,
+    power_weight_ratio_pwr: Optional[Dict[str, Any]] = None,
+    rf_rise_and_fall_factor=None,
+    vehicle_types: Optional[Iterable[str]] = None,
+    multipliers: Optional[tuple] = None,
+) -> Dict[str, Any]:
+    """
+    Vehicle operating costs of many road geometries at once.
+
+    Every geometry input may be a scalar or an array; they are broadcast
+    together, and element [k] of every result is what core.main's model
+    execution and post_process give for geometry k. Geometries are grouped by
+    lane class and each (vehicle, lane) program of the coefficient table runs
+    once per group on arrays.
+
+    Args:
+        wpi (dict): WPI data ({'WPI': {vehicle: {cost_key: multiplier}}}).
+        rg_roughness_factor (float | array): Roughness in mm/km.
+        fl_fall_factor (float | array): Fall in m/km.
+        rs_rise_factor (float | array): Rise in m/km.
+        carriageway_width (float | array): Carriageway width in m.
+        lane_type (str | array): Carriageway type codes (e.g. '2L', 'EW4').
+        power_weight_ratio_pwr (dict, optional): {vehicle type: scalar or
+            array}, required for HCV and MCV.
+        rf_rise_and_fall_factor (float | array, optional): Defaults to
+            fl_fall_factor + rs_rise_factor.
+        vehicle_types (iterable, optional): Vehicle types to evaluate.
+            Defaults to every vehicle type.
+        multipliers (tuple, optional): compile_multipliers(wpi['WPI']), e.g.
+            from the cached road_user_cost.unit_costs tables.
+
+    Returns:
+        dict: {'distanceCost': {vehicle: {'IT': array, 'ET': array}, 'units'},
+               'timeCost': {...}}, the layout of post_process. Where the
+              tyre life model gives 0 (the scalar engine raises
+              ZeroDivisionError) the tyre cost is inf.
+
+    Raises:
+        ImportError: If numpy is not installed.
+        ValueError: If the inputs cannot be broadcast together, a lane type
+            or vehicle type is unknown, or pwr is missing where required.
+    """
+    np = _numpy()
+    pwr = dict(power_weight_ratio_pwr or {})
+    vehicle_types = list(vehicle_type_list if vehicle_types is None else vehicle_types)
+
+    for vt in vehicle_types:
+        if vt not in table.MODELS:
+            raise ValueError(f"No model available for '{vt}'.")
+        if vt in vocEngine.PWR_VEHICLES and pwr.get(vt) is None:
+            raise ValueError(f"Power to weight ratio (pwr) must be provided for '{vt}'.")
+
+    if rf_rise_and_fall_factor is None:
+        rf_rise_and_fall_factor = np.add(fl_fall_factor, rs_rise_factor)
+    inputs = [rf_rise_and_fall_factor, rg_roughness_factor, carriageway_width,
+              rs_rise_factor, fl_fall_factor]
+    pwr_types = [vt for vt in vehicle_types if pwr.get(vt) is not None]
+    try:
+        arrays = np.broadcast_arrays(
+            *(np.asarray(value, dtype=float) for value in inputs),
+            *(np.asarray(pwr[vt], dtype=float) for vt in pwr_types),
+            np.asarray(lane_type),
+        )
+    except ValueError as exc:
+        raise ValueError(f"VOC batch inputs cannot be broadcast together: {exc}") from exc
+
+    shape = arrays[0].shape
+    RF, RG, W, RS, FL = (array.reshape(-1) for array in arrays[:5])
+    pwr = {vt: array.reshape(-1) for vt, array in zip(pwr_types, arrays[5:-1])}
+    lanes = arrays[-1].reshape(-1)
+    features = (RF, RG, RG - 2000, W, RS, FL, RG / W)
+
+    # Lane class of every geometry, and the geometries of each class.
+    available_types, _ = CarriagewayStandards.list_types()
+    codes, inverse = np.unique(lanes, return_inverse=True)
+    classes = []
+    for code in codes.tolist():
+        if code not in available_types:
+            raise ValueError(f"lane_type '{code}' is invalid. Allowed: {available_types}")
+        classes.append(CarriagewayStandards.get_velocity_class(code))
+    lane_classes = np.asarray(classes)[inverse.reshape(-1)]
+    groups = {lane: np.nonzero(lane_classes == lane)[0] for lane in dict.fromkeys(classes)}
+
+    n = lanes.size
+    voc_data = {}
+    for vt in vehicle_types:
+        price = IRCSP302019TableC1.vehicle_costs[vt]
+        terms = {term: np.empty(n) for term in table.TERMS}
+        for lane, index in groups.items():
+            values = _program(vt, lane)(
+                *(feature[index] for feature in features),
+                pwr[vt][index] if vt in pwr else None,
+                price[c.ET],
+                price[c.IT],
+            )
+            for term, value in values.items():
+                terms[term][index] = value
+        voc_data[vt] = build_voc_output(vt=vt, i_lane=lanes, lane=lane_classes, **terms)
+
+    summary = VOCPostProcessor(wpi, with_debugger=False, multipliers=multipliers).totals(voc_data)
+    for cost_type in summary.values():
+        for vt, costs in cost_type.items():
+            if isinstance(costs, dict):
+                cost_type[vt] = {key: np.reshape(value, shape) for key, value in costs.items()}
+    return summary
@@ -1,18 +1,9 @@
-from .vehicle_types import bigCars, buses, hcv, lcv, mcv, smallCars, two_wheeler
 from .utils import b_post_processor_for_VOC as pp
 from ... import standard_keys as c
 from .utils import total_of_raw_voc 
-
-# Map vehicle_info keys to their model modules
-MODEL_MAP = {
-    c.BIG_CARS: bigCars,
-    c.SMALL_CARS: smallCars,
-    c.TWO_WHEELERS: two_wheeler,
-    c.BUSES: buses,
-    c.HCV: hcv,
-    c.LCV: lcv,
-    c.MCV: mcv,
-}
+from .utils import vocEngine
+from .route import route_voc
+from ..unit_costs import prepare_unit_costs
 
 
 def normalize_input(vehicle_input):
@@ -49,6 +40,8 @@ def normalize_input(vehicle_input):
     normalized["lane_type"] = additional_inputs.get("alternate_road_carriageway")
     normalized["additional_travel_time_min"] = additional_inputs.get("additional_travel_time_min")
     normalized["power_weight_ratio_pwr"] = power_weight_ratio_pwr
+    # Optional per-segment geometry; replaces the fields above for VOC
+    normalized["segments"] = additional_inputs.get("segments")
 
     # Keep accident severity distribution
     normalized["accident_severity_distribution"] = vehicle_input.get("accident_severity_distribution", {})
@@ -56,10 +49,14 @@ def normalize_input(vehicle_input):
     return normalized
 
 
-def main(vehicle_input_raw, wpi, debug=False):
+def main(vehicle_input_raw, wpi, debug=False, unit_costs=None):
     """
     Validates input and executes the correct vehicle models for all vehicles with count > 0.
     Supports only the new Traffic_Input format.
+    The WPI multipliers are read from unit_costs (UnitCosts), or from the
+    cached unit_costs.prepare_unit_costs(wpi) when omitted.
+    With additional_inputs['segments'], VOC is the length-weighted mean over
+    the segments (route.route_voc) instead of one road geometry.
     """
 
     # --------------------
@@ -72,31 +69,32 @@ def main(vehicle_input_raw, wpi, debug=False):
     # --------------------
     results = {}
     vehicle_info = vehicle_input.get("vehicle_info", {})
-    for vt, count in vehicle_info.items():
-        if count > 0:
-            model_module = MODEL_MAP.get(vt)
-            if model_module is None:
-                results[vt] = {
-                    "status": "error",
-                    "message": f"No model available for '{vt}'."
-                }
-            else:
-                input_for_model = {
-                    **{k: v for k, v in vehicle_input.items() if k != "vehicle_info"},
-                    "vehicle_type": vt,
-                    "rf_rise_and_fall_factor": vehicle_input.get("fl_fall_factor")+ vehicle_input.get("rs_rise_factor")  # type: ignore
-                }
-
-                # Add power_weight_ratio_pwr if available
-                pwr_dict = vehicle_input.get("power_weight_ratio_pwr", {})
-                if isinstance(pwr_dict, dict):
-                    input_for_model["power_weight_ratio_pwr"] = pwr_dict.get(vt)
-
-                results[vt] = model_module.compute_voc(input_for_model)
+    vehicle_types = [vt for vt, count in vehicle_info.items() if count > 0]
+    pwr_dict = vehicle_input.get("power_weight_ratio_pwr", {})
+    pwr_dict = pwr_dict if isinstance(pwr_dict, dict) else {}
+    segments = vehicle_input.get("segments")
+
+    if unit_costs is None and "WPI" in wpi:
+        unit_costs = prepare_unit_costs(wpi, use_cache=not debug)
+    multipliers = unit_costs.voc if unit_costs is not None else None
+
+    if segments and vehicle_types:
+        # All segments in one vectorized pass, WPI-adjusted and length-weighted
+        summaryOfVOC = route_voc(segments, vehicle_types, pwr_dict, wpi, debug, multipliers)
+    else:
+        if vehicle_types:
+            common_input = {
+                **{k: v for k, v in vehicle_input.items() if k not in ("vehicle_info", "power_weight_ratio_pwr", "segments")},
+                "rf_rise_and_fall_factor": vehicle_input.get("fl_fall_factor")+ vehicle_input.get("rs_rise_factor")  # type: ignore
+            }
+
+            # One pass over all vehicle types with the coefficient table.
+            results = vocEngine.compute_all(vehicle_types, common_input, pwr_dict)
+
+        # --------------------
+        # 2. Post-process results
+        # --------------------
+        summaryOfVOC = pp.post_process(results, wpi, debug, multipliers)
 
-    # --------------------
-    # 2. Post-process results
-    # --------------------
-    summaryOfVOC = pp.post_process(results, wpi, debug)
     final_results = total_of_raw_voc.calculate_total_cost(summaryOfVOC, vehicle_input["vehicle_info"])
     return [summaryOfVOC, final_results]
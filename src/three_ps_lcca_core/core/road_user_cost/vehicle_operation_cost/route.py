@@ -0,0 +1,184 @@
+import importlib.util
+import math
+from typing import Any, Dict, List, Optional
+
+from .utils import vocEngine
+from .utils.c_wpi_adjustment import VOCPostProcessor
+from .utils.constants import vehicle_type_list
+from ... import standard_keys as c
+from ...utils.dump_to_file import dump_to_file
+
+# Routes shorter than this are evaluated segment by segment: below it the
+# scalar engine is faster than one compute_voc_batch call.
+VECTORIZE_MIN_SEGMENTS = 10
+
+# Segment field -> compute_voc_batch / vocEngine input name.
+SEGMENT_FIELDS = {
+    "road_roughness_mm_per_km": "rg_roughness_factor",
+    "road_fall_m_per_km": "fl_fall_factor",
+    "road_rise_m_per_km": "rs_rise_factor",
+    "carriage_width_in_m": "carriageway_width",
+    "alternate_road_carriageway": "lane_type",
+}
+
+_NOT_FINITE = (
+    "Route VOC of segment {} is not finite; check its carriage_width_in_m "
+    "(must be > 0) and geometry."
+)
+
+
+def _has_numpy() -> bool:
+    return importlib.util.find_spec("numpy") is not None
+
+
+def _weighted_costs_vectorized(weights, columns, vehicle_types, pwr, wpi, multipliers):
+    """
+    Share of every segment in the route VOC (length share * post-processed
+    VOC), from one compute_voc_batch call, as {cost type: {vehicle: {IT/ET:
+    list}}}.
+
+    Raises:
+        ValueError: If the VOC of a segment is not finite (where the scalar
+            engine raises ZeroDivisionError, compute_voc_batch gives inf).
+    """
+    import numpy as np
+
+    from .batch import compute_voc_batch
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        summary = compute_voc_batch(
+            wpi,
+            power_weight_ratio_pwr=pwr,
+            vehicle_types=vehicle_types,
+            multipliers=multipliers,
+            **columns,
+        )
+
+    finite = np.ones(len(weights), dtype=bool)
+    for vehicles in summary.values():
+        for costs in vehicles.values():
+            if isinstance(costs, dict):
+                for values in costs.values():
+                    finite &= np.isfinite(values)
+    if not finite.all():
+        raise ValueError(_NOT_FINITE.format(int(np.argmin(finite))))
+
+    weights = np.asarray(weights, dtype=float)
+    return {
+        cost_type: {
+            vt: {unit: (weights * values).tolist() for unit, values in costs.items()}
+            for vt, costs in vehicles.items()
+            if isinstance(costs, dict)
+        }
+        for cost_type, vehicles in summary.items()
+    }
+
+
+def _weighted_costs_loop(weights, columns, vehicle_types, pwr, wpi, multipliers):
+    """
+    _weighted_costs_vectorized without numpy: one vocEngine pass per segment.
+
+    Raises:
+        ValueError: If the VOC of a segment cannot be computed (division by
+            zero).
+    """
+    processor = VOCPostProcessor(wpi, with_debugger=False, multipliers=multipliers)
+    costs = {
+        cost_type: {vt: {c.IT: [], c.ET: []} for vt in vehicle_types}
+        for cost_type in ("distanceCost", "timeCost")
+    }
+    for k, weight in enumerate(weights):
+        segment_input = {name: values[k] for name, values in columns.items()}
+        segment_input["rf_rise_and_fall_factor"] = (
+            segment_input["fl_fall_factor"] + segment_input["rs_rise_factor"]
+        )
+        try:
+            summary = processor.totals(vocEngine.compute_all(vehicle_types, segment_input, pwr))
+        except ZeroDivisionError as exc:
+            raise ValueError(_NOT_FINITE.format(k)) from exc
+        for cost_type, vehicles in costs.items():
+            for vt, units in vehicles.items():
+                for unit, values in units.items():
+                    values.append(weight * summary[cost_type][vt][unit])
+    return costs
+
+
+def route_voc(
+    segments: List[Dict[str, Any]],
+    vehicle_types: List[str],
+    power_weight_ratio_pwr: Dict[str, Any],
+    wpi: Dict[str, Any],
+    debug: bool = False,
+    multipliers: Optional[tuple] = None,
+) -> Dict[str, Any]:
+    """
+    Length-weighted VOC (Rs/km/veh) of a route made of segments with their
+    own geometry.
+
+    All segments are evaluated at once with compute_voc_batch (numpy), or one
+    by one with the scalar engine for short routes (VECTORIZE_MIN_SEGMENTS)
+    and when numpy is not installed; both give the same result. Each cost is
+    the math.fsum of (length / total length) * segment cost, so a one-segment
+    route gives exactly that segment's VOC.
+
+    Args:
+        segments (list): additional_inputs['segments'] entries ('length_km',
+            'road_roughness_mm_per_km', 'road_rise_m_per_km',
+            'road_fall_m_per_km', 'carriage_width_in_m',
+            'alternate_road_carriageway').
+        vehicle_types (list): VOC vehicle types to evaluate.
+        power_weight_ratio_pwr (dict): {vehicle type: pwr} for HCV / MCV.
+        wpi (dict): WPI data ({'WPI': {vehicle: {cost_key: multiplier}}}).
+        debug (bool, optional): Dump the per-segment costs.
+        multipliers (tuple, optional): compile_multipliers(wpi['WPI']).
+
+    Returns:
+        dict: Same layout as post_process: {'distanceCost': {vehicle: {'IT',
+              'ET'}, 'units'}, 'timeCost': {...}}.
+
+    Raises:
+        ValueError: If segments is empty, pwr is missing for HCV / MCV, or
+            the VOC of a segment is not finite (e.g. carriage_width_in_m is
+            0). Both evaluation paths raise it for the same segments.
+    """
+    if not segments:
+        raise ValueError("Route VOC needs at least one segment.")
+
+    # Like post_process: vehicle_type_list order, types without a model skipped.
+    vehicle_types = [vt for vt in vehicle_type_list if vt in vehicle_types]
+
+    total_length = math.fsum(segment["length_km"] for segment in segments)
+    weights = [segment["length_km"] / total_length for segment in segments]
+    columns = {
+        name: [segment[field] for segment in segments]
+        for field, name in SEGMENT_FIELDS.items()
+    }
+
+    weighted_costs = (
+        _weighted_costs_vectorized
+        if len(segments) >= VECTORIZE_MIN_SEGMENTS and _has_numpy()
+        else _weighted_costs_loop
+    )
+    per_segment = weighted_costs(
+        weights, columns, vehicle_types, power_weight_ratio_pwr, wpi, multipliers
+    )
+
+    summary: Dict[str, Any] = {}
+    for cost_type, vehicles in per_segment.items():
+        summary[cost_type] = {
+            vt: {unit: math.fsum(values) for unit, values in units.items()}
+            for vt, units in vehicles.items()
+        }
+        summary[cost_type][c.UNITS] = "Rs/km/veh"
+
+    if debug:
+        dump_to_file(
+            "ruc-voc-segments.json",
+            {
+                "segments": segments,
+                "weighted_segment_costs": per_segment,
+                "length_weighted_summary": summary,
+            },
+        )
+
+    return summary
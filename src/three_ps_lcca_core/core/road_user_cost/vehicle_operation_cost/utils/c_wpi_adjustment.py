@@ -3,24 +3,145 @@ from .... import standard_keys as c
 from ..utils import IRCSP302019TableC1 as tableC1
 from ..utils.constants import vehicle_type_list, petrolToDieselRatio
 
+# Adjusted cost components, in the order they are reported and summed.
+DISTANCE_COMPONENTS = (
+    "tyre_cost", "fuel_cost", c.ENGINE_OIL, c.OTHER_OIL, c.GREASE, c.SP, "maintenance_labour",
+)
+TIME_COMPONENTS = (
+    "fixed_cost", "crew_cost", "passenger_time_cost", "commodity_holding_cost", "depreciation_cost",
+)
+
+# WPI factor of every component except fuel_cost, which uses the petrol and
+# diesel factors: the order of the multipliers in a compile_multipliers row.
+COMPONENT_WPI = (
+    "tyre_cost", c.ENGINE_OIL, c.OTHER_OIL, c.GREASE, "spare_parts", "spare_parts",
+    "fixed_depreciation", "crew_cost", "passenger_cost", "commodity_holding_cost",
+    "fixed_depreciation",
+)
+
+# WPI keys in the order they are validated.
+WPI_KEYS = (
+    "tyre_cost", c.PETROL, c.DIESEL, c.ENGINE_OIL, c.OTHER_OIL, c.GREASE, "spare_parts",
+    "fixed_depreciation", "crew_cost", "passenger_cost", "commodity_holding_cost",
+)
+
+_VEHICLE_INDEX = {vt: i for i, vt in enumerate(vehicle_type_list)}
+_OILS = ((c.ENGINE_OIL, 1000), (c.OTHER_OIL, 10000), (c.GREASE, 10000))
+
+
+def _base_row(vt: str, unit: str) -> tuple:
+    tyres = tableC1.new_tyres_costs[vt]
+    prices = tableC1.petroleum_products_costs
+    return (
+        tyres[unit] * tyres[c.NUMBER_OF_WHEELS],
+        prices[c.PETROL][unit],
+        prices[c.DIESEL][unit],
+    ) + tuple(prices[oil][unit] for oil, _ in _OILS)
+
+
+# IRC Table C.1 unit costs per vehicle (rows in vehicle_type_list order):
+# (tyre set, petrol, diesel, engine oil, other oil, grease).
+BASE_COSTS = {
+    unit: tuple(_base_row(vt, unit) for vt in vehicle_type_list) for unit in (c.IT, c.ET)
+}
+FUEL_RATIOS = tuple(
+    (petrolToDieselRatio[vt][c.PETROL], petrolToDieselRatio[vt][c.DIESEL])
+    for vt in vehicle_type_list
+)
+
+
+def _lookup(wpi: Dict[str, Any], vehicle_type: str, key: str) -> float:
+    """Return WPI[vehicle][key] as a float."""
+    v_key = c.O_BUSES if vehicle_type == c.BUSES else vehicle_type
+    if v_key not in wpi:
+        raise ValueError(f"CRITICAL: Vehicle '{v_key}' missing from WPI.")
+    val = wpi[v_key].get(key)
+    if val is None:
+        raise ValueError(f"CRITICAL: '{key}' missing for vehicle '{v_key}' in WPI.")
+    if not isinstance(val, (int, float)):
+        raise ValueError(f"CRITICAL: WPI['{v_key}']['{key}'] must be numeric, got {type(val).__name__}")
+    return val
+
+
+def compile_multipliers(wpi: Dict[str, Any]) -> tuple:
+    """
+    Compiles a WPI block ({vehicle: {cost_key: value}}) into a tuple of
+    rows, one per vehicle_type_list entry. Each row is a plain tuple of the
+    COMPONENT_WPI factors followed by the petrol and diesel factors; the
+    rows are applied one vehicle at a time, not as a matrix product.
+
+    A vehicle whose block is missing or invalid gets the lookup error instead
+    of a row; it is raised only when that vehicle is adjusted.
+    """
+    rows = []
+    for vt in vehicle_type_list:
+        try:
+            factors = {key: _lookup(wpi, vt, key) for key in WPI_KEYS}
+        except Exception as exc:
+            rows.append(exc)
+            continue
+        rows.append(
+            tuple(factors[key] for key in COMPONENT_WPI) + (factors[c.PETROL], factors[c.DIESEL])
+        )
+    return tuple(rows)
+
+
+def _bases(vt_index: int, summary: Dict[str, Any], unit: str) -> tuple:
+    """
+    Unadjusted costs of one vehicle in COMPONENT_WPI order, and its
+    (petrol, diesel) fuel costs.
+    """
+    dist_s, time_s = summary["distance_related"], summary["time_related"]
+    tyre, petrol, diesel, *oil_prices = BASE_COSTS[unit][vt_index]
+    fuel = dist_s["fuel_consumption"]
+    bases = (
+        (tyre / dist_s["tyre_life"][c.VALUE],)
+        + tuple(
+            (dist_s[oil][c.VALUE] * price) / fac
+            for (oil, fac), price in zip(_OILS, oil_prices)
+        )
+        + (
+            dist_s[c.SP][unit],
+            dist_s["maintenance_labour"][c.VALUE],
+            time_s["fixed_cost"][unit],
+            time_s["crew_cost"][c.VALUE],
+            time_s["passenger_time_cost"][c.VALUE],
+            time_s["commodity_holding_cost"][c.VALUE],
+            time_s["depreciation_cost"][unit],
+        )
+    )
+    fuel_costs = (
+        (fuel.get(c.PETROL, 0) * petrol) / 1000,
+        (fuel.get(c.DIESEL, 0) * diesel) / 1000,
+    )
+    return bases, fuel_costs
+
 
 class VOCPostProcessor:
-    def __init__(self, wpi_data: Dict[str, Any]):
+    def __init__(
+        self, wpi_data: Dict[str, Any], with_debugger: bool = True, multipliers: tuple = None
+    ):
+        """
+        with_debugger: attach a 'WPI_Debugger' block (base, multiplier, WPI
+        path) to every adjusted component. Only needed for debug dumps.
+        multipliers: compile_multipliers(wpi_data['WPI']) if already known,
+        e.g. the cached road_user_cost.unit_costs tables.
+        """
         if "WPI" not in wpi_data:
             raise ValueError("CRITICAL: Root 'WPI' key missing from input.")
         self.wpi = wpi_data["WPI"]  # {vehicle: {cost_key: value}}
+        self.with_debugger = with_debugger
+        self.multipliers = compile_multipliers(self.wpi) if multipliers is None else multipliers
 
     def _wpi(self, vehicle_type: str, key: str) -> float:
         """Return WPI[vehicle][key] as a float."""
-        v_key = c.O_BUSES if vehicle_type == c.BUSES else vehicle_type
-        if v_key not in self.wpi:
-            raise ValueError(f"CRITICAL: Vehicle '{v_key}' missing from WPI.")
-        val = self.wpi[v_key].get(key)
-        if val is None:
-            raise ValueError(f"CRITICAL: '{key}' missing for vehicle '{v_key}' in WPI.")
-        if not isinstance(val, (int, float)):
-            raise ValueError(f"CRITICAL: WPI['{v_key}']['{key}'] must be numeric, got {type(val).__name__}")
-        return val
+        return _lookup(self.wpi, vehicle_type, key)
+
+    def _row(self, vt_index: int) -> tuple:
+        row = self.multipliers[vt_index]
+        if isinstance(row, Exception):
+            raise type(row)(*row.args)
+        return row
 
     def _apply_adjustment(
         self, cost_base: Dict[str, float], mult: float, path: str
@@ -34,16 +155,14 @@ class VOCPostProcessor:
                 f"CRITICAL: Base cost keys (IT/ET/VALUE) missing for {path}"
             )
 
-        if c.VALUE in cost_base:
-            debugger = {"base": it_base, "multiplier": mult, "path": path}
-        else:
-            debugger = {"base_it": it_base, "base_et": et_base, "multiplier": mult, "path": path}
-
-        res = {
-            "WPI_Debugger": debugger,
-            c.UNIT: "Rs/km",
-            c.iHTC: True,
-        }
+        res = {}
+        if self.with_debugger:
+            if c.VALUE in cost_base:
+                res["WPI_Debugger"] = {"base": it_base, "multiplier": mult, "path": path}
+            else:
+                res["WPI_Debugger"] = {"base_it": it_base, "base_et": et_base, "multiplier": mult, "path": path}
+        res[c.UNIT] = "Rs/km"
+        res[c.iHTC] = True
 
         if c.VALUE in cost_base:
             res[c.VALUE] = it_base * mult
@@ -53,6 +172,49 @@ class VOCPostProcessor:
             res[c.ET] = et_base * mult
         return res
 
+    def _adjusted(self, vt_index: int, summary: Dict[str, Any], unit: str) -> list:
+        """
+        Adjusted costs of one vehicle in DISTANCE_COMPONENTS +
+        TIME_COMPONENTS order: each base cost times its multiplier
+        (element by element), and fuel as petrol and diesel shares of their
+        own factors.
+        """
+        row = self._row(vt_index)
+        bases, (petrol, diesel) = _bases(vt_index, summary, unit)
+        petrol_ratio, diesel_ratio = FUEL_RATIOS[vt_index]
+        values = [base * mult for base, mult in zip(bases, row)]
+        values.insert(1, (petrol_ratio * petrol * row[-2]) + (diesel_ratio * diesel * row[-1]))
+        return values
+
+    def totals(self, voc_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        calculate_total_cost(process(voc_data)), computed from each vehicle's
+        multiplier row without building the per-component dicts. The
+        adjusted components are added one by one in component order, so the
+        totals equal calculate_total_cost exactly.
+        """
+        total_cost: Dict[str, Any] = {"distanceCost": {}, "timeCost": {}}
+        split = len(DISTANCE_COMPONENTS)
+
+        for vt in vehicle_type_list:
+            if vt not in voc_data:
+                continue
+            index = _VEHICLE_INDEX[vt]
+            summary = voc_data[vt]["VOC_summary"]
+            distance = total_cost["distanceCost"][vt] = {c.IT: 0.0, c.ET: 0.0}
+            time_related = total_cost["timeCost"][vt] = {c.IT: 0.0, c.ET: 0.0}
+            # Row sums, added in component order like calculate_total_cost.
+            for unit in (c.IT, c.ET):
+                values = self._adjusted(index, summary, unit)
+                for value in values[:split]:
+                    distance[unit] += value
+                for value in values[split:]:
+                    time_related[unit] += value
+
+        for cost_type in total_cost.values():
+            cost_type[c.UNITS] = "Rs/km/veh"
+        return total_cost
+
     def process(self, voc_data: Dict[str, Any]) -> Dict[str, Any]:
         adjusted = {"distanceCost": {}, "timeCost": {}}
 
@@ -60,82 +222,50 @@ class VOCPostProcessor:
             if vt not in voc_data:
                 continue
 
+            index = _VEHICLE_INDEX[vt]
             raw = voc_data[vt]["VOC_summary"]
-            dist_s, time_s = raw["distance_related"], raw["time_related"]
+            row = self._row(index)
+            bases = {unit: _bases(index, raw, unit)[0] for unit in (c.IT, c.ET)}
+            adjusted_it = self._adjusted(index, raw, c.IT)
+            adjusted_et = self._adjusted(index, raw, c.ET)
             dc = adjusted["distanceCost"].setdefault(vt, {})
             tc = adjusted["timeCost"].setdefault(vt, {})
 
+            def adjust(position, path, value=False):
+                base = (
+                    {c.VALUE: bases[c.IT][position]}
+                    if value
+                    else {c.IT: bases[c.IT][position], c.ET: bases[c.ET][position]}
+                )
+                return self._apply_adjustment(base, row[position], path)
+
             # --- Tyres ---
-            t_info = tableC1.new_tyres_costs[vt]
-            b_tyre = {
-                c.IT: (t_info[c.IT] * t_info[c.NUMBER_OF_WHEELS])
-                / dist_s["tyre_life"][c.VALUE],
-                c.ET: (t_info[c.ET] * t_info[c.NUMBER_OF_WHEELS])
-                / dist_s["tyre_life"][c.VALUE],
-            }
-            dc["tyre_cost"] = self._apply_adjustment(
-                b_tyre, self._wpi(vt, "tyre_cost"), f"WPI['{vt}']['tyre_cost']"
-            )
+            dc["tyre_cost"] = adjust(0, f"WPI['{vt}']['tyre_cost']")
 
             # --- Fuel & Lubricants ---
-            f_cons = dist_s["fuel_consumption"]
-            ratio = petrolToDieselRatio[vt]
-
-            p_mult = self._wpi(vt, c.PETROL)
-            d_mult = self._wpi(vt, c.DIESEL)
-
-            p_it = (f_cons.get(c.PETROL, 0) * tableC1.petroleum_products_costs[c.PETROL][c.IT]) / 1000
-            d_it = (f_cons.get(c.DIESEL, 0) * tableC1.petroleum_products_costs[c.DIESEL][c.IT]) / 1000
-            p_et = (f_cons.get(c.PETROL, 0) * tableC1.petroleum_products_costs[c.PETROL][c.ET]) / 1000
-            d_et = (f_cons.get(c.DIESEL, 0) * tableC1.petroleum_products_costs[c.DIESEL][c.ET]) / 1000
-
             dc["fuel_cost"] = {
-                c.IT: (ratio[c.PETROL] * p_it * p_mult) + (ratio[c.DIESEL] * d_it * d_mult),
-                c.ET: (ratio[c.PETROL] * p_et * p_mult) + (ratio[c.DIESEL] * d_et * d_mult),
+                c.IT: adjusted_it[1],
+                c.ET: adjusted_et[1],
                 c.UNIT: "Rs/km",
                 c.iHTC: True,
             }
-
-            for oil in [c.ENGINE_OIL, c.OTHER_OIL, c.GREASE]:
-                fac = 1000 if oil == c.ENGINE_OIL else 10000
-                o_base = {
-                    c.IT: (dist_s[oil][c.VALUE] * tableC1.petroleum_products_costs[oil][c.IT]) / fac,
-                    c.ET: (dist_s[oil][c.VALUE] * tableC1.petroleum_products_costs[oil][c.ET]) / fac,
-                }
-                dc[oil] = self._apply_adjustment(o_base, self._wpi(vt, oil), f"WPI['{vt}']['{oil}']")
+            for position, (oil, _) in enumerate(_OILS, start=1):
+                dc[oil] = adjust(position, f"WPI['{vt}']['{oil}']")
 
             # --- Maintenance ---
-            m_mult = self._wpi(vt, "spare_parts")
-            dc[c.SP] = self._apply_adjustment(
-                {c.IT: dist_s[c.SP][c.IT], c.ET: dist_s[c.SP][c.ET]},
-                m_mult, f"WPI['{vt}']['spare_parts']",
-            )
-            dc["maintenance_labour"] = self._apply_adjustment(
-                {c.VALUE: dist_s["maintenance_labour"][c.VALUE]},
-                m_mult, f"WPI['{vt}']['spare_parts'] (maintenance_labour)",
+            dc[c.SP] = adjust(4, f"WPI['{vt}']['spare_parts']")
+            dc["maintenance_labour"] = adjust(
+                5, f"WPI['{vt}']['spare_parts'] (maintenance_labour)", value=True
             )
 
             # --- Time Related ---
-            tc["fixed_cost"] = self._apply_adjustment(
-                {c.IT: time_s["fixed_cost"][c.IT], c.ET: time_s["fixed_cost"][c.ET]},
-                self._wpi(vt, "fixed_depreciation"), f"WPI['{vt}']['fixed_depreciation']",
-            )
-            tc["crew_cost"] = self._apply_adjustment(
-                {c.VALUE: time_s["crew_cost"][c.VALUE]},
-                self._wpi(vt, "crew_cost"), f"WPI['{vt}']['crew_cost']",
-            )
-            tc["passenger_time_cost"] = self._apply_adjustment(
-                {c.VALUE: time_s["passenger_time_cost"][c.VALUE]},
-                self._wpi(vt, "passenger_cost"), f"WPI['{vt}']['passenger_cost']",
-            )
-            tc["commodity_holding_cost"] = self._apply_adjustment(
-                {c.VALUE: time_s["commodity_holding_cost"][c.VALUE]},
-                self._wpi(vt, "commodity_holding_cost"), f"WPI['{vt}']['commodity_holding_cost']",
-            )
-            tc["depreciation_cost"] = self._apply_adjustment(
-                {c.IT: time_s["depreciation_cost"][c.IT], c.ET: time_s["depreciation_cost"][c.ET]},
-                self._wpi(vt, "fixed_depreciation"), f"WPI['{vt}']['fixed_depreciation']",
+            tc["fixed_cost"] = adjust(6, f"WPI['{vt}']['fixed_depreciation']")
+            tc["crew_cost"] = adjust(7, f"WPI['{vt}']['crew_cost']", value=True)
+            tc["passenger_time_cost"] = adjust(8, f"WPI['{vt}']['passenger_cost']", value=True)
+            tc["commodity_holding_cost"] = adjust(
+                9, f"WPI['{vt}']['commodity_holding_cost']", value=True
             )
+            tc["depreciation_cost"] = adjust(10, f"WPI['{vt}']['fixed_depreciation']")
 
             # Totals
             tc["total_time_cost"] = {
@@ -0,0 +1,297 @@
+# IRC SP-30:2019, Annex C vehicle operating cost models, as one coefficient table
+# (vehicle type x lane class x output term) evaluated by vocEngine.
+#
+# Every output term is a linear form: an ordered tuple of (coefficient, feature)
+# pairs summed left to right, i.e. 66.44 - 0.6922 * RF - 0.002874 * (RG - 2000)
+# is ((66.44, ONE), (-0.6922, RF), (-0.002874, RG_2000)). Features starting with
+# '/' divide: (844.085, PER_V) is 844.085 / V. Terms keep the order of the
+# published formulas so results are identical to evaluating them directly.
+from .... import standard_keys as c
+
+# --- Features ---
+ONE = "1"
+RF = "RF"              # rise and fall
+RG = "RG"              # roughness
+RG_2000 = "RG-2000"
+W = "W"                # carriageway width
+V = "V"                # velocity term
+RS = "RS"              # rise
+FL = "FL"              # fall
+RG_W = "RG/W"
+V2 = "V^2"
+PWR = "pwr"            # power to weight ratio (HCV / MCV)
+SP_ET = "SP_ET"
+SP_IT = "SP_IT"
+PER_V = "/V"
+PER_W = "/W"
+PER_UPD = "/UPD"
+
+# Features a form may use, and the output terms in evaluation order: V, V^2,
+# SP_ET, SP_IT and UPD are earlier terms. Term names are the build_voc_output
+# arguments.
+FEATURES = (RF, RG, RG_2000, W, RS, FL, RG_W, PWR, V, V2, PER_V, PER_W, PER_UPD, SP_ET, SP_IT)
+TERMS = (
+    "velocity", "petrol", "diesel", "SP_ET", "SP_IT", "ML", "TL", "EOL", "OL", "G",
+    "UPD", "FXC_ET", "FXC_IT", "DC_ET", "DC_IT", "PT", "crew", "CHC",
+)
+LANES = (c.SL, c.IL, c.L2, c.L4, c.L6, c.L8, c.EW)
+
+# Spare parts (SP_ET / SP_IT) forms are wrapped before scaling by the new
+# vehicle price (IRCSP302019TableC1.vehicle_costs):
+SCALED = "scaled"      # form * 1e-5 * price
+EXP = "exp"            # exp(form) * price
+
+
+def _by_lane(sl, il, l2, l4, l6, l8, ew):
+    return dict(zip(LANES, (sl, il, l2, l4, l6, l8, ew)))
+
+
+def _speed(rural, urban, ew_width):
+    """
+    Speed forms: (a, b, c) per lane for SL, IL, 2L (a - b*RF - c*(RG-2000)) and
+    for 4L, 6L, 8L and EW (a - b*RF - c*RG); EW adds + ew_width * W.
+    """
+    forms = [((a, ONE), (-b, RF), (-k, RG_2000)) for a, b, k in rural]
+    forms += [((a, ONE), (-b, RF), (-k, RG)) for a, b, k in urban]
+    forms[-1] += ((ew_width, W),)
+    return _by_lane(*forms)
+
+
+_CAR_PETROL = ((30, ONE), (844.085, PER_V), (0.003, V2), (0.001, RG), (0.3414, RS), (-0.2225, FL))
+_CAR_DIESEL = ((35, ONE), (983.503, PER_V), (0.003, V2), (0.002, RG), (0.339, RS), (-0.4785, FL))
+_CAR_OILS = {
+    "TL": ((68771, ONE), (-147.9, RF), (-26.72, RG_W)),
+    "EOL": ((1.8807, ONE), (0.036615, RF), (0.000578, RG_W)),
+    "OL": ((1.631, ONE), (0.05167, RF), (0.001867, RG_W)),
+    "G": ((2.816, ONE), (0.2007, RF)),
+}
+_CAR_TIME = {
+    "FXC_ET": ((395.65, PER_UPD),),
+    "FXC_IT": ((400.61, PER_UPD),),
+    "DC_ET": ((42.83, PER_UPD),),
+    "DC_IT": ((76.68, PER_UPD),),
+    "crew": ((0.0, ONE),),
+    "CHC": ((0.0, ONE),),
+}
+_NO_PASSENGERS = ((0, ONE),)
+_HCV_OILS = {
+    "OL": ((5.1037, ONE), (0.0002646, RG)),
+    "G": ((0.9153, ONE), (0.0707, RF), (0.000627, RG)),
+}
+
+# vehicle -> {"spare_parts": SCALED | EXP, term: form | {lane: form}}
+MODELS = {
+    c.SMALL_CARS: {
+        "spare_parts": SCALED,
+        "velocity": _speed(
+            [(66.44, 0.6922, 0.002874), (73.16, 0.7298, 0.002231), (81.19, 0.7892, 0.001891)],
+            [(100.625, 0.394, 0.00330), (101.065, 0.386, 0.00323),
+             (103.517, 0.386, 0.00323), (93.71, 0.386, 0.00323)],
+            0.701,
+        ),
+        "petrol": _CAR_PETROL,
+        "diesel": _CAR_DIESEL,
+        "SP_ET": ((0.0075, RG_2000),),
+        "SP_IT": ((0.0075, RG_2000),),
+        "ML": ((1.79934, SP_ET),),
+        **_CAR_OILS,
+        "UPD": ((6.7127, V),),
+        **_CAR_TIME,
+        "PT": _by_lane(
+            ((244.07, PER_V),), ((244.07, PER_V),), ((328.06, PER_V),),
+            ((498.65, PER_V),), ((498.65, PER_V),), ((498.65, PER_V),),
+            ((721.73, PER_V),),
+        ),
+    },
+    c.BIG_CARS: {
+        "spare_parts": SCALED,
+        "velocity": _speed(
+            [(67.04, 0.6984, 0.002956), (73.82, 0.7364, 0.002251), (81.92, 0.7963, 0.001915)],
+            [(100.625, 0.394, 0.00330), (104.159, 0.398, 0.00333),
+             (107.743, 0.402, 0.00337), (97.53, 0.402, 0.00337)],
+            0.729,
+        ),
+        "petrol": _CAR_PETROL,
+        "diesel": _CAR_DIESEL,
+        "SP_ET": ((0.0045, RG_2000),),
+        "SP_IT": ((0.0045, RG_2000),),
+        "ML": ((1.79934, SP_ET),),
+        **_CAR_OILS,
+        "UPD": ((6.7378, V),),
+        **_CAR_TIME,
+        "PT": _by_lane(
+            ((244.07, PER_V),), ((244.07, PER_V),), ((328.06, PER_V),),
+            ((721.73, PER_V),), ((721.73, PER_V),), ((721.73, PER_V),),
+            ((721.73, PER_V),),
+        ),
+    },
+    c.TWO_WHEELERS: {
+        "spare_parts": SCALED,
+        "velocity": _speed(
+            [(52.91, 0.6922, 0.002874), (58.86, 0.7298, 0.002231), (59.71, 0.7892, 0.001891)],
+            [(78.57, 0.7235, 0.001729), (81.35, 0.7235, 0.001729),
+             (82.73, 0.7235, 0.001729), (77.19, 0.7235, 0.001729)],
+            0.396,
+        ),
+        "petrol": ((2.704, ONE), (439.656, PER_V), (0.00349, V2), (0.000157, RG),
+                   (0.3642, RS), (-0.2709, FL)),
+        "diesel": ((0, ONE),),
+        "SP_ET": ((-55.879, ONE), (0.024, RG)),
+        "SP_IT": ((-55.879, ONE), (0.024, RG)),
+        "ML": ((0.5498, SP_ET),),
+        "TL": ((47340, ONE), (-101.8, RF), (-18.39, RG_W)),
+        "EOL": ((0.405, ONE), (0.007899, RF), (0.000125, RG_W)),
+        "OL": ((0.0, ONE),),
+        "G": ((0.0, ONE),),
+        "UPD": ((2.119, V),),
+        "FXC_ET": ((24.32, PER_UPD),),
+        "FXC_IT": ((24.86, PER_UPD),),
+        "DC_ET": ((4.26, PER_UPD),),
+        "DC_IT": ((5.85, PER_UPD),),
+        "PT": _by_lane(
+            ((49.28, PER_V),), ((49.28, PER_V),), ((70.29, PER_V),),
+            ((70.77, PER_V),), ((70.77, PER_V),), ((70.77, PER_V),),
+            ((70.77, PER_V),),
+        ),
+        "crew": ((0.0, ONE),),
+        "CHC": ((0.0, ONE),),
+    },
+    c.BUSES: {
+        "spare_parts": EXP,
+        "velocity": _speed(
+            [(47.25, 0.3698, 0.00165), (52.65, 0.4031, 0.00123), (54.23, 0.4111, 0.00098)],
+            [(75.43, 0.214, 0.00198), (77.58, 0.214, 0.00198),
+             (79.73, 0.214, 0.00198), (71.13, 0.214, 0.00198)],
+            0.614,
+        ),
+        "petrol": ((0, ONE),),
+        "diesel": ((34.23, ONE), (4054.42, PER_V), (0.02149, V2), (0.001246, RG),
+                   (3.4557, RS), (-1.8454, FL)),
+        "SP_ET": ((-9.7871, ONE), (0.007373, RF), (0.0000723, RG), (1.925, PER_W)),
+        "SP_IT": ((-10.1126, ONE), (0.007373, RF), (0.0000723, RG), (1.925, PER_W)),
+        "ML": ((1.1781, SP_ET),),
+        "TL": ((38519, ONE), (-389.52, RF), (-1.32, RG), (983.829, W)),
+        "EOL": ((0.4303, ONE), (0.001494, RF), (0.0007885, RG_W)),
+        "OL": ((3.3201, ONE), (0.002889, RF), (0.0008217, RG), (-0.3295, W)),
+        "G": ((4.992, ONE), (0.03376, RF), (0.3634, W)),
+        "UPD": ((22.7134, ONE), (12.2569, V)),
+        "FXC_ET": ((772.89, PER_UPD),),
+        "FXC_IT": ((1415.09, PER_UPD),),
+        "DC_ET": ((221.00, PER_UPD),),
+        "DC_IT": ((355.71, PER_UPD),),
+        "PT": _by_lane(
+            ((7297.63, PER_UPD),), ((7297.63, PER_UPD),), ((15509.80, PER_UPD),),
+            ((23721.98, PER_UPD),), ((23721.98, PER_UPD),), ((23721.98, PER_UPD),),
+            ((28385.28, PER_UPD),),
+        ),
+        "crew": ((3775.3, PER_UPD),),
+        "CHC": ((0.0, ONE),),
+    },
+    c.LCV: {
+        "spare_parts": EXP,
+        "velocity": _speed(
+            [(49.87, 0.4447, 0.00088), (53.70, 0.4788, 0.00095), (57.41, 0.5119, 0.00102)],
+            [(74.897, 0.163, 0.0031), (77.036, 0.163, 0.0031),
+             (79.174, 0.163, 0.0031), (70.620, 0.163, 0.0031)],
+            0.611,
+        ),
+        "petrol": ((0, ONE),),
+        "diesel": ((22.504, ONE), (1708.244, PER_V), (0.02591, V2), (0.001612, RG),
+                   (5.6863, RS), (-0.8744, FL)),
+        "SP_ET": ((-10.5615, ONE), (0.000141, RG), (3.493, PER_W)),
+        "SP_IT": ((-10.5615, ONE), (0.000141, RG), (3.493, PER_W)),
+        "ML": ((0.85773, SP_IT),),
+        "TL": ((22382, ONE), (3817, W), (-375.3, RF), (-1.037, RG)),
+        "EOL": ((0.80679, ONE), (0.019496, RF), (0.0001297, RG_W)),
+        "OL": ((2.0415, ONE), (0.0001058, RG)),
+        "G": ((0.3661, ONE), (0.0283, RF), (0.000251, RG)),
+        "UPD": ((28.807, ONE), (2.1836, V)),
+        "FXC_ET": ((723.80, PER_UPD),),
+        "FXC_IT": ((829.56, PER_UPD),),
+        "DC_ET": ((120.90, PER_UPD),),
+        "DC_IT": ((173.51, PER_UPD),),
+        "PT": _NO_PASSENGERS,
+        "crew": ((900, PER_UPD),),
+        "CHC": _by_lane(
+            ((64.71, PER_UPD),), ((64.71, PER_UPD),), ((71.35, PER_UPD),),
+            ((149.12, PER_UPD),), ((149.12, PER_UPD),), ((149.12, PER_UPD),),
+            ((149.12, PER_UPD),),
+        ),
+    },
+    c.HCV: {
+        "spare_parts": EXP,
+        "velocity": _speed(
+            [(48.29, 0.4306, 0.00086), (53.12, 0.4736, 0.00094), (56.52, 0.5040, 0.00100)],
+            [(75.15, 0.6487, 0.001285), (77.17, 0.6487, 0.001285),
+             (79.19, 0.6487, 0.001285), (71.11, 0.6487, 0.001285)],
+            0.577,
+        ),
+        "petrol": ((0, ONE),),
+        "diesel": ((50, ONE), (8049.955, PER_V), (0.012, V2), (0.005, RG),
+                   (4.565, RS), (-4.904, FL), (-7.285, PWR)),
+        "SP_ET": ((-9.492638, ONE), (0.0001413, RG), (3.493, PER_W)),
+        "SP_IT": ((-9.492638, ONE), (0.0001413, RG), (3.493, PER_W)),
+        "ML": ((0.7912, SP_ET),),
+        "TL": ((24662, ONE), (4205, W), (-413.6, RF), (-1.142, RG)),
+        "EOL": ((1.0277, ONE), (0.02495, RF), (0.0001782, RG_W)),
+        **_HCV_OILS,
+        "UPD": ((55.6719, ONE), (4.22, V)),
+        "FXC_ET": ((924.28, PER_UPD),),
+        "FXC_IT": ((1056.82, PER_UPD),),
+        "DC_ET": ((154.84, PER_UPD),),
+        "DC_IT": ((256.80, PER_UPD),),
+        "PT": _NO_PASSENGERS,
+        "crew": ((1500, PER_UPD),),
+        "CHC": _by_lane(
+            ((182.79, PER_UPD),), ((182.79, PER_UPD),), ((218.75, PER_UPD),),
+            ((1084.14, PER_UPD),), ((1084.14, PER_UPD),), ((1084.14, PER_UPD),),
+            ((1084.14, PER_UPD),),
+        ),
+    },
+    c.MCV: {
+        "spare_parts": EXP,
+        "velocity": _speed(
+            [(38.27, 0.3412, 0.00068), (42.01, 0.3753, 0.00074), (44.79, 0.3994, 0.00079)],
+            [(74.16, 0.6405, 0.00128), (76.60, 0.6405, 0.00128),
+             (79.03, 0.6405, 0.00128), (69.29, 0.6405, 0.00128)],
+            0.696,
+        ),
+        "petrol": ((0, ONE),),
+        "diesel": ((90, ONE), (14489.919, PER_V), (0.0216, V2), (0.01, RG),
+                   (8.217, RS), (-8.8272, FL), (-13.113, PWR)),
+        "SP_ET": ((-9.492638, ONE), (0.0001413, RG), (3.493, PER_W)),
+        "SP_IT": ((-9.492638, ONE), (0.0001413, RG), (3.493, PER_W)),
+        "ML": ((0.7912, SP_ET),),
+        "TL": ((23726, ONE), (4046, W), (-398, RF), (-1.0099, RG)),
+        "EOL": ((1.3826, ONE), (0.03348, RF), (0.002319, RG_W)),
+        **_HCV_OILS,
+        "UPD": ((77.7233, ONE), (5.8915, V)),
+        "FXC_ET": ((1238.28, PER_UPD),),
+        "FXC_IT": ((1479.30, PER_UPD),),
+        "DC_ET": ((238.54, PER_UPD),),
+        "DC_IT": ((425.84, PER_UPD),),
+        "PT": _NO_PASSENGERS,
+        "crew": ((1800, PER_UPD),),
+        # MCVs are not typically used on single / intermediate lanes.
+        "CHC": _by_lane(
+            ((0, ONE),), ((0, ONE),), ((409.28, PER_UPD),),
+            ((1707.37, PER_UPD),), ((1707.37, PER_UPD),), ((1707.37, PER_UPD),),
+            ((1707.37, PER_UPD),),
+        ),
+    },
+}
+
+VEHICLES = tuple(MODELS)
+
+
+def _lane_form(form, lane):
+    return form[lane] if isinstance(form, dict) else form
+
+
+# Dense table: TABLE[vehicle][lane][term] is the form of TERMS[term] for
+# VEHICLES[vehicle] on LANES[lane]; SPARE_PARTS[vehicle] is its SP wrapper.
+TABLE = tuple(
+    tuple(tuple(_lane_form(MODELS[vehicle][term], lane) for term in TERMS) for lane in LANES)
+    for vehicle in VEHICLES
+)
+SPARE_PARTS = tuple(MODELS[vehicle]["spare_parts"] for vehicle in VEHICLES)
@@ -0,0 +1,232 @@
+import math
+from typing import Any, Dict, Iterable, Optional
+
+from .... import standard_keys as c
+from . import IRCSP302019TableC1
+from . import vocCoefficients as table
+from .commonInputs import VehicleInput
+from .vocOutputBuilder import build_voc_output
+from ...carriage_width_info.carriagewayStandards import CarriagewayStandards
+
+_VEHICLE_INDEX = {vehicle: i for i, vehicle in enumerate(table.VEHICLES)}
+_LANE_INDEX = {lane: i for i, lane in enumerate(table.LANES)}
+
+# Program arguments, then V^2 and the output terms: the slots of the values a
+# form can read.
+_ARGUMENTS = ("RF", "RG", "RG_2000", "W", "RS", "FL", "RG_W", "pwr", "price_ET", "price_IT")
+_SLOTS = {name: i for i, name in enumerate(_ARGUMENTS + ("V2",) + table.TERMS)}
+_FEATURE_SLOTS = {
+    table.RF: "RF",
+    table.RG: "RG",
+    table.RG_2000: "RG_2000",
+    table.W: "W",
+    table.RS: "RS",
+    table.FL: "FL",
+    table.RG_W: "RG_W",
+    table.PWR: "pwr",
+    table.V: "velocity",
+    table.V2: "V2",
+    table.SP_ET: "SP_ET",
+    table.SP_IT: "SP_IT",
+    table.PER_V: "velocity",
+    table.PER_W: "W",
+    table.PER_UPD: "UPD",
+}
+_PRICE_SLOTS = {"SP_ET": _SLOTS["price_ET"], "SP_IT": _SLOTS["price_IT"]}
+_FIRST_TERM = _SLOTS[table.TERMS[0]]
+_VELOCITY = _SLOTS["velocity"]
+_V2 = _SLOTS["V2"]
+
+
+def _operations(form):
+    """
+    A form as (coefficient, slot, divide) steps; slot is None for constants.
+    """
+    return tuple(
+        (coef, None, False)
+        if feature == table.ONE
+        else (coef, _SLOTS[_FEATURE_SLOTS[feature]], feature[0] == "/")
+        for coef, feature in form
+    )
+
+
+def compile_program(vehicle: str, lane: str, exp=math.exp, pow=pow):
+    """
+    Prepares the forms of one vehicle type on one lane class for evaluation.
+
+    Args:
+        vehicle (str): Vehicle type (a key of vocCoefficients.MODELS).
+        lane (str): Lane class (one of vocCoefficients.LANES).
+        exp (callable, optional): Exponential used by EXP spare parts forms.
+        pow (callable, optional): Power used for V^2.
+
+    Returns:
+        callable: program(RF, RG, RG_2000, W, RS, FL, RG_W, pwr, price_ET,
+                  price_IT) -> {term: value} in vocCoefficients.TERMS order.
+    """
+    vehicle_index = _VEHICLE_INDEX[vehicle]
+    scaled = table.SPARE_PARTS[vehicle_index] == table.SCALED
+
+    # Terms whose form is a single constant are filled in once; the others
+    # are evaluated in TERMS order as (slot, first step, further steps,
+    # price slot of spare parts terms).
+    initial = [None] * (len(_SLOTS) - len(_ARGUMENTS))
+    steps = []
+    for term, form in zip(table.TERMS, table.TABLE[vehicle_index][_LANE_INDEX[lane]]):
+        operations = _operations(form)
+        price_slot = _PRICE_SLOTS.get(term)
+        if len(operations) == 1 and operations[0][1] is None and price_slot is None:
+            initial[_SLOTS[term] - len(_ARGUMENTS)] = operations[0][0]
+        else:
+            steps.append((_SLOTS[term], operations[0], operations[1:], price_slot))
+    initial = tuple(initial)
+    steps = tuple(steps)
+
+    def program(*arguments):
+        values = list(arguments + initial)
+        for slot, (coef, source, divide), operations, price_slot in steps:
+            # Summed left to right, like the published formula.
+            if source is None:
+                value = coef
+            elif divide:
+                value = coef / values[source]
+            else:
+                value = coef * values[source]
+            for coef, source, divide in operations:
+                if source is None:
+                    value = value + coef
+                elif divide:
+                    value = value + coef / values[source]
+                else:
+                    value = value + coef * values[source]
+            if price_slot is not None:
+                if scaled:
+                    value = value * 1e-05 * values[price_slot]
+                else:
+                    value = exp(value) * values[price_slot]
+            values[slot] = value
+            if slot == _VELOCITY:
+                values[_V2] = pow(value, 2)
+        return dict(zip(table.TERMS, values[_FIRST_TERM:]))
+
+    return program
+
+
+# (vehicle, lane, exp, pow) -> program, shared with batch.compute_voc_batch.
+_PROGRAMS: Dict[tuple, Any] = {}
+
+
+def get_program(vehicle: str, lane: str, exp=math.exp, pow=pow):
+    """
+    Memoised compile_program.
+    """
+    key = (vehicle, lane, exp, pow)
+    program = _PROGRAMS.get(key)
+    if program is None:
+        program = _PROGRAMS[key] = compile_program(vehicle, lane, exp, pow)
+    return program
+
+
+# Vehicles whose forms need the power to weight ratio.
+PWR_VEHICLES = frozenset(
+    vehicle
+    for vehicle, lanes in zip(table.VEHICLES, table.TABLE)
+    if any(feature == table.PWR for forms in lanes for form in forms for _, feature in form)
+)
+
+
+def geometry_features(vehicle_input: VehicleInput) -> tuple:
+    """
+    The road geometry features shared by every vehicle type: (RF, RG,
+    RG - 2000, W, RS, FL, RG / W).
+    """
+    W = vehicle_input["carriageway_width"]
+    RG = vehicle_input["rg_roughness_factor"]
+    return (
+        vehicle_input["rf_rise_and_fall_factor"],
+        RG,
+        RG - 2000,
+        W,
+        vehicle_input["rs_rise_factor"],
+        vehicle_input["fl_fall_factor"],
+        RG / W,
+    )
+
+
+def evaluate_terms(vehicle: str, lane: str, features: tuple, pwr=None) -> Dict[str, Any]:
+    """
+    Evaluates every term of one vehicle type on one lane class.
+
+    Args:
+        vehicle (str): Vehicle type (a key of vocCoefficients.MODELS).
+        lane (str): Lane class (one of vocCoefficients.LANES).
+        features (tuple): geometry_features() of the road.
+        pwr (float, optional): Power to weight ratio, for PWR_VEHICLES.
+
+    Returns:
+        dict: {term: value} in vocCoefficients.TERMS order, before the
+              non-negative clamp of build_voc_output.
+
+    Raises:
+        ValueError: If the lane class is unknown or pwr is missing for a
+            vehicle that needs it.
+    """
+    if lane not in _LANE_INDEX:
+        raise ValueError(f"Invalid lane type '{lane}' for {vehicle} vehicle.")
+    if pwr is None and vehicle in PWR_VEHICLES:
+        raise ValueError("Power to weight ratio (pwr) must be provided for HCV vehicles.")
+
+    program = get_program(vehicle, lane)
+    price = IRCSP302019TableC1.vehicle_costs[vehicle]
+    return program(*features, pwr, price[c.ET], price[c.IT])
+
+
+def compute_voc(vehicle: str, vehicle_input: VehicleInput) -> Dict[str, Any]:
+    """
+    VOC model output (build_voc_output) of one vehicle type.
+    """
+    i_lane = vehicle_input["lane_type"]
+    lane = CarriagewayStandards.get_velocity_class(i_lane)
+    values = evaluate_terms(
+        vehicle,
+        lane,
+        geometry_features(vehicle_input),
+        vehicle_input.get("power_weight_ratio_pwr"),
+    )
+    return build_voc_output(vt=vehicle_input["vehicle_type"], i_lane=i_lane, lane=lane, **values)
+
+
+def compute_all(
+    vehicle_types: Iterable[str],
+    vehicle_input: Dict[str, Any],
+    pwr: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    VOC model outputs of several vehicle types on the same road, in one pass:
+    the lane class and geometry features are computed once.
+
+    Args:
+        vehicle_types (iterable): Vehicle types to evaluate.
+        vehicle_input (dict): VehicleInput fields other than vehicle_type
+            and power_weight_ratio_pwr.
+        pwr (dict, optional): {vehicle type: power to weight ratio}.
+
+    Returns:
+        dict: {vehicle type: build_voc_output result}, or a
+              {'status': 'error', 'message'} entry for types without a model.
+    """
+    pwr = pwr or {}
+    features = None
+
+    results = {}
+    for vt in vehicle_types:
+        if vt not in _VEHICLE_INDEX:
+            results[vt] = {"status": "error", "message": f"No model available for '{vt}'."}
+            continue
+        if features is None:
+            i_lane = vehicle_input["lane_type"]
+            lane = CarriagewayStandards.get_velocity_class(i_lane)
+            features = geometry_features(vehicle_input)  # type: ignore[arg-type]
+        values = evaluate_terms(vt, lane, features, pwr.get(vt))
+        results[vt] = build_voc_output(vt=vt, i_lane=i_lane, lane=lane, **values)
+    return results
@@ -26,7 +26,11 @@ def build_voc_output(
 ) -> Dict[str, Any]:
  
     def nn(x):
-        # Helper to ensure non-negative values
+        # Helper to ensure non-negative values (element-wise for NumPy arrays)
+        if hasattr(x, "shape"):
+            import numpy as np
+
+            return np.where(x < 0, 0, x)
         return max(x, 0)
     
     return {
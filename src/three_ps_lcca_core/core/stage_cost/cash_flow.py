@@ -0,0 +1,434 @@
+import math
+from array import array
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .summary import PILLARS, SALVAGE_KEYS, STAGES, flatten_stage_totals
+from .timeline import EventTimeline, build_timeline
+from .utils.present_worth_factor import _round
+
+_NUMPY_MISSING = (
+    "numpy is required for NumPy export. Install it with "
+    "'pip install three_ps_lcca_core[numpy]'."
+)
+
+
+class Category(NamedTuple):
+    stage: str
+    pillar: str
+    item: str
+    kind: str  # event kind that incurs it (see timeline.EVENT_KINDS)
+    amount: float  # cost of one event at today's prices
+    traffic: bool  # road user / vehicular emission cost, rounded to 2 decimals
+
+    @property
+    def name(self) -> str:
+        return f"{self.stage}.{self.pillar}.{self.item}"
+
+
+# Every cost category in stage result order: (stage, pillar, item, event
+# kind, per-event amount (a key of _event_amounts), traffic).
+CATEGORY_LAYOUT = (
+    ("initial_stage", "economic", "initial_construction_cost", "construction", "construction", False),
+    ("initial_stage", "economic", "time_cost_of_loan", "construction", "loan", False),
+    ("initial_stage", "environmental", "initial_material_carbon_emission_cost", "construction", "carbon", False),
+    ("initial_stage", "environmental", "initial_vehicular_emission_cost", "construction", "construction_emission", True),
+    ("initial_stage", "social", "initial_road_user_cost", "construction", "construction_ruc", True),
+    ("use_stage", "economic", "routine_inspection_costs", "routine_inspection", "routine_inspection", False),
+    ("use_stage", "economic", "periodic_maintenance", "periodic_maintenance", "periodic_maintenance", False),
+    ("use_stage", "economic", "major_inspection_costs", "major_inspection", "major_inspection", False),
+    ("use_stage", "economic", "major_repair_cost", "major_repair", "major_repair", False),
+    ("use_stage", "economic", "replacement_costs_for_bearing_and_expansion_joint", "replacement", "replacement", False),
+    ("use_stage", "environmental", "periodic_carbon_costs", "periodic_maintenance", "periodic_carbon", False),
+    ("use_stage", "environmental", "major_repair_material_carbon_emission_costs", "major_repair", "major_repair_carbon", False),
+    ("use_stage", "environmental", "major_repair_vehicular_emission_costs", "major_repair", "major_repair_emission", True),
+    ("use_stage", "environmental", "vehicular_emission_costs_for_replacement_of_bearing_and_expansion_joint",
+     "replacement", "replacement_emission", True),
+    ("use_stage", "social", "major_repair_road_user_costs", "major_repair", "major_repair_ruc", True),
+    ("use_stage", "social", "road_user_costs_for_replacement_of_bearing_and_expansion_joint",
+     "replacement", "replacement_ruc", True),
+    ("reconstruction", "economic", "total_demolition_and_disposal_costs", "demolition", "demolition", False),
+    ("reconstruction", "economic", "cost_of_reconstruction_after_demolition", "reconstruction", "construction", False),
+    ("reconstruction", "economic", "total_scrap_value", "demolition", "scrap", False),
+    ("reconstruction", "economic", "time_cost_of_loan", "reconstruction", "loan", False),
+    ("reconstruction", "environmental", "carbon_costs_demolition_and_disposal", "demolition", "demolition_carbon", False),
+    ("reconstruction", "environmental", "carbon_cost_of_reconstruction_after_demolition", "reconstruction", "carbon", False),
+    ("reconstruction", "environmental", "demolition_vehicular_emission_cost", "demolition", "demolition_emission", True),
+    ("reconstruction", "environmental", "reconstruction_vehicular_emission_cost", "reconstruction",
+     "reconstruction_emission", True),
+    ("reconstruction", "social", "ruc_demolition", "demolition", "demolition_ruc", True),
+    ("reconstruction", "social", "ruc_reconstruction", "reconstruction", "reconstruction_ruc", True),
+    ("end_of_life", "economic", "total_demolition_and_disposal_costs", "final_demolition", "demolition", False),
+    ("end_of_life", "economic", "total_scrap_value", "final_demolition", "scrap", False),
+    ("end_of_life", "environmental", "carbon_costs_demolition_and_disposal", "final_demolition", "demolition_carbon", False),
+    ("end_of_life", "environmental", "demolition_vehicular_emission_cost", "final_demolition", "demolition_emission", True),
+    ("end_of_life", "social", "ruc_demolition", "final_demolition", "demolition_ruc", True),
+)
+
+
+def _disruption_costs(calc, *durations):
+    """
+    (road user cost, vehicular emission cost) at today's prices, unrounded,
+    of each duration (days) of traffic disruption.
+
+    Raises:
+        ValueError: If the road user cost data or the carbon cost parameters
+            are incomplete.
+    """
+    try:
+        daily_ruc = calc.daily_road_user_cost_with_vehicular_emissions["total_daily_ruc"]
+        emission_kg_per_km = calc.daily_road_user_cost_with_vehicular_emissions[
+            "total_carbon_emission"
+        ]["total_emission_kgCO2e"]
+    except KeyError as exc:
+        raise ValueError(f"Missing required road user cost data key: {exc}") from exc
+    try:
+        general = calc.input_params["general"]
+        scc = general["social_cost_of_carbon_per_mtco2e"] / 1000
+        conv_rate = general["currency_conversion"]
+    except KeyError as exc:
+        raise ValueError(f"Missing required input parameter: {exc}") from exc
+
+    return [
+        (daily_ruc * days, emission_kg_per_km * days * scc * conv_rate)
+        for days in durations
+    ]
+
+
+def _event_amounts(calc) -> Dict[str, Any]:
+    """
+    Cost of one event of every kind at today's prices, keyed as in
+    CATEGORY_LAYOUT. This is the one place the per-event costs are defined:
+    the stage cost methods of StageCostCalculator, the lean totals, the cash
+    flow ledger and the vectorized sweep all read them from here. Traffic
+    disruption lasts timeline.closure_days() of the event kind.
+    """
+    params = calc.input_params
+    general = params["general"]
+    use_stage = params["use_stage_cost"]
+    routine = use_stage["routine"]
+    major = use_stage["major"]
+    replacement = use_stage["replacement_costs_for_bearing_and_expansion_joint"]
+    demolition = params["end_of_life_stage_costs"]["demolition_and_disposal"]
+
+    closure_days = calc.timeline.closure_days
+    (
+        (construction_ruc, construction_emission),
+        (repair_ruc, repair_emission),
+        (replacement_ruc, replacement_emission),
+        (demolition_ruc, demolition_emission),
+        (reconstruction_ruc, reconstruction_emission),
+    ) = _disruption_costs(
+        calc,
+        closure_days("construction"),
+        closure_days("major_repair"),
+        closure_days("replacement"),
+        closure_days("demolition"),
+        closure_days("reconstruction"),
+    )
+
+    construction_cost = calc.initial_construction_cost
+    carbon_cost = calc.initial_carbon_cost
+    return {
+        "construction": construction_cost,
+        "loan": (
+            construction_cost
+            * (general["interest_rate_percent"] / 100)
+            * (general["construction_period_months"] / 12)
+            * general["investment_ratio"]
+        ),
+        "carbon": carbon_cost,
+        "construction_ruc": construction_ruc,
+        "construction_emission": construction_emission,
+        "routine_inspection": construction_cost
+        * routine["inspection"]["percentage_of_initial_construction_cost_per_year"]
+        / 100,
+        "periodic_maintenance": construction_cost
+        * routine["maintenance"]["percentage_of_initial_construction_cost_per_year"]
+        / 100,
+        "periodic_carbon": carbon_cost
+        * routine["maintenance"]["percentage_of_initial_carbon_emission_cost"]
+        / 100,
+        "major_inspection": construction_cost
+        * major["inspection"]["percentage_of_initial_construction_cost"]
+        / 100,
+        "major_repair": construction_cost
+        * major["repair"]["percentage_of_initial_construction_cost"]
+        / 100,
+        "major_repair_carbon": carbon_cost
+        * major["repair"]["percentage_of_initial_carbon_emission_cost"]
+        / 100,
+        "major_repair_ruc": repair_ruc,
+        "major_repair_emission": repair_emission,
+        "replacement": (
+            calc.cost_of_super_structure * replacement["percentage_of_super_structure_cost"]
+        )
+        / 100,
+        "replacement_ruc": replacement_ruc,
+        "replacement_emission": replacement_emission,
+        "demolition": (
+            construction_cost * demolition["percentage_of_initial_construction_cost"]
+        )
+        / 100,
+        "demolition_carbon": (
+            carbon_cost * demolition["percentage_of_initial_carbon_emission_cost"]
+        )
+        / 100,
+        "scrap": calc.total_scrap_cost,
+        "demolition_ruc": demolition_ruc,
+        "demolition_emission": demolition_emission,
+        "reconstruction_ruc": reconstruction_ruc,
+        "reconstruction_emission": reconstruction_emission,
+    }
+
+
+def _categories(
+    calc, reconstruction: Optional[bool] = None, plain: bool = False
+) -> List[Category]:
+    """
+    Cost categories of a StageCostCalculator (CATEGORY_LAYOUT) with the
+    per-event amount of each (_event_amounts).
+
+    reconstruction forces the reconstruction categories on or off; by default
+    they exist when the analysis period exceeds the service life. With plain,
+    the categories are plain tuples with the fields of Category, which are
+    cheaper to build.
+    """
+    if reconstruction is None:
+        reconstruction = calc.analysis_period > calc.service_life
+    amounts = _event_amounts(calc)
+    if plain:
+        return [
+            (stage, pillar, item, kind, amounts[amount], traffic)
+            for stage, pillar, item, kind, amount, traffic in CATEGORY_LAYOUT
+            if reconstruction or stage != "reconstruction"
+        ]
+    return [
+        Category(stage, pillar, item, kind, amounts[amount], traffic)
+        for stage, pillar, item, kind, amount, traffic in CATEGORY_LAYOUT
+        if reconstruction or stage != "reconstruction"
+    ]
+
+
+def _category_cost(category: Category, timeline: EventTimeline):
+    """
+    Category amount times the present worth factor of its event kind.
+    """
+    if category.kind == "construction":
+        # The initial stage is not discounted.
+        value = category.amount * 1
+    else:
+        value = category.amount * timeline.pwf(category.kind)
+    if category.traffic:
+        value = _round(value, 2)
+    return value
+
+
+def _stage_costs(categories: List[Category], timeline: EventTimeline) -> Dict[str, Any]:
+    """
+    Stage-wise results: every category amount times the present worth factor
+    of its event kind. Amounts and timeline factors may be NumPy arrays.
+    """
+    results: Dict[str, Any] = {
+        stage: {pillar: {} for pillar in PILLARS} for stage in STAGES
+    }
+    for category in categories:
+        results[category.stage][category.pillar][category.item] = _category_cost(
+            category, timeline
+        )
+
+    if not any(results["reconstruction"].values()):
+        results["reconstruction"] = {
+            "Note": "Analysis period is less than or equal to service life; reconstruction costs are not applicable."
+        }
+    return results
+
+
+def _stage_totals(categories: List[tuple], timeline: EventTimeline) -> Dict[str, float]:
+    """
+    summarize_stage_costs(_stage_costs(categories, timeline)) without the
+    stage-wise dicts: each cost is added to its '<stage>_<pillar>' total in
+    the order of the stage results.
+    """
+    # Same arithmetic as _category_cost, with each event kind's factor
+    # looked up once.
+    factors = {"construction": 1}
+    totals = {stage: {pillar: 0.0 for pillar in PILLARS} for stage in STAGES}
+    for stage, pillar, item, kind, amount, traffic in categories:
+        factor = factors.get(kind)
+        if factor is None:
+            factor = factors[kind] = timeline.pwf(kind)
+        value = amount * factor
+        if traffic:
+            # round() directly for the common float case; _round handles
+            # NumPy scalars.
+            value = round(value, 2) if type(value) is float else _round(value, 2)
+        if item in SALVAGE_KEYS:
+            value = -value
+        totals[stage][pillar] += value
+    return flatten_stage_totals(totals)
+
+
+class CashFlowLedger:
+    """
+    Year-by-year cash flow of one project: one row per year of the analysis
+    period (row y holds the events in [y, y + 1)) and one column per cost
+    category ('<stage>.<pillar>.<item>', as in the stage results).
+
+    Two year x category tables are kept in flat, row-major array('d'):
+
+    - undiscounted: nominal cash flow, amount * (1 + i) ** year,
+    - discounted: present value, amount * ((1 + i) / (1 + d)) ** year.
+
+    Salvage items (stage_cost.summary.SALVAGE_KEYS) are stored as positive
+    amounts, as in the stage results, and deducted by year_totals().
+
+    stage_results() sums the ledger columns into the stage-wise layout of
+    StageCostCalculator. The sums are exact present values, so they differ
+    slightly from the engine's stage results, which discount with present
+    worth factors rounded to 3 decimals and round road user and vehicular
+    emission costs to 2 decimals.
+
+    Example:
+        ledger = calc.cash_flow_ledger()
+        ledger.year_totals()                 # discounted net cost per year
+        ledger.column("use_stage.economic.major_repair_cost")
+        ledger.stage_results()["use_stage"]  # column sums, stage-wise
+    """
+
+    def __init__(self, categories: List[Category], timeline: EventTimeline):
+        self.timeline = timeline
+        self.categories = categories
+        self.columns = [category.name for category in categories]
+        self.years = list(range(int(math.floor(timeline.analysis_period)) + 1))
+
+        n_rows, n_cols = len(self.years), len(categories)
+        self.undiscounted = array("d", bytes(8 * n_rows * n_cols))
+        self.discounted = array("d", bytes(8 * n_rows * n_cols))
+
+        by_kind: Dict[str, list] = {}
+        for col, category in enumerate(categories):
+            by_kind.setdefault(category.kind, []).append((col, category.amount))
+
+        # One pass over the timeline.
+        growth = 1 + timeline.inflation_rate / 100
+        last_row = n_rows - 1
+        for event in timeline:
+            targets = by_kind.get(event.kind)
+            if not targets:
+                continue
+            row = min(int(math.floor(event.year)), last_row)
+            base = row * n_cols
+            inflation = growth**event.year
+            for col, amount in targets:
+                self.undiscounted[base + col] += amount * inflation
+                self.discounted[base + col] += amount * event.factor
+
+    @classmethod
+    def from_calculator(cls, calc, timeline: Optional[EventTimeline] = None) -> "CashFlowLedger":
+        """
+        Builds the ledger of a StageCostCalculator.
+
+        Args:
+            calc (StageCostCalculator): Calculator with stage parameters and
+                construction costs (including daily road user costs).
+            timeline (EventTimeline, optional): Defaults to
+                build_timeline(calc.input_params).
+        """
+        if timeline is None:
+            timeline = build_timeline(calc.input_params)
+        return cls(_categories(calc), timeline)
+
+    # --- Access ---
+
+    def value(self, year: int, name: str, discounted: bool = True) -> float:
+        table = self.discounted if discounted else self.undiscounted
+        return table[year * len(self.columns) + self.columns.index(name)]
+
+    def column(self, name: str, discounted: bool = True) -> List[float]:
+        """
+        Returns:
+            list: The cash flow of one category per year.
+        """
+        table = self.discounted if discounted else self.undiscounted
+        n_cols = len(self.columns)
+        col = self.columns.index(name)
+        return list(table[col::n_cols])
+
+    def year_totals(self, discounted: bool = True) -> List[float]:
+        """
+        Returns:
+            list: Net cost per year (salvage items deducted).
+        """
+        table = self.discounted if discounted else self.undiscounted
+        n_cols = len(self.columns)
+        signs = [
+            -1.0 if category.item in SALVAGE_KEYS else 1.0 for category in self.categories
+        ]
+        return [
+            sum(sign * value for sign, value in zip(signs, table[row * n_cols : (row + 1) * n_cols]))
+            for row in range(len(self.years))
+        ]
+
+    # --- Reductions ---
+
+    def stage_results(self, discounted: bool = True) -> Dict[str, Any]:
+        """
+        Sums every column of the ledger (math.fsum over the years) into the
+        stage-wise layout of StageCostCalculator: initial_stage, use_stage,
+        reconstruction and end_of_life, {pillar: {item: total}}. Salvage
+        items stay positive, as in the stage results.
+        """
+        table = self.discounted if discounted else self.undiscounted
+        n_cols = len(self.columns)
+        results: Dict[str, Any] = {
+            stage: {pillar: {} for pillar in PILLARS} for stage in STAGES
+        }
+        for col, category in enumerate(self.categories):
+            results[category.stage][category.pillar][category.item] = math.fsum(
+                table[col::n_cols]
+            )
+
+        if not any(results["reconstruction"].values()):
+            results["reconstruction"] = {
+                "Note": "Analysis period is less than or equal to service life; reconstruction costs are not applicable."
+            }
+        return results
+
+    # --- Export ---
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-serialisable form: years, columns and both tables as lists of
+        rows.
+        """
+        n_cols = len(self.columns)
+
+        def rows(table):
+            return [list(table[i : i + n_cols]) for i in range(0, len(table), n_cols)]
+
+        return {
+            "years": list(self.years),
+            "columns": list(self.columns),
+            "undiscounted": rows(self.undiscounted),
+            "discounted": rows(self.discounted),
+        }
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Returns:
+            dict: 'undiscounted' and 'discounted' (years x columns) float64
+                  arrays.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        try:
+            import numpy as np
+        except ImportError as exc:
+            raise ImportError(_NUMPY_MISSING) from exc
+
+        shape = (len(self.years), len(self.columns))
+        return {
+            "undiscounted": np.frombuffer(self.undiscounted, dtype=np.float64).reshape(shape).copy(),
+            "discounted": np.frombuffer(self.discounted, dtype=np.float64).reshape(shape).copy(),
+        }
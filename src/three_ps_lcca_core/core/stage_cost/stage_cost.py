@@ -1,9 +1,15 @@
 from typing import Dict, Any, Optional
-from .utils.present_worth_factor import sum_of_present_worth_factor, demolition_spwi
+from .cash_flow import (
+    CashFlowLedger,
+    _categories,
+    _disruption_costs,
+    _event_amounts,
+    _stage_totals,
+)
+from .timeline import EventTimeline
+from .utils.pwf_cache import cached_build_timeline as build_timeline
 from ..utils.dump_to_file import dump_to_file
 
-spwi = sum_of_present_worth_factor
-
 
 class StageCostCalculator:
     def __init__(
@@ -35,6 +41,25 @@ class StageCostCalculator:
         self.days_per_month = general.get("days_per_month")
         self.construction_period_in_yrs = general["construction_period_months"] / 12
 
+        # Present worth factors depend only on input_params, never on
+        # program_inputs, so they are memoised per instance and shared with
+        # calculators created through with_program_inputs().
+        self._pwf_memo: Dict[Any, Dict[str, Any]] = {}
+        self._event_costs: Optional[Dict[str, Any]] = None
+
+    def with_program_inputs(
+        self, program_inputs: Dict[str, Any]
+    ) -> "StageCostCalculator":
+        """
+        Returns a calculator for the same stage parameters but different
+        construction costs (e.g. another design alternative). The new
+        calculator shares this one's present worth factor memo, so factors
+        are computed once across all alternatives.
+        """
+        other = StageCostCalculator(self.input_params, program_inputs, self.debug)
+        other._pwf_memo = self._pwf_memo
+        return other
+
     # ██████╗ ██████╗ ███████╗███████╗███████╗███╗   ██╗████████╗    ██╗    ██╗ ██████╗ ██████╗ ████████╗██╗  ██╗    ███████╗ █████╗  ██████╗████████╗ ██████╗ ██████╗
     # ██╔══██╗██╔══██╗██╔════╝██╔════╝██╔════╝████╗  ██║╚══██╔══╝    ██║    ██║██╔═══██╗██╔══██╗╚══██╔══╝██║  ██║    ██╔════╝██╔══██╗██╔════╝╚══██╔══╝██╔═══██╗██╔══██╗
     # ██████╔╝██████╔╝█████╗  ███████╗█████╗  ██╔██╗ ██║   ██║       ██║ █╗ ██║██║   ██║██████╔╝   ██║   ███████║    █████╗  ███████║██║        ██║   ██║   ██║██████╔╝
@@ -42,40 +67,69 @@ class StageCostCalculator:
     # ██║     ██║  ██║███████╗███████║███████╗██║ ╚████║   ██║       ╚███╔███╔╝╚██████╔╝██║  ██║   ██║   ██║  ██║    ██║     ██║  ██║╚██████╗   ██║   ╚██████╔╝██║  ██║
     # ╚═╝     ╚═╝  ╚═╝╚══════╝╚══════╝╚══════╝╚═╝  ╚═══╝   ╚═╝        ╚══╝╚══╝  ╚═════╝ ╚═╝  ╚═╝   ╚═╝   ╚═╝  ╚═╝    ╚═╝     ╚═╝  ╚═╝ ╚═════╝   ╚═╝    ╚═════╝ ╚═╝  ╚═╝
 
-    def _sum_of_present_worth_factor(self, interval_years: int) -> Dict[str, Any]:
-        result = spwi(
-            inflation_rate=self.inflation_rate,
-            discount_rate=self.discount_rate,
-            analysis_period=self.analysis_period,
-            interval=interval_years,
-            service_life=self.service_life,
-            construction_period=self.construction_period_in_yrs,
-            debug=self.debug,
-        )
+    @property
+    def timeline(self) -> EventTimeline:
+        """
+        The project's event timeline (stage_cost.timeline): every
+        construction, use stage, demolition and reconstruction event with its
+        year, present worth factor and closure days. Built once from
+        input_params and shared by every component.
+        """
+        memo_key = ("timeline",)
+        if memo_key not in self._pwf_memo:
+            self._pwf_memo[memo_key] = build_timeline(self.input_params)
+        return self._pwf_memo[memo_key]
 
-        return {
-            "value": result["total"],
-            "debug": result if self.debug else None,
-        }
+    def _event_cost(self, key: str):
+        """
+        Cost of one event at today's prices, as defined by
+        stage_cost.cash_flow._event_amounts (keys as in CATEGORY_LAYOUT).
+        """
+        if self._event_costs is None:
+            self._event_costs = _event_amounts(self)
+        return self._event_costs[key]
+
+    def _sum_of_present_worth_factor(self, kind: str) -> Dict[str, Any]:
+        memo_key = ("pwf", kind)
+        if memo_key in self._pwf_memo:
+            return self._pwf_memo[memo_key]
+
+        timeline = self.timeline
+        value = timeline.pwf(kind)
+        debug = None
+        if self.debug:
+            debug = {
+                "total": value,
+                "breakdown": {
+                    "year_to_pwf": timeline.year_to_pwf(kind),
+                    "construction_period": self.construction_period_in_yrs,
+                    "service_life": self.service_life,
+                    "interval": timeline.intervals[kind],
+                },
+            }
+
+        self._pwf_memo[memo_key] = {"value": value, "debug": debug}
+        return self._pwf_memo[memo_key]
 
     def _demolition_spwi(self) -> Dict[str, Any]:
-        result = demolition_spwi(
-            inflation_rate=self.inflation_rate,
-            discount_rate=self.discount_rate,
-            analysis_period=self.analysis_period,
-            service_life=self.service_life,
-            construction_period=self.construction_period_in_yrs,
-            demolition_duration_years=self.input_params["end_of_life_stage_costs"][
-                "demolition_and_disposal"
-            ]["duration_for_demolition_and_disposal_in_months"]
-            / 12,
-            debug=self.debug,
-        )
+        memo_key = ("demolition_spwi",)
+        if memo_key in self._pwf_memo:
+            return self._pwf_memo[memo_key]
+
+        timeline = self.timeline
+        result = {
+            "reconstruction_demolition": timeline.pwf("demolition"),
+            "final_demolition": timeline.pwf("final_demolition"),
+        }
+        if self.debug:
+            result["reconstruction_demolition_breakdown"] = timeline.year_to_pwf("demolition")
+            result["final_demolition_breakdown"] = timeline.year_to_pwf("final_demolition")
 
-        return {
+        self._pwf_memo[memo_key] = {
             "values": result,
             "debug": result if self.debug else None,
         }
+        return self._pwf_memo[memo_key]
 
     # ██████╗  ██████╗  █████╗ ██████╗     ██╗   ██╗███████╗███████╗██████╗      ██████╗ ██████╗ ███████╗████████╗
     # ██╔══██╗██╔═══██╗██╔══██╗██╔══██╗    ██║   ██║██╔════╝██╔════╝██╔══██╗    ██╔════╝██╔═══██╗██╔════╝╚══██╔══╝
@@ -94,34 +148,8 @@ class StageCostCalculator:
         Uses `total_daily_ruc` from self.daily_road_user_cost_with_vehicular_emissions to avoid recalculation.
         """
 
-        # Extract daily total RUC
-        try:
-            # type: ignore
-            daily_ruc = self.daily_road_user_cost_with_vehicular_emissions[
-                "total_daily_ruc"
-            ]
-            # type: ignore
-            emission_kg_per_km = self.daily_road_user_cost_with_vehicular_emissions[
-                "total_carbon_emission"
-            ]["total_emission_kgCO2e"]
-        except KeyError as exc:
-            raise ValueError(
-                f"Missing required road user cost data key: {exc}"
-            ) from exc
-
-        # Total RUC for project duration
-        total_ruc = daily_ruc * duration_days
-
-        # Carbon cost
-        try:
-            scc = (
-                self.input_params["general"]["social_cost_of_carbon_per_mtco2e"] / 1000
-            )
-            conv_rate = self.input_params["general"]["currency_conversion"]
-        except KeyError as exc:
-            raise ValueError(f"Missing required input parameter: {exc}") from exc
-
-        total_emission_cost = emission_kg_per_km * duration_days * scc * conv_rate
+        # Total RUC and carbon cost for the disruption duration
+        [(total_ruc, total_emission_cost)] = _disruption_costs(self, duration_days)
 
         # Apply Present Worth Factor (SPWF) if given
         if spwf is not None:
@@ -131,7 +159,9 @@ class StageCostCalculator:
         # Construct debug info
         debug_info = (
             {
-                "daily_ruc": round(daily_ruc, 2),
+                "daily_ruc": round(
+                    self.daily_road_user_cost_with_vehicular_emissions["total_daily_ruc"], 2
+                ),
                 "duration_days": duration_days,
                 "spwf_applied": spwf,
             }
@@ -155,20 +185,14 @@ class StageCostCalculator:
     #    ╚═╝   ╚═╝╚═╝     ╚═╝╚══════╝     ╚═════╝ ╚═════╝ ╚══════╝   ╚═╝       ╚══════╝ ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═══╝
 
     def time_cost_loan(self, spwi=1):
-        interest_rate = self.input_params["general"]["interest_rate_percent"] / 100
-        time_for_construction_years = (
-            self.input_params["general"]["construction_period_months"] / 12
-        )
-        investment_ratio = self.input_params["general"]["investment_ratio"]
-        time_cost_of_loan = (
-            self.initial_construction_cost
-            * interest_rate
-            * time_for_construction_years
-            * investment_ratio
-            * spwi
-        )
+        time_cost_of_loan = self._event_cost("loan") * spwi
 
         if self.debug:
+            interest_rate = self.input_params["general"]["interest_rate_percent"] / 100
+            time_for_construction_years = (
+                self.input_params["general"]["construction_period_months"] / 12
+            )
+            investment_ratio = self.input_params["general"]["investment_ratio"]
             breakdown = {
                 "formulae": {
                     "time_cost_of_loan": "initial_cost_of_construction x interest_rate x time_for_construction_years x investment_ratio x sum_of_present_worth_factor",
@@ -264,10 +288,10 @@ class StageCostCalculator:
         percentage = routine["percentage_of_initial_construction_cost_per_year"]
         interval = routine["interval_in_years"]
 
-        pwf = self._sum_of_present_worth_factor(interval)
+        pwf = self._sum_of_present_worth_factor("routine_inspection")
         present_worth_factor = pwf["value"]
 
-        routine_cost_per_year = self.initial_construction_cost * percentage / 100
+        routine_cost_per_year = self._event_cost("routine_inspection")
 
         total_cost = routine_cost_per_year * present_worth_factor
 
@@ -316,13 +340,11 @@ class StageCostCalculator:
         carbon_percentage = routine["percentage_of_initial_carbon_emission_cost"]
         interval = routine["interval_in_years"]
 
-        spwf = self._sum_of_present_worth_factor(interval)
+        spwf = self._sum_of_present_worth_factor("periodic_maintenance")
 
-        routine_cost_per_year = self.initial_construction_cost * percentage / 100
+        routine_cost_per_year = self._event_cost("periodic_maintenance")
 
-        routine_carbon_cost_per_year = (
-            self.initial_carbon_cost * carbon_percentage / 100
-        )
+        routine_carbon_cost_per_year = self._event_cost("periodic_carbon")
 
         total_cost = routine_cost_per_year * spwf["value"]
         total_carbon_cost = routine_carbon_cost_per_year * spwf["value"]
@@ -382,9 +404,9 @@ class StageCostCalculator:
         inspection_interval = major_inspection[
             "interval_for_repair_and_rehabitation_in_years"
         ]
-        inspection_spwf = self._sum_of_present_worth_factor(inspection_interval)
+        inspection_spwf = self._sum_of_present_worth_factor("major_inspection")
 
-        inspection_cost = self.initial_construction_cost * inspection_percentage / 100
+        inspection_cost = self._event_cost("major_inspection")
         total_inspection_cost = inspection_cost * inspection_spwf["value"]
 
         if self.debug:
@@ -440,15 +462,13 @@ class StageCostCalculator:
         repair_interval = major_repair["interval_for_repair_and_rehabitation_in_years"]
         repair_duration_months = major_repair["repairs_duration_months"]
 
-        repair_spwf = self._sum_of_present_worth_factor(repair_interval)
+        repair_spwf = self._sum_of_present_worth_factor("major_repair")
 
-        repair_cost = self.initial_construction_cost * repair_percentage / 100
+        repair_cost = self._event_cost("major_repair")
 
-        repair_carbon_cost = self.initial_carbon_cost * repair_carbon_percentage / 100
+        repair_carbon_cost = self._event_cost("major_repair_carbon")
 
-        disruption_days = (
-            repair_duration_months * self.input_params["general"]["days_per_month"]
-        )
+        disruption_days = self.timeline.closure_days("major_repair")
 
         road_user_cost_data = self._road_user_cost_and_carbon_emissions_cost(
             duration_days=disruption_days, spwf=repair_spwf["value"]
@@ -531,13 +551,9 @@ class StageCostCalculator:
         interval_for_replacement_in_years = self.input_params["use_stage_cost"][
             "replacement_costs_for_bearing_and_expansion_joint"
         ]["interval_of_replacement_in_years"]
-        duration_of_replacement_in_days = self.input_params["use_stage_cost"][
-            "replacement_costs_for_bearing_and_expansion_joint"
-        ]["duration_of_replacement_in_days"]
-        spwf = self._sum_of_present_worth_factor(interval_for_replacement_in_years)
-        replacement_cost = (
-            cost_of_super_structure * percentage_of_super_structure_cost
-        ) / 100
+        duration_of_replacement_in_days = self.timeline.closure_days("replacement")
+        spwf = self._sum_of_present_worth_factor("replacement")
+        replacement_cost = self._event_cost("replacement")
         total_replacement_cost = replacement_cost * spwf["value"]
         road_user_cost_data = self._road_user_cost_and_carbon_emissions_cost(
             duration_days=duration_of_replacement_in_days, spwf=spwf["value"]
@@ -603,12 +619,8 @@ class StageCostCalculator:
         percentage_of_initial_carbon_emission_cost = self.input_params[
             "end_of_life_stage_costs"
         ]["demolition_and_disposal"]["percentage_of_initial_carbon_emission_cost"]
-        demolition_cost = (
-            self.initial_construction_cost * percentage_of_initial_construction_cost
-        ) / 100
-        demolition_carbon_cost = (
-            self.initial_carbon_cost * percentage_of_initial_carbon_emission_cost
-        ) / 100
+        demolition_cost = self._event_cost("demolition")
+        demolition_carbon_cost = self._event_cost("demolition_carbon")
 
         if self.debug:
             return {
@@ -657,12 +669,7 @@ class StageCostCalculator:
         Returns:
             dict: A dictionary containing the total road user costs and total vehicular emission costs during demolition.
         """
-        duration_of_demolition_in_days = (
-            self.input_params["end_of_life_stage_costs"]["demolition_and_disposal"][
-                "duration_for_demolition_and_disposal_in_months"
-            ]
-            * self.input_params["general"]["days_per_month"]
-        )
+        duration_of_demolition_in_days = self.timeline.closure_days("demolition")
         demolition_road_user_cost_data = self._road_user_cost_and_carbon_emissions_cost(
             duration_days=duration_of_demolition_in_days,
             spwf=demolition_spwi,
@@ -703,7 +710,7 @@ class StageCostCalculator:
             dict: A dictionary containing the initial cost results.
         """
         ruc = self._road_user_cost_and_carbon_emissions_cost(
-            duration_days=self.construction_period_in_yrs * 12 * self.days_per_month,
+            duration_days=self.timeline.closure_days("construction"),
             spwf=1,
         )
         time_cost_loan = self.time_cost_loan()
@@ -782,6 +789,25 @@ class StageCostCalculator:
                 },
             )
 
+        return self._use_stage_summary(
+            routine,
+            periodic_maintenance_and_carbon_costs,
+            major_inspection_costs,
+            repair_cost_summary,
+            replacement_costs_for_bearing_and_expansion_joint,
+        )
+
+    @staticmethod
+    def _use_stage_summary(
+        routine,
+        periodic_maintenance_and_carbon_costs,
+        major_inspection_costs,
+        repair_cost_summary,
+        replacement_costs_for_bearing_and_expansion_joint,
+    ) -> Dict[str, Any]:
+        """
+        Assembles the use stage result from its five component results.
+        """
         return {
             "economic": {
                 "routine_inspection_costs": routine["total"],
@@ -840,11 +866,9 @@ class StageCostCalculator:
                 "Note": "Analysis period is less than or equal to service life; reconstruction costs are not applicable."
             }
 
-        duration_of_reconstruction_in_days = (
-            self.input_params["general"]["construction_period_months"]
-            * self.input_params["general"]["days_per_month"]
-        )
-        demolition_spwi = self._demolition_spwi()["values"]["reconstruction_demolition"]
+        duration_of_reconstruction_in_days = self.timeline.closure_days("reconstruction")
+        demolition_spwi_full = self._demolition_spwi()
+        demolition_spwi = demolition_spwi_full["values"]["reconstruction_demolition"]
         reconstruction = self.construction_costs(
             duration_of_reconstruction_in_days, demolition_spwi
         )
@@ -865,7 +889,7 @@ class StageCostCalculator:
             dump_to_file(
                 "stage_costs_3-Reconstruction_breakdown.json",
                 {
-                    "present_worth_factor_for_demolition": self._demolition_spwi()[
+                    "present_worth_factor_for_demolition": demolition_spwi_full[
                         "debug"
                     ]["reconstruction_demolition_breakdown"],
                     "demolition_and_disposal_breakdown": demolition_and_disposal[
@@ -1024,3 +1048,25 @@ class StageCostCalculator:
                 ],
             },
         }
+
+    def stage_totals(self) -> Dict[str, float]:
+        """
+        Flat stage totals, equal to summarize_stage_costs() of the four stage
+        cost methods above. Computed from the cost categories and the event
+        timeline; no stage result or debug structures are built.
+
+        Returns:
+            dict: '<stage>_<pillar>', '<pillar>' and 'total'.
+        """
+        return _stage_totals(_categories(self, plain=True), self.timeline)
+
+    def cash_flow_ledger(self):
+        """
+        Year-by-year undiscounted and discounted cash flow of every cost
+        category, built in one pass over the project's event timeline.
+
+        Returns:
+            CashFlowLedger: see stage_cost.cash_flow. Its stage_results()
+            are the column sums of the ledger.
+        """
+        return CashFlowLedger.from_calculator(self)
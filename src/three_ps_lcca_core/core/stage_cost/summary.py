@@ -0,0 +1,53 @@
+from typing import Dict, Any
+
+STAGES = ("initial_stage", "use_stage", "reconstruction", "end_of_life")
+PILLARS = ("economic", "environmental", "social")
+
+# Items that represent a salvage value and therefore reduce the life cycle cost.
+SALVAGE_KEYS = ("total_scrap_value",)
+
+
+def summarize_stage_costs(results: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Flattens the stage-wise result of run_full_lcc_analysis into per-stage,
+    per-pillar totals.
+
+    Salvage items (see SALVAGE_KEYS) are deducted. Stages without cost blocks
+    (e.g. reconstruction when the analysis period does not exceed the service
+    life) contribute zero.
+
+    Returns:
+        dict: '<stage>_<pillar>' totals, '<pillar>' totals across stages and
+              the overall 'total'.
+    """
+    stage_totals: Dict[str, Dict[str, float]] = {}
+
+    for stage in STAGES:
+        stage_result = results.get(stage) or {}
+        totals = stage_totals[stage] = {}
+        for pillar in PILLARS:
+            value = 0.0
+            for key, amount in (stage_result.get(pillar) or {}).items():
+                value += -amount if key in SALVAGE_KEYS else amount
+            totals[pillar] = value
+
+    return flatten_stage_totals(stage_totals)
+
+
+def flatten_stage_totals(stage_totals: Dict[str, Dict[str, float]]) -> Dict[str, float]:
+    """
+    Flat record of {stage: {pillar: total}}: '<stage>_<pillar>' totals,
+    '<pillar>' totals across stages and the overall 'total'.
+    """
+    summary: Dict[str, float] = {}
+    pillar_totals = {pillar: 0.0 for pillar in PILLARS}
+
+    for stage in STAGES:
+        for pillar in PILLARS:
+            value = stage_totals[stage][pillar]
+            summary[f"{stage}_{pillar}"] = value
+            pillar_totals[pillar] += value
+
+    summary.update(pillar_totals)
+    summary["total"] = sum(pillar_totals.values())
+    return summary
@@ -0,0 +1,322 @@
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from .utils.present_worth_factor import (
+    _demolition_years,
+    _geometric_sum,
+    _growth_ratio,
+    _maintenance_cycles,
+    _round,
+)
+
+# Event kinds in the order used to break ties between events of the same year.
+EVENT_KINDS = (
+    "construction",
+    "routine_inspection",
+    "periodic_maintenance",
+    "major_inspection",
+    "major_repair",
+    "replacement",
+    "demolition",
+    "reconstruction",
+    "final_demolition",
+)
+
+# Use stage events that repeat every interval within each service life:
+# kind -> (use_stage_cost path, interval key).
+INTERVAL_EVENTS = {
+    "routine_inspection": (("routine", "inspection"), "interval_in_years"),
+    "periodic_maintenance": (("routine", "maintenance"), "interval_in_years"),
+    "major_inspection": (
+        ("major", "inspection"),
+        "interval_for_repair_and_rehabitation_in_years",
+    ),
+    "major_repair": (("major", "repair"), "interval_for_repair_and_rehabitation_in_years"),
+    "replacement": (
+        ("replacement_costs_for_bearing_and_expansion_joint",),
+        "interval_of_replacement_in_years",
+    ),
+}
+
+_KIND_ORDER = {kind: position for position, kind in enumerate(EVENT_KINDS)}
+
+
+class Event(NamedTuple):
+    year: float  # years from the start of construction
+    kind: str
+    factor: float  # present worth factor ((1 + i) / (1 + d)) ** year
+    closure_days: float  # days of traffic disruption, 0 if none
+
+
+class EventTimeline:
+    """
+    Every life cycle event of one project.
+
+    Built once from the stage parameters (see build_timeline). Interval
+    events are stored per life cycle as (first year, count), the few
+    construction and demolition events as explicit years. The present worth
+    factor of an event kind is evaluated like sum_of_present_worth_factor /
+    demolition_spwi: one closed-form geometric sum per life cycle for
+    interval events, rounded to 3 decimals. Individual events (years(),
+    factors(), events, iteration, year_to_pwf) are only enumerated on
+    demand.
+
+    Like sum_of_present_worth_factor, the rates may be NumPy arrays; factors
+    and present worth factors are then arrays of the same shape.
+    """
+
+    def __init__(
+        self,
+        cycles,
+        point_years,
+        inflation_rate,
+        discount_rate,
+        analysis_period,
+        closure_days=None,
+        intervals=None,
+        round_years=True,
+    ):
+        """
+        Args:
+            cycles (dict): {interval event kind: [(first_year, count), ...]},
+                one entry per life cycle (see _maintenance_cycles).
+            point_years (dict): {kind: years} for the other event kinds,
+                years ascending.
+            inflation_rate (float): Inflation rate in percent.
+            discount_rate (float): Discount rate in percent.
+            analysis_period (float): Analysis period in years.
+            closure_days (dict, optional): {kind: days of traffic disruption
+                per event}.
+            intervals (dict, optional): {interval event kind: interval in
+                years}. Required for every kind in cycles.
+            round_years (bool, optional): Event years are rounded to 2
+                decimals before discounting.
+        """
+        self._cycles = {kind: tuple(kind_cycles) for kind, kind_cycles in cycles.items()}
+        self._point_years = {kind: tuple(years) for kind, years in point_years.items()}
+        self.inflation_rate = inflation_rate
+        self.discount_rate = discount_rate
+        self.analysis_period = analysis_period
+        self.round_years = round_years
+        self._closure_days = dict(closure_days or {})
+        self.intervals = dict(intervals or {})  # interval event kind -> years
+        self._r = _growth_ratio(inflation_rate, discount_rate)
+        self._pwf: Dict[str, float] = {}
+        self._schedule: Dict[str, Tuple[tuple, tuple]] = {}
+        self._events: Optional[Tuple[Event, ...]] = None
+
+    def _columns(self, kind: str) -> Tuple[tuple, tuple]:
+        """
+        (years, factors) of every event of kind, in year order.
+        """
+        columns = self._schedule.get(kind)
+        if columns is None:
+            r = self._r
+            if kind in self._cycles:
+                interval = self.intervals[kind]
+                years = [
+                    first_year + j * interval
+                    for first_year, count in self._cycles[kind]
+                    for j in range(count)
+                ]
+                if self.round_years:
+                    years = [round(year, 2) for year in years]
+                factors = [r**year for year in years]
+            elif kind == "construction":
+                # The initial stage is not discounted.
+                years = self._point_years.get(kind, ())
+                factors = [1] * len(years)
+            else:
+                years = self._point_years.get(kind, ())
+                factors = [r**year for year in years]
+            columns = self._schedule[kind] = (tuple(years), tuple(factors))
+        return columns
+
+    @property
+    def events(self) -> Tuple[Event, ...]:
+        """
+        Every event, sorted by year (ties in EVENT_KINDS order).
+        """
+        if self._events is None:
+            events = []
+            for kind in EVENT_KINDS:
+                years, factors = self._columns(kind)
+                days = self.closure_days(kind)
+                events += [
+                    Event(year, kind, factor, days) for year, factor in zip(years, factors)
+                ]
+            events.sort(key=lambda e: (e.year, _KIND_ORDER[e.kind]))
+            self._events = tuple(events)
+        return self._events
+
+    def __len__(self):
+        return sum(
+            count for kind_cycles in self._cycles.values() for _, count in kind_cycles
+        ) + sum(len(years) for years in self._point_years.values())
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def of_kind(self, kind: str) -> Tuple[Event, ...]:
+        years, factors = self._columns(kind)
+        days = self.closure_days(kind)
+        return tuple(Event(year, kind, factor, days) for year, factor in zip(years, factors))
+
+    def years(self, kind: str) -> list:
+        return list(self._columns(kind)[0])
+
+    def factors(self, kind: str) -> list:
+        return list(self._columns(kind)[1])
+
+    def closure_days(self, kind: str) -> float:
+        """
+        Traffic disruption of one event of this kind (0 if it has none).
+        """
+        return self._closure_days.get(kind, 0)
+
+    def pwf(self, kind: str) -> float:
+        """
+        Sum of present worth factors of all events of kind, rounded to 3
+        decimals. Interval events are summed in closed form per life cycle,
+        without enumerating them.
+        """
+        value = self._pwf.get(kind)
+        if value is None:
+            total = 0.0
+            if kind in self._cycles:
+                interval = self.intervals[kind]
+                for first_year, count in self._cycles[kind]:
+                    total = total + _geometric_sum(self._r, first_year, interval, count)
+            else:
+                for factor in self._columns(kind)[1]:
+                    total += factor
+            value = self._pwf[kind] = _round(total, 3)
+        return value
+
+    def year_to_pwf(self, kind: str) -> Dict[float, float]:
+        """
+        Present worth factor of every event of kind, rounded to 3 decimals.
+        """
+        years, factors = self._columns(kind)
+        return {year: _round(factor, 3) for year, factor in zip(years, factors)}
+
+    def to_list(self) -> list:
+        """
+        Returns:
+            list: One {'year', 'kind', 'factor', 'closure_days'} dict per
+                  event, for inspection or debug dumps.
+        """
+        return [event._asdict() for event in self.events]
+
+
+def build_timeline(input_params: Dict[str, Any], round_years: bool = True) -> EventTimeline:
+    """
+    Builds the event timeline of one project from the stage cost parameters
+    (the input_params of StageCostCalculator).
+
+    Event years follow sum_of_present_worth_factor and demolition_spwi: use
+    stage events every interval after the end of each construction period,
+    demolition and reconstruction at the end of every service life that
+    completes within the analysis period, and the final demolition at the
+    end of the analysis period. Only the life cycles are computed here; the
+    cost is proportional to the number of cycles, not of events.
+
+    Args:
+        input_params (dict): 'general', 'use_stage_cost' and
+            'end_of_life_stage_costs' parameters.
+        round_years (bool, optional): Round event years to 2 decimals before
+            discounting (the engine default).
+
+    Returns:
+        EventTimeline
+    """
+    general = input_params["general"]
+    use_stage = input_params["use_stage_cost"]
+    demolition = input_params["end_of_life_stage_costs"]["demolition_and_disposal"]
+
+    analysis_period = general["analysis_period_years"]
+    service_life = general["service_life_years"]
+    days_per_month = general["days_per_month"]
+    construction_period = general["construction_period_months"] / 12
+
+    closure = {
+        "construction": construction_period * 12 * days_per_month,
+        "major_repair": use_stage["major"]["repair"]["repairs_duration_months"]
+        * days_per_month,
+        "replacement": use_stage["replacement_costs_for_bearing_and_expansion_joint"][
+            "duration_of_replacement_in_days"
+        ],
+        "demolition": demolition["duration_for_demolition_and_disposal_in_months"]
+        * days_per_month,
+        "reconstruction": general["construction_period_months"] * days_per_month,
+    }
+    closure["final_demolition"] = closure["demolition"]
+
+    intervals = _intervals(use_stage)
+    cycles = {
+        kind: list(
+            _maintenance_cycles(
+                analysis_period, interval, service_life, construction_period, round_years
+            )
+        )
+        for kind, interval in intervals.items()
+    }
+
+    reconstruction_years, final_year = _demolition_years(
+        analysis_period,
+        service_life,
+        construction_period,
+        demolition["duration_for_demolition_and_disposal_in_months"] / 12,
+        round_years,
+    )
+    point_years = {
+        "construction": [0],
+        "demolition": reconstruction_years,
+        "reconstruction": reconstruction_years,
+        "final_demolition": [final_year],
+    }
+
+    return EventTimeline(
+        cycles,
+        point_years,
+        general["inflation_rate_percent"],
+        general["discount_rate_percent"],
+        analysis_period,
+        closure_days=closure,
+        intervals=intervals,
+        round_years=round_years,
+    )
+
+
+def _intervals(use_stage: Dict[str, Any]) -> Dict[str, Any]:
+    intervals = {}
+    for kind, (path, interval_key) in INTERVAL_EVENTS.items():
+        params = use_stage
+        for key in path:
+            params = params[key]
+        intervals[kind] = params[interval_key]
+    return intervals
+
+
+def timeline_key(input_params: Dict[str, Any], round_years: bool = True) -> tuple:
+    """
+    Every input build_timeline reads, as a hashable tuple: two parameter sets
+    with the same key have the same timeline.
+    """
+    general = input_params["general"]
+    use_stage = input_params["use_stage_cost"]
+    demolition = input_params["end_of_life_stage_costs"]["demolition_and_disposal"]
+    return (
+        general["analysis_period_years"],
+        general["service_life_years"],
+        general["construction_period_months"],
+        general["days_per_month"],
+        general["inflation_rate_percent"],
+        general["discount_rate_percent"],
+        tuple(_intervals(use_stage).values()),
+        use_stage["major"]["repair"]["repairs_duration_months"],
+        use_stage["replacement_costs_for_bearing_and_expansion_joint"][
+            "duration_of_replacement_in_days"
+        ],
+        demolition["duration_for_demolition_and_disposal_in_months"],
+        round_years,
+    )
@@ -1,68 +1,127 @@
-def sum_of_present_worth_factor(
-    inflation_rate,
-    discount_rate,
-    analysis_period,
-    interval,
-    service_life,
-    construction_period=0,
-    debug=False
-):
+import math
+
+# The sums below are evaluated as closed-form geometric series, one per
+# life cycle, instead of walking every interval year:
+#
+#     sum_{j=0}^{n-1} r**(y0 + j*k) = r**y0 * (r**(n*k) - 1) / (r**k - 1)
+#
+# written with log/expm1 so it stays accurate when r is close to 1
+# (inflation ~ discount) and degrades gracefully to n * r**y0 when r == 1.
+#
+# Rates may be scalars or NumPy arrays; with arrays every returned total is an
+# array of the same shape, so the functions can be used inside vectorized
+# callers. Years, intervals and periods stay scalar.
+
+
+def _is_array(value):
+    return hasattr(value, "shape")
+
+
+def _round(value, ndigits):
+    if _is_array(value) and value.ndim:
+        import numpy as np
+
+        # ndarray.round rounds value * 10**ndigits, which can land on the
+        # other side of a halfway case than round(). Those few elements are
+        # rounded with round() so arrays match the scalar engine exactly.
+        rounded = value.round(ndigits)
+        scaled = np.abs(value * 10.0**ndigits)
+        near_half = np.abs(scaled - np.floor(scaled) - 0.5) <= 1e-9 + 4e-16 * scaled
+        if near_half.any():
+            rounded[near_half] = [round(v, ndigits) for v in value[near_half].tolist()]
+        return rounded
+    if _is_array(value):
+        return round(value.item(), ndigits)
+    return round(value, ndigits)
+
+
+def _growth_ratio(inflation_rate, discount_rate):
     i = inflation_rate / 100
     d = discount_rate / 100
-    r = (1 + i) / (1 + d)
+    return (1 + i) / (1 + d)
 
-    years = []
-    factors = []
 
-    cycle_length = construction_period + service_life
-    cycle_start = 0
+def _geometric_sum(r, first_year, step, count):
+    """
+    Sum of r**(first_year + j*step) for j = 0 .. count-1.
+    """
+    if count <= 0:
+        return 0.0
 
-    while cycle_start < analysis_period:
-        op_start = cycle_start + construction_period
+    if _is_array(r):
+        import numpy as np
 
-        for age in range(interval, service_life, interval):
-            year = op_start + age
+        log_r = np.log(r)
+        head = np.exp(first_year * log_r)
+        step_log = step * log_r
+        flat = step_log == 0
+        ratio = np.expm1(count * step_log) / np.where(flat, 1.0, np.expm1(step_log))
+        return head * np.where(flat, count, ratio)
 
-            if year >= analysis_period:
-                break
+    head = r**first_year
+    if count == 1:
+        return head
 
-            # Round year to 2 decimal places BEFORE calculating PWI
-            year = round(year, 2)
+    step_log = step * math.log(r)
+    if step_log == 0:
+        return head * count
+    return head * math.expm1(count * step_log) / math.expm1(step_log)
 
-            years.append(year)
-            factors.append(r ** year)
 
-        cycle_start += cycle_length
+def _terms_in_period(op_start, interval, analysis_period, limit):
+    """
+    Number of j in 1..limit with op_start + j*interval < analysis_period.
+    """
+    n = math.ceil((analysis_period - op_start) / interval) - 1
+    n = max(0, min(n, limit))
 
-    total = sum(factors)
+    # Step across the boundary exactly as the year-by-year comparison would.
+    while n > 0 and op_start + n * interval >= analysis_period:
+        n -= 1
+    while n < limit and op_start + (n + 1) * interval < analysis_period:
+        n += 1
+    return n
 
-    if debug:
-        return {
-            "total": round(total, 3),
-            "breakdown": {
-                "year_to_pwf": {y: round(p, 3) for y, p in zip(years, factors)},
-                "construction_period": construction_period,
-                "service_life": service_life,
-                "interval": interval
-            }
-        }
 
-    return {"total": round(total, 3)}
+def _maintenance_cycles(
+    analysis_period, interval, service_life, construction_period, round_years
+):
+    """
+    Yields (first_year, count) for every life cycle: the year of the first
+    interval event and the number of events that fall inside the analysis
+    period.
+    """
+    events_per_life = len(range(interval, service_life, interval))
 
+    cycle_length = construction_period + service_life
+    cycle_start = 0
 
-def demolition_spwi(
-    inflation_rate,
-    discount_rate,
+    while cycle_start < analysis_period:
+        op_start = cycle_start + construction_period
+
+        count = _terms_in_period(op_start, interval, analysis_period, events_per_life)
+        if count:
+            first_year = op_start + interval
+            if round_years:
+                # Round year to 2 decimal places BEFORE calculating PWI
+                first_year = round(first_year, 2)
+            yield first_year, count
+
+        cycle_start += cycle_length
+
+
+def _demolition_years(
     analysis_period,
     service_life,
-    construction_period=0,
-    demolition_duration_years=0,
-    debug=False
+    construction_period,
+    demolition_duration_years,
+    round_years,
 ):
-    i = inflation_rate / 100
-    d = discount_rate / 100
-    r = (1 + i) / (1 + d)
-
+    """
+    Returns (reconstruction_years, final_year): the demolition year of every
+    service life that completes within the analysis period, and the year of
+    the final demolition.
+    """
     cycle_length = construction_period + service_life
     cycle_start = 0
 
@@ -77,28 +136,119 @@ def demolition_spwi(
         )
 
         if demolition_year < analysis_period:
-            # Round year to 2 decimal places BEFORE calculating PWI
-            demolition_year = round(demolition_year, 2)
+            if round_years:
+                # Round year to 2 decimal places BEFORE calculating PWI
+                demolition_year = round(demolition_year, 2)
             reconstruction_years.append(demolition_year)
 
         cycle_start += cycle_length
 
-    final_year = round(analysis_period, 2)
+    final_year = round(analysis_period, 2) if round_years else analysis_period
+    return reconstruction_years, final_year
+
+
+def sum_of_present_worth_factor(
+    inflation_rate,
+    discount_rate,
+    analysis_period,
+    interval,
+    service_life,
+    construction_period=0,
+    debug=False,
+    round_years=True,
+):
+    """
+    Sum of present worth factors of an event repeating every `interval` years
+    within each service life, over all life cycles in the analysis period.
+
+    Args:
+        inflation_rate (float | ndarray): Inflation rate in percent.
+        discount_rate (float | ndarray): Discount rate in percent.
+        analysis_period (float): Analysis period in years.
+        interval (int): Event interval in years.
+        service_life (int): Service life in years.
+        construction_period (float, optional): Construction period in years.
+        debug (bool, optional): If True, adds a year-wise breakdown.
+        round_years (bool, optional): Compatibility flag. If True (default),
+            event years are rounded to 2 decimals before discounting, as in
+            earlier releases. Set to False to discount the exact years.
+
+    Returns:
+        dict: {"total": ...} rounded to 3 decimals, plus "breakdown" in debug.
+    """
+    r = _growth_ratio(inflation_rate, discount_rate)
+
+    cycles = list(
+        _maintenance_cycles(
+            analysis_period, interval, service_life, construction_period, round_years
+        )
+    )
+
+    total = 0.0
+    for first_year, count in cycles:
+        total = total + _geometric_sum(r, first_year, interval, count)
+
+    if debug:
+        years = [
+            round(year, 2) if round_years else year
+            for first_year, count in cycles
+            for year in (first_year + j * interval for j in range(count))
+        ]
+        return {
+            "total": _round(total, 3),
+            "breakdown": {
+                "year_to_pwf": {y: _round(r**y, 3) for y in years},
+                "construction_period": construction_period,
+                "service_life": service_life,
+                "interval": interval
+            }
+        }
+
+    return {"total": _round(total, 3)}
+
+
+def demolition_spwi(
+    inflation_rate,
+    discount_rate,
+    analysis_period,
+    service_life,
+    construction_period=0,
+    demolition_duration_years=0,
+    debug=False,
+    round_years=True,
+):
+    """
+    Present worth factors of demolition at the end of every service life that
+    completes within the analysis period, and of the final demolition at the
+    end of the analysis period.
+
+    Accepts the same scalar or array-valued rates and the same round_years
+    compatibility flag as sum_of_present_worth_factor.
+    """
+    r = _growth_ratio(inflation_rate, discount_rate)
+
+    reconstruction_years, final_year = _demolition_years(
+        analysis_period,
+        service_life,
+        construction_period,
+        demolition_duration_years,
+        round_years,
+    )
 
     reconstruction_pwi = {year: r ** year for year in reconstruction_years}
     final_pwi = {final_year: r ** final_year}
 
     if debug:
         return {
-            "reconstruction_demolition": round(sum(reconstruction_pwi.values()), 3),
-            "final_demolition": round(final_pwi[final_year], 3),
+            "reconstruction_demolition": _round(sum(reconstruction_pwi.values()), 3),
+            "final_demolition": _round(final_pwi[final_year], 3),
             "reconstruction_demolition_breakdown": {
-                y: round(p, 3) for y, p in reconstruction_pwi.items()
+                y: _round(p, 3) for y, p in reconstruction_pwi.items()
             },
-            "final_demolition_breakdown": {final_year: round(final_pwi[final_year], 3)}
+            "final_demolition_breakdown": {final_year: _round(final_pwi[final_year], 3)}
         }
 
     return {
-        "reconstruction_demolition": round(sum(reconstruction_pwi.values()), 3),
-        "final_demolition": round(final_pwi[final_year], 3)
+        "reconstruction_demolition": _round(sum(reconstruction_pwi.values()), 3),
+        "final_demolition": _round(final_pwi[final_year], 3)
     }
@@ -0,0 +1,41 @@
+from ...utils.lru_cache import LRUCache
+from ..timeline import build_timeline, timeline_key
+
+DEFAULT_MAXSIZE = 4096
+
+# Process-wide cache shared by every StageCostCalculator. Each worker process
+# of a batch run holds its own copy.
+_cache = LRUCache(DEFAULT_MAXSIZE)
+
+
+def cached_build_timeline(input_params, round_years=True):
+    """
+    Memoised build_timeline, keyed by timeline_key. The timeline is shared,
+    not copied: EventTimeline is read-only.
+    """
+    return _cache.get_or_compute(
+        ("timeline",) + timeline_key(input_params, round_years),
+        lambda: build_timeline(input_params, round_years),
+        copy_value=False,
+    )
+
+
+def pwf_cache_stats() -> dict:
+    """
+    Hit/miss/eviction statistics of the process-wide cache. See LRUCache.stats.
+    """
+    return _cache.stats()
+
+
+def clear_pwf_cache() -> None:
+    """
+    Empties the process-wide cache and resets its statistics.
+    """
+    _cache.clear()
+
+
+def set_pwf_cache_size(maxsize: int) -> None:
+    """
+    Resizes the process-wide cache. maxsize=0 disables caching.
+    """
+    _cache.resize(maxsize)
@@ -0,0 +1,177 @@
+from typing import Any, Dict
+
+from .cash_flow import _categories, _stage_costs
+from .stage_cost import StageCostCalculator
+from .summary import summarize_stage_costs
+
+_NUMPY_MISSING = (
+    "numpy is required for VectorizedStageCostCalculator. Install it with "
+    "'pip install three_ps_lcca_core[numpy]'."
+)
+
+# 'general' parameters that may be given as arrays.
+VECTOR_PARAMS = (
+    "discount_rate_percent",
+    "inflation_rate_percent",
+    "service_life_years",
+    "analysis_period_years",
+    "interest_rate_percent",
+)
+
+# Construction cost inputs that may be given as arrays.
+VECTOR_COSTS = (
+    "initial_construction_cost",
+    "initial_carbon_emissions_cost",
+    "superstructure_construction_cost",
+    "total_scrap_value",
+)
+
+# Parameters that change the event years; points are grouped by them.
+_SCHEDULE_PARAMS = ("service_life_years", "analysis_period_years")
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(_NUMPY_MISSING) from exc
+    return numpy
+
+
+class VectorizedStageCostCalculator:
+    """
+    Stage costs of many points of a parameter sweep at once.
+
+    Takes the same input_params and program_inputs as StageCostCalculator,
+    but any of VECTOR_PARAMS (in input_params['general']) and VECTOR_COSTS
+    (in program_inputs) may be array-like. Arrays are broadcast against each
+    other; every result is an array of the broadcast shape, whose element
+    [k] is the scalar engine's result for point k.
+
+    Points are grouped by service life and analysis period, which fix the
+    event years. Each group is one event timeline (stage_cost.timeline) over
+    array-valued rates, so a sweep costs one array operation per event and
+    cost category instead of one StageCostCalculator per point.
+
+    Requires numpy (pip install three_ps_lcca_core[numpy]).
+
+    Example:
+        general = dict(stage_params["general"])
+        general["discount_rate_percent"] = np.linspace(4, 12, 100)[:, None]
+        general["inflation_rate_percent"] = np.linspace(2, 8, 100)[None, :]
+        sweep = VectorizedStageCostCalculator(
+            {**stage_params, "general": general}, program_inputs
+        )
+        sweep.summary()["total"]     # (100, 100) array
+    """
+
+    def __init__(self, input_params: Dict[str, Any], program_inputs: Dict[str, Any]):
+        """
+        Args:
+            input_params (dict): Stage cost parameters ('general',
+                'use_stage_cost', 'end_of_life_stage_costs').
+            program_inputs (dict): Construction costs and
+                'daily_road_user_cost_with_vehicular_emissions'.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If the arrays cannot be broadcast together.
+        """
+        np = _numpy()
+        general = input_params["general"]
+
+        vector_inputs = {("general", key): general[key] for key in VECTOR_PARAMS}
+        vector_inputs.update(
+            {("costs", key): program_inputs[key] for key in VECTOR_COSTS}
+        )
+        try:
+            arrays = np.broadcast_arrays(*(np.asarray(v) for v in vector_inputs.values()))
+        except ValueError as exc:
+            raise ValueError(f"Sweep parameters cannot be broadcast together: {exc}") from exc
+
+        self.input_params = input_params
+        self.program_inputs = program_inputs
+        self.shape = arrays[0].shape if arrays else ()
+        self._points = {
+            name: array.reshape(-1) for name, array in zip(vector_inputs, arrays)
+        }
+        self._results = None
+
+    @property
+    def size(self) -> int:
+        return int(_numpy().prod(self.shape, dtype=int))
+
+    def stage_results(self) -> Dict[str, Any]:
+        """
+        Returns:
+            dict: {stage: {pillar: {item: array}}}, the items of
+                  StageCostCalculator's initial_cost_calculator,
+                  use_stage_cost_calculator, reconstruction and
+                  end_of_life_stage_costs. Reconstruction items are 0 where
+                  the analysis period does not exceed the service life.
+        """
+        if self._results is None:
+            self._results = self._evaluate()
+        return self._results
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Returns:
+            dict: summarize_stage_costs of stage_results(): '<stage>_<pillar>',
+                  '<pillar>' and 'total' arrays.
+        """
+        return summarize_stage_costs(self.stage_results())
+
+    # --- Internals ---
+
+    def _evaluate(self):
+        np = _numpy()
+        n = self.size
+        schedule = np.column_stack(
+            [self._points[("general", key)] for key in _SCHEDULE_PARAMS]
+        ).reshape(n, len(_SCHEDULE_PARAMS))
+        groups, inverse = np.unique(schedule, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+
+        out: Dict[str, Any] = {}
+        for g in range(len(groups)):
+            index = np.nonzero(inverse == g)[0]
+            # Taken from the input arrays, not the stacked copy, to keep
+            # integer service lives integers.
+            first = index[0]
+            results = self._evaluate_group(
+                index,
+                {key: self._points[("general", key)][first].item() for key in _SCHEDULE_PARAMS},
+            )
+            for stage, pillars in results.items():
+                for pillar, items in pillars.items():
+                    for item, value in items.items():
+                        target = out.setdefault(stage, {}).setdefault(pillar, {})
+                        if item not in target:
+                            target[item] = np.empty(n)
+                        target[item][index] = value
+
+        return {
+            stage: {
+                pillar: {item: values.reshape(self.shape) for item, values in items.items()}
+                for pillar, items in pillars.items()
+            }
+            for stage, pillars in out.items()
+        }
+
+    def _evaluate_group(self, index, schedule):
+        general = dict(self.input_params["general"])
+        costs = dict(self.program_inputs)
+        for (section, key), values in self._points.items():
+            target = general if section == "general" else costs
+            target[key] = values[index]
+        general.update(schedule)
+
+        input_params = dict(self.input_params, general=general)
+        # StageCostCalculator only stores the arrays; the cost categories and
+        # timeline evaluate them element-wise.
+        calc = StageCostCalculator(input_params, costs)
+        # Reconstruction items are kept for every group (they are 0 when no
+        # service life ends within the analysis period) so all points share
+        # one result layout.
+        return _stage_costs(_categories(calc, reconstruction=True), calc.timeline)
@@ -0,0 +1,87 @@
+import dataclasses
+import hashlib
+import json
+
+
+def canonicalize(data):
+    """
+    Normalises an input structure so that inputs which differ only in form
+    compare equal:
+
+    - InputMetaData / InputGlobalMetaData / WPIMetaData (any dataclass) are
+      converted to dicts,
+    - tuples become lists.
+
+    Scalars are returned unchanged. In particular 7 and 7.0 stay distinct:
+    the input validators check types (e.g. a WPI year must be an int), so
+    two inputs that differ only in int-vs-float form may not both be valid.
+
+    Key order is preserved; canonical_json() sorts keys when serialising.
+    """
+    if dataclasses.is_dataclass(data) and not isinstance(data, type):
+        data = data.to_dict() if hasattr(data, "to_dict") else dataclasses.asdict(data)
+
+    if isinstance(data, dict):
+        return {key: canonicalize(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [canonicalize(value) for value in data]
+    return data
+
+
+def canonical_json(data) -> str:
+    """
+    Serialises data to a deterministic JSON string: keys sorted, no
+    insignificant whitespace.
+    """
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), allow_nan=True)
+
+
+def digest(data) -> str:
+    """
+    SHA-256 hex digest of the canonical form of data.
+    """
+    payload = canonical_json(canonicalize(data))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def wpi_vehicle_order(wpi):
+    """
+    Vehicle names of wpi['WPI'] in insertion order, or None if there is no
+    such block.
+
+    canonical_json() sorts keys, but the order of the WPI vehicles is part
+    of its content: accident human cost uses the first vehicle's factors.
+    Digests of a WPI therefore include this list.
+    """
+    block = canonicalize(wpi)
+    try:
+        return list(block["WPI"])
+    except (KeyError, TypeError):
+        return None
+
+
+def input_digest(input_data, construction_costs=None, wpi=None) -> str:
+    """
+    Content address of one project: equal for inputs that differ only in
+    key order or dict-vs-dataclass form. The order
+    of the WPI vehicles is kept (see wpi_vehicle_order).
+
+    Args:
+        input_data (dict | InputMetaData | InputGlobalMetaData): Project input.
+        construction_costs (dict, optional): Initial construction costs.
+        wpi (dict | WPIMetaData, optional): Wholesale price index.
+
+    Returns:
+        str: SHA-256 hex digest.
+
+    Raises:
+        TypeError: If the inputs contain values that are not JSON serialisable.
+    """
+    return digest(
+        {
+            "input_data": input_data,
+            "construction_costs": construction_costs,
+            "wpi": wpi,
+            "wpi_vehicle_order": wpi_vehicle_order(wpi),
+        }
+    )
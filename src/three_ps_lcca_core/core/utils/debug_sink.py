@@ -0,0 +1,309 @@
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Sink used by dump_to_file() in the current context. None keeps the
+# historical behaviour: pretty-printed JSON under ./debug in the CWD.
+_active_sink = ContextVar("three_ps_lcca_debug_sink", default=None)
+
+# Tells the BackgroundDebugWriter thread to exit.
+_STOP = object()
+
+
+def _snapshot(data):
+    """
+    Copy of the dict / list / tuple containers of data; the leaves (numbers,
+    strings, ...) are immutable and shared.
+    """
+    if isinstance(data, dict):
+        return {key: _snapshot(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_snapshot(value) for value in data]
+    return data
+
+
+class DebugSink:
+    """
+    Destination of the engine's debug dumps (see utils.dump_to_file).
+
+    Subclasses implement write(); flush() and close() are optional.
+    """
+
+    def write(self, name, data):
+        """
+        Args:
+            name (str): Dump name, e.g. 'ruc-voc-1-Base.json'.
+            data (any): JSON-serialisable payload.
+        """
+        raise NotImplementedError
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class NullSink(DebugSink):
+    """
+    Discards every dump. Runs debug-mode code paths without any I/O.
+    """
+
+    def write(self, name, data):
+        pass
+
+
+class MemorySink(DebugSink):
+    """
+    Collects dumps in memory, keyed by name.
+
+    Each payload is stored as it would read back from the JSON file (a
+    json round-trip), so later mutations of engine structures do not leak
+    into the collected dumps.
+
+    Example:
+        sink = MemorySink()
+        run_full_lcc_analysis(..., debug=True, debug_sink=sink)
+        sink.dumps["A0_Validation_report.json"]
+    """
+
+    def __init__(self):
+        self.dumps = {}
+
+    def write(self, name, data):
+        self.dumps[name] = json.loads(json.dumps(data))
+
+    def get(self, name, default=None):
+        return self.dumps.get(name, default)
+
+    def names(self):
+        return list(self.dumps)
+
+
+class DirectorySink(DebugSink):
+    """
+    Writes each dump to '<path>/<name>' as JSON.
+
+    Use DirectorySink.per_run() to give every run its own directory so
+    concurrent debug runs do not overwrite each other's files.
+    """
+
+    def __init__(self, path="debug", indent=4, compact=False):
+        """
+        Args:
+            path (str, optional): Target directory, created on first write.
+            indent (int | None, optional): json.dump indent.
+            compact (bool, optional): If True, write JSON without indentation
+                or insignificant whitespace (overrides indent).
+        """
+        self.path = path
+        self.indent = None if compact else indent
+        self.separators = (",", ":") if compact else None
+
+    @classmethod
+    def per_run(cls, root="debug", run_id=None, indent=4, compact=False):
+        """
+        Sink writing to a fresh '<root>/<run_id>' directory.
+
+        Args:
+            root (str, optional): Parent directory.
+            run_id (str, optional): Directory name. Defaults to a UTC
+                timestamp followed by a short random suffix.
+            indent (int | None, optional): json.dump indent.
+            compact (bool, optional): Write compact JSON.
+
+        Returns:
+            DirectorySink
+        """
+        if run_id is None:
+            run_id = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime()) + "-" + uuid.uuid4().hex[:8]
+        return cls(os.path.join(root, run_id), indent=indent, compact=compact)
+
+    def write(self, name, data):
+        text = json.dumps(data, indent=self.indent, separators=self.separators)
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, name), "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+class BackgroundDebugWriter(DebugSink):
+    """
+    Hands dumps to a background thread that serialises and writes them
+    through another sink, keeping json encoding and disk I/O off the
+    engine's hot path.
+
+    The queue is bounded. When it is full, write() drops the dump (counted
+    in stats()['dropped']) unless block=True. Pending dumps are flushed on
+    close(), on leaving a with-block and at interpreter exit.
+
+    write() only copies the containers of each payload on the calling
+    thread, so later changes to the dumped objects, e.g. a caller reusing
+    its input dicts, do not reach the dump. The sink serialises the copy
+    once, on the writer thread. A dump that the sink fails to write (e.g.
+    a payload that is not JSON-serialisable) is counted in
+    stats()['errors'] and the exception is kept in last_error; the
+    remaining dumps are still written.
+
+    Example:
+        with BackgroundDebugWriter(DirectorySink.per_run(compact=True)) as sink:
+            run_full_lcc_analysis(..., debug=True, debug_sink=sink)
+        sink.stats()  # {'queue_depth': 0, 'written': 15, 'dropped': 0, ...}
+    """
+
+    def __init__(self, sink=None, maxsize=256, block=False):
+        """
+        Args:
+            sink (DebugSink, optional): Sink that performs the writes.
+                Defaults to DirectorySink('debug').
+            maxsize (int, optional): Queue bound (number of dumps).
+            block (bool, optional): If True, write() waits for queue space
+                instead of dropping the dump.
+
+        Raises:
+            ValueError: If maxsize < 1.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1.")
+        self.sink = sink if sink is not None else DirectorySink()
+        self.maxsize = maxsize
+        self.block = block
+
+        self._queue = queue.Queue(maxsize)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+        self._stats = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "errors": 0,
+            "max_queue_depth": 0,
+        }
+        self.last_error = None
+
+    def _start(self):
+        self._thread = threading.Thread(
+            target=self._worker, name="lcca-debug-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                name, data = item
+                try:
+                    self.sink.write(name, data)
+                except Exception as exc:
+                    with self._lock:
+                        self._stats["errors"] += 1
+                    self.last_error = exc
+                else:
+                    with self._lock:
+                        self._stats["written"] += 1
+            finally:
+                self._queue.task_done()
+
+    def write(self, name, data):
+        with self._lock:
+            if self._closed:
+                raise ValueError("BackgroundDebugWriter is closed.")
+            if self._thread is None:
+                self._start()
+
+        try:
+            self._queue.put((name, _snapshot(data)), block=self.block)
+        except queue.Full:
+            with self._lock:
+                self._stats["dropped"] += 1
+            return
+
+        with self._lock:
+            self._stats["enqueued"] += 1
+            depth = self._queue.qsize()
+            if depth > self._stats["max_queue_depth"]:
+                self._stats["max_queue_depth"] = depth
+
+    def flush(self):
+        """
+        Blocks until every queued dump has been written.
+        """
+        if self._thread is not None:
+            self._queue.join()
+        self.sink.flush()
+
+    def close(self):
+        """
+        Flushes pending dumps and stops the writer thread. Idempotent.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+            atexit.unregister(self.close)
+        self.sink.close()
+
+    def stats(self):
+        """
+        Returns:
+            dict: 'queue_depth' (dumps waiting now), 'max_queue_depth',
+                  'enqueued', 'written', 'dropped', 'errors' and 'maxsize'.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["queue_depth"] = self._queue.qsize()
+        stats["maxsize"] = self.maxsize
+        return stats
+
+
+def get_debug_sink():
+    """
+    Returns:
+        DebugSink | None: Sink active in the current context, or None when
+        dumps go to ./debug.
+    """
+    return _active_sink.get()
+
+
+@contextmanager
+def use_debug_sink(sink):
+    """
+    Routes dump_to_file() to sink for the duration of the with-block.
+
+    The sink is held in a context variable, so threads and asyncio tasks
+    running concurrently each keep their own sink.
+
+    Args:
+        sink (DebugSink | None): None leaves the current sink in place.
+    """
+    if sink is None:
+        yield get_debug_sink()
+        return
+    if not isinstance(sink, DebugSink):
+        raise TypeError("debug_sink must be a DebugSink instance.")
+    token = _active_sink.set(sink)
+    try:
+        yield sink
+    finally:
+        _active_sink.reset(token)
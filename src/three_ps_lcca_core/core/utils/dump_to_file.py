@@ -1,16 +1,24 @@
 import os
 import json
 
+from .debug_sink import get_debug_sink
+
+
 def dump_to_file(name, data):
     """
-    Dumps data to a JSON file inside the 'debug' folder if debug is True.
+    Dumps debug data to the active debug sink (see utils.debug_sink).
+    Without a sink, writes pretty-printed JSON into the 'debug' folder of
+    the current working directory.
 
     Parameters:
         name (str): Filename (e.g., 'voc-1.json').
         data (any): Data to dump (dict/list recommended for JSON).
-        debug (bool): If True, writes the file; otherwise does nothing.
     """
-    
+    sink = get_debug_sink()
+    if sink is not None:
+        sink.write(name, data)
+        return
+
     # Ensure debug folder exists
     os.makedirs("debug", exist_ok=True)
 
@@ -20,4 +28,3 @@ def dump_to_file(name, data):
     # Dump JSON
     with open(file_path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=4)
-
@@ -0,0 +1,41 @@
+import hashlib
+import os
+from functools import lru_cache
+
+_CORE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@lru_cache(maxsize=None)
+def source_fingerprint(package_dir: str) -> str:
+    """
+    SHA-256 over the relative paths and contents of every .py file below
+    package_dir. Any edit to the code or to the IRC tables it embeds changes
+    the fingerprint.
+    """
+    sha = hashlib.sha256()
+    for root, dirs, files in os.walk(package_dir):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(files):
+            if not name.endswith(".py"):
+                continue
+            path = os.path.join(root, name)
+            sha.update(os.path.relpath(path, package_dir).encode("utf-8"))
+            with open(path, "rb") as f:
+                sha.update(f.read())
+    return sha.hexdigest()
+
+
+def ruc_engine_version() -> str:
+    """
+    Version tag of the Road User Cost engine, including the IRC SP:30-2019
+    tables. Used to invalidate persisted RUC results.
+    """
+    return source_fingerprint(os.path.join(_CORE_DIR, "road_user_cost"))
+
+
+def engine_version() -> str:
+    """
+    Version tag of the whole LCC engine (every module under core/). Used to
+    reject persisted results, such as batch checkpoints, written by other code.
+    """
+    return source_fingerprint(_CORE_DIR)
@@ -298,6 +298,15 @@ def ironclad_validator(input, suggestions, wpi=None, eval_wpi=True):
             f"is not valid. Expected one of {valid_lane_codes}."
         )
 
+    # Optional route segments (VOC geometry) carry their own carriageway code
+    for index, segment in enumerate(add_in.get("segments") or []):
+        if segment["alternate_road_carriageway"] not in valid_lane_codes:
+            report["errors"].append(
+                f"Geometry Error: segment {index} carriageway "
+                f"'{segment['alternate_road_carriageway']}' is not valid. "
+                f"Expected one of {valid_lane_codes}."
+            )
+
     # --------------------------------------------------
     # 2. Capacity Comparison (Informational)
     # --------------------------------------------------
@@ -0,0 +1,151 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Instrumentation:
+    """
+    Collects start/stop events of named engine components.
+
+    Every span emits a 'start' and a 'stop' event to the optional callback
+    and adds its elapsed time to timings(). Times come from
+    time.perf_counter() (monotonic, seconds).
+
+    An instance may be shared between concurrent runs (threads, the aio
+    executor). Each run records into its own child() instance, which it
+    merges into the shared one when it ends, so the 'timings' of a result
+    only cover that run while timings() accumulates over every run. Updates
+    of the totals are guarded by a lock.
+
+    Component names are dotted paths, e.g. 'validation', 'ruc.voc',
+    'stage.use_stage'; a parent span ('ruc') includes its children.
+
+    Example:
+        instr = Instrumentation(callback=print)
+        result = run_full_lcc_analysis(..., instrumentation=instr)
+        result["timings"]  # {'normalise': ..., 'validation': ..., ...}
+    """
+
+    enabled = True
+
+    def __init__(self, callback=None):
+        """
+        Args:
+            callback (callable, optional): Called with one event dict per
+                start/stop: {'event': 'start'|'stop', 'name', 'time'} plus
+                'elapsed' on 'stop'.
+        """
+        self.callback = callback
+        self._timings = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name):
+        callback = self.callback
+        if name not in self._timings:
+            with self._lock:
+                self._timings.setdefault(name, 0.0)
+        start = time.perf_counter()
+        if callback is not None:
+            callback({"event": "start", "name": name, "time": start})
+        try:
+            yield
+        finally:
+            stop = time.perf_counter()
+            elapsed = stop - start
+            with self._lock:
+                self._timings[name] += elapsed
+            if callback is not None:
+                callback(
+                    {"event": "stop", "name": name, "time": stop, "elapsed": elapsed}
+                )
+
+    def timings(self):
+        """
+        Returns:
+            dict: {component name: total elapsed seconds}, in first-start order.
+        """
+        with self._lock:
+            return dict(self._timings)
+
+    def child(self):
+        """
+        Returns:
+            Instrumentation: Empty instance with the same callback, for the
+                spans of one run (see merge).
+        """
+        return Instrumentation(self.callback)
+
+    def merge(self, other):
+        """
+        Adds the timings of other (usually a child()) to this instance.
+
+        Args:
+            other (Instrumentation | NullInstrumentation): Finished run.
+        """
+        timings = other.timings()
+        with self._lock:
+            for name, elapsed in timings.items():
+                self._timings[name] = self._timings.get(name, 0.0) + elapsed
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+
+class NullInstrumentation:
+    """
+    Disabled instrumentation: span() returns a shared no-op context manager.
+    """
+
+    enabled = False
+    _span = _NullSpan()
+
+    def span(self, name):
+        return self._span
+
+    def timings(self):
+        return {}
+
+    def child(self):
+        return self
+
+    def merge(self, other):
+        pass
+
+
+NULL_INSTRUMENTATION = NullInstrumentation()
+
+
+def resolve_instrumentation(instrumentation):
+    """
+    Normalises the instrumentation argument of the engine entry points.
+
+    Args:
+        instrumentation (None | bool | callable | Instrumentation):
+            None/False disables it, True collects timings only, a callable is
+            used as the event callback.
+
+    Returns:
+        Instrumentation | NullInstrumentation
+
+    Raises:
+        TypeError: If instrumentation is of an unexpected type.
+    """
+    if instrumentation is None or instrumentation is False:
+        return NULL_INSTRUMENTATION
+    if instrumentation is True:
+        return Instrumentation()
+    if isinstance(instrumentation, (Instrumentation, NullInstrumentation)):
+        return instrumentation
+    if callable(instrumentation):
+        return Instrumentation(callback=instrumentation)
+    raise TypeError(
+        "instrumentation must be None, a bool, a callable or an Instrumentation."
+    )
@@ -0,0 +1,104 @@
+import copy
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded least recently used cache.
+
+    Backs the process-wide caches of the engine: event timelines
+    (stage_cost.utils.pwf_cache) and WPI adjusted unit costs
+    (road_user_cost.unit_costs). Cached results are copied on the way out
+    unless copy_value=False; callers may mutate what they receive.
+    """
+
+    def __init__(self, maxsize: int):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._maxsize = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.resize(maxsize)
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Sets the maximum number of entries, evicting the least recently used
+        ones if the cache is currently larger. maxsize=0 disables caching.
+        """
+        if not isinstance(maxsize, int) or maxsize < 0:
+            raise ValueError("maxsize must be a non-negative integer.")
+
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def _evict(self):
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_or_compute(self, key, compute, copy_value=True):
+        """
+        Returns the cached value for key, calling compute() on a miss.
+
+        Keys that are not hashable (e.g. NumPy array rates) bypass the cache
+        and are not counted in the statistics. copy_value=False returns the
+        cached object itself, for values that are never mutated.
+        """
+        try:
+            hash(key)
+        except TypeError:
+            return compute()
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                value = self._entries[key]
+                return copy.deepcopy(value) if copy_value else value
+            self.misses += 1
+
+        # Computed outside the lock; a concurrent miss on the same key only
+        # duplicates work, the stored value is identical.
+        value = compute()
+
+        if self._maxsize:
+            with self._lock:
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                self._evict()
+
+        return copy.deepcopy(value) if copy_value else value
+
+    def clear(self) -> None:
+        """
+        Drops every entry and resets the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: 'hits', 'misses', 'evictions', 'size', 'maxsize' and
+                  'hit_rate' (hits / lookups, 0.0 before the first lookup).
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self._maxsize,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
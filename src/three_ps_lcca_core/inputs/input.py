@@ -132,6 +132,33 @@ class AccidentSeverityDistribution:
         if abs(total - 100) > 1e-6:
             raise ValueError(f"Accident severity must sum to 100. Got {total}")
 
+@dataclass(frozen=True)
+class RouteSegment:
+    length_km: float
+    alternate_road_carriageway: str
+    carriage_width_in_m: float
+    road_roughness_mm_per_km: float
+    road_rise_m_per_km: float
+    road_fall_m_per_km: float
+
+    def __post_init__(self):
+        if self.length_km <= 0:
+            raise ValueError("Segment length_km must be > 0")
+
+        for val in [
+            self.road_rise_m_per_km,
+            self.road_fall_m_per_km,
+        ]:
+            if val < 0:
+                raise ValueError("Numeric segment values must be >= 0")
+
+        if self.carriage_width_in_m <= 0:
+            raise ValueError("Segment carriage_width_in_m must be > 0")
+
+        if self.road_roughness_mm_per_km <= 0:
+            raise ValueError("Segment road_roughness_mm_per_km must be > 0")
+
+
 @dataclass(frozen=True)
 class AdditionalInputs:
     alternate_road_carriageway: str
@@ -146,6 +173,7 @@ class AdditionalInputs:
     peak_hour_traffic_percent_per_hour: List[float]
     hourly_capacity: int
     force_free_flow_off_peak: bool
+    segments: Optional[List[RouteSegment]] = None
 
     def __post_init__(self):
         for val in [
@@ -175,6 +203,9 @@ class AdditionalInputs:
         if sum(self.peak_hour_traffic_percent_per_hour) > 1.0 + 1e-9:
             raise ValueError("Sum of peak_hour_traffic_percent_per_hour must not exceed 1.0")
 
+        if self.segments is not None and len(self.segments) == 0:
+            raise ValueError("segments must contain at least one segment when given")
+
 
 @dataclass(frozen=True)
 class TrafficAndRoadData:
@@ -307,7 +338,12 @@ class InputMetaData:
     traffic_and_road_data: Optional[TrafficAndRoadData] = None
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        data = asdict(self)
+        # Route segments are optional; inputs without them serialise as before.
+        traffic = data.get('traffic_and_road_data')
+        if traffic is not None and traffic['additional_inputs']['segments'] is None:
+            del traffic['additional_inputs']['segments']
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict):
@@ -322,14 +358,17 @@ class InputMetaData:
             vehicle_data = VehicleData(
                 **{k: VehicleMetaData(**v) for k, v in data['traffic_and_road_data']['vehicle_data'].items()}
             )
+            additional_inputs = dict(data['traffic_and_road_data']['additional_inputs'])
+            if additional_inputs.get('segments') is not None:
+                additional_inputs['segments'] = [
+                    RouteSegment(**segment) for segment in additional_inputs['segments']
+                ]
             traffic_data = TrafficAndRoadData(
                 vehicle_data=vehicle_data,
                 accident_severity_distribution=AccidentSeverityDistribution(
                     **data['traffic_and_road_data']['accident_severity_distribution']
                 ),
-                additional_inputs=AdditionalInputs(
-                    **data['traffic_and_road_data']['additional_inputs']
-                )
+                additional_inputs=AdditionalInputs(**additional_inputs)
             )
         else:
             traffic_data = None
@@ -0,0 +1,92 @@
+"""
+Example projects and helpers shared by the tests.
+"""
+
+import copy
+import random
+
+from examples.from_dict.Input import Input
+from examples.from_dict.Input_global import Input_global
+from examples.from_dict.wpi import wpi
+
+from three_ps_lcca_core.core.main import (
+    _normalise_inputs,
+    _program_inputs,
+    _road_user_costs,
+    _stage_params,
+)
+from three_ps_lcca_core.core.utils.instrumentation import NULL_INSTRUMENTATION
+
+CONSTRUCTION_COSTS = {
+    "initial_construction_cost": 12843979.44,
+    "initial_carbon_emissions_cost": 2065434.91,
+    "superstructure_construction_cost": 9356038.92,
+    "total_scrap_value": 2164095.02,
+}
+
+
+def with_general(input_data, **general):
+    data = copy.deepcopy(input_data)
+    data["general_parameters"].update(general)
+    return data
+
+
+def _random_general(seed):
+    rng = random.Random(seed)
+    service_life = rng.randint(20, 150)
+    return {
+        "service_life_years": service_life,
+        "analysis_period_years": rng.choice(
+            [service_life, rng.randint(10, 2 * service_life)]
+        ),
+        "discount_rate_percent": round(rng.uniform(0, 12), 2),
+        "inflation_rate_percent": round(rng.uniform(0, 10), 2),
+        "interest_rate_percent": round(rng.uniform(0, 12), 2),
+        "construction_period_months": rng.choice([0.5, 6, 18, 30]),
+    }
+
+
+def with_additional(input_data, **additional):
+    data = copy.deepcopy(input_data)
+    data["traffic_and_road_data"]["additional_inputs"].update(additional)
+    return data
+
+
+def _zero_traffic():
+    data = copy.deepcopy(Input)
+    for vehicle in data["traffic_and_road_data"]["vehicle_data"].values():
+        vehicle["vehicles_per_day"] = 0
+    return data
+
+
+# {case name: (input_data, wpi)}
+CASES = {
+    "detailed": (Input, wpi),
+    "detailed.reconstruction": (with_general(Input, analysis_period_years=120), wpi),
+    "detailed.adt0": (_zero_traffic(), wpi),
+    "detailed.6L": (
+        with_additional(Input, alternate_road_carriageway="6L", carriage_width_in_m=10.5),
+        wpi,
+    ),
+    "global": (Input_global, None),
+    "global.reconstruction": (
+        with_general(Input_global, analysis_period_years=120),
+        None,
+    ),
+}
+CASES.update(
+    {
+        f"global.random{seed}": (with_general(Input_global, **_random_general(seed)), None)
+        for seed in range(12)
+    }
+)
+
+
+def stage_inputs(input_data, case_wpi):
+    """
+    Returns:
+        tuple: (stage_params, program_inputs) of StageCostCalculator.
+    """
+    input_data, is_global, case_wpi = _normalise_inputs(input_data, case_wpi)
+    ruc = _road_user_costs(input_data, is_global, case_wpi, False, None, NULL_INSTRUMENTATION)
+    return _stage_params(input_data), _program_inputs(CONSTRUCTION_COSTS, ruc)
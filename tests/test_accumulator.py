@@ -0,0 +1,75 @@
+import io
+import math
+
+import pytest
+
+from examples.from_dict.Input_global import Input_global
+
+from three_ps_lcca_core.core.accumulator import ResultAccumulator
+from three_ps_lcca_core.core.main import run_full_lcc_analysis
+
+from cases import CONSTRUCTION_COSTS
+
+
+def test_columns_are_dotted_paths_of_numeric_leaves():
+    result = run_full_lcc_analysis(Input_global, CONSTRUCTION_COSTS, instrumentation=True)
+    acc = ResultAccumulator()
+    acc.add(result, key="p0")
+
+    assert len(acc) == 1
+    assert acc.keys == ["p0"]
+    value = result["use_stage"]["economic"]["periodic_maintenance"]
+    assert acc.column("use_stage.economic.periodic_maintenance")[0] == value
+    assert not any(name.startswith(("timings", "warnings", "notes")) for name in acc.columns)
+
+
+def test_missing_and_late_columns_are_nan():
+    acc = ResultAccumulator()
+    acc.add({"a": 1, "b": {"c": 2.5}})
+    acc.add({"a": 3, "d": 4, "flag": True, "label": "x"})
+
+    assert acc.columns == ["a", "b.c", "d"]
+    rows = list(acc.rows())
+    assert rows[0][1][:2] == (1.0, 2.5) and math.isnan(rows[0][1][2])
+    assert rows[1][1][0] == 3.0 and math.isnan(rows[1][1][1]) and rows[1][1][2] == 4.0
+
+
+def test_add_record_skips_failures():
+    acc = ResultAccumulator()
+    assert acc.add_record({"index": 0, "status": "ok", "result": {"total": 1.0}})
+    assert not acc.add_record({"index": 1, "status": "error", "error": "boom"})
+    assert acc.keys == [0]
+    assert list(acc.column("total")) == [1.0]
+
+
+def test_lean_records_give_flat_columns():
+    lean = run_full_lcc_analysis(Input_global, CONSTRUCTION_COSTS, lean=True)
+    acc = ResultAccumulator()
+    acc.add(lean)
+    assert acc.columns == list(lean)
+
+
+def test_csv_writes_empty_cells_for_missing_values():
+    acc = ResultAccumulator()
+    acc.add({"a": 0.1}, key="x")
+    acc.add({"b": 2})
+    out = io.StringIO()
+    acc.to_csv(out)
+    assert out.getvalue().splitlines() == ["key,a,b", "x,0.1,", ",,2.0"]
+
+
+def test_numpy_exports(tmp_path):
+    np = pytest.importorskip("numpy")
+    acc = ResultAccumulator()
+    acc.add({"a": 1, "b": 2}, key="p0")
+    acc.add({"a": 3}, key="p1")
+
+    matrix = acc.to_numpy()
+    assert matrix.shape == (2, 2)
+    assert matrix[1, 0] == 3 and np.isnan(matrix[1, 1])
+
+    acc.to_npz(tmp_path / "out.npz")
+    with np.load(tmp_path / "out.npz") as data:
+        assert list(data["a"]) == [1.0, 3.0]
+        assert list(data["__keys__"]) == ["p0", "p1"]
+    assert ResultAccumulator().to_numpy().shape == (0, 0)
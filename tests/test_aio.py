@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from examples.from_dict.Input_global import Input_global
+
+from three_ps_lcca_core.core.aio import (
+    LCCExecutor,
+    arun_batch_lcc_analysis,
+    arun_full_lcc_analysis,
+)
+from three_ps_lcca_core.core.main import run_full_lcc_analysis
+
+from cases import CONSTRUCTION_COSTS, with_general
+
+PROJECTS = [
+    (with_general(Input_global, analysis_period_years=40 + i), CONSTRUCTION_COSTS, None)
+    for i in range(8)
+]
+BROKEN = ({"general_parameters": {}}, CONSTRUCTION_COSTS, None)
+
+
+def _collect(agen):
+    async def collect():
+        return [record async for record in agen]
+
+    return asyncio.run(collect())
+
+
+def test_arun_matches_sync_run():
+    expected = run_full_lcc_analysis(Input_global, CONSTRUCTION_COSTS)
+
+    async def main():
+        plain = await arun_full_lcc_analysis(Input_global, CONSTRUCTION_COSTS)
+        async with LCCExecutor(max_workers=2) as executor:
+            shared = await arun_full_lcc_analysis(
+                Input_global, CONSTRUCTION_COSTS, executor=executor
+            )
+        return plain, shared
+
+    assert asyncio.run(main()) == (expected, expected)
+
+
+def test_process_executor_matches_sync_run():
+    async def main():
+        async with LCCExecutor(kind="process", max_workers=2) as executor:
+            return await asyncio.gather(*(executor.run(*project) for project in PROJECTS[:3]))
+
+    results = asyncio.run(main())
+    assert results == [run_full_lcc_analysis(*project) for project in PROJECTS[:3]]
+
+
+def test_run_raises_engine_errors():
+    async def main():
+        async with LCCExecutor(max_workers=1) as executor:
+            await executor.run(*BROKEN)
+
+    with pytest.raises(Exception):
+        asyncio.run(main())
+
+
+def test_batch_yields_one_record_per_project():
+    records = _collect(arun_batch_lcc_analysis(PROJECTS + [BROKEN], max_workers=3))
+
+    by_index = {record["index"]: record for record in records}
+    assert sorted(by_index) == list(range(len(PROJECTS) + 1))
+    for index, (input_data, costs, wpi) in enumerate(PROJECTS):
+        assert by_index[index]["status"] == "ok"
+        assert by_index[index]["result"] == run_full_lcc_analysis(input_data, costs, wpi=wpi)
+    assert by_index[len(PROJECTS)]["status"] == "error"
+    assert "traceback" in by_index[len(PROJECTS)]
+
+
+def test_stream_accepts_async_source_and_bounds_concurrency():
+    pulled = []
+    in_flight = []
+
+    async def source():
+        for index, project in enumerate(PROJECTS):
+            pulled.append(index)
+            yield project
+
+    async def main():
+        records = []
+        async with LCCExecutor(max_workers=4, max_concurrency=2) as executor:
+            async for record in executor.stream(source(), lean=True):
+                # Pulled but not yet yielded: at most max_concurrency.
+                in_flight.append(len(pulled) - len(records))
+                records.append(record)
+        return records
+
+    records = asyncio.run(main())
+    assert sorted(record["index"] for record in records) == list(range(len(PROJECTS)))
+    assert all(record["status"] == "ok" and "total" in record["result"] for record in records)
+    assert max(in_flight) <= 2
+
+
+def test_stream_stops_pulling_when_consumer_breaks():
+    pulled = []
+
+    def source():
+        for index, project in enumerate(PROJECTS):
+            pulled.append(index)
+            yield project
+
+    async def main():
+        async with LCCExecutor(max_workers=1, max_concurrency=1) as executor:
+            stream = executor.stream(source())
+            async for _ in stream:
+                break
+            await stream.aclose()
+
+    asyncio.run(main())
+    assert len(pulled) <= 2
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"kind": "fiber"}, {"max_workers": -1}, {"max_concurrency": -1}]
+)
+def test_executor_rejects_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        LCCExecutor(**kwargs)
@@ -0,0 +1,147 @@
+import copy
+import os
+
+import pytest
+
+from examples.from_dict.Input import Input
+from examples.from_dict.Input_global import Input_global
+from examples.from_dict.wpi import wpi
+
+from three_ps_lcca_core.core.batch import run_batch_lcc_analysis
+from three_ps_lcca_core.core.main import run_full_lcc_analysis
+from three_ps_lcca_core.core.utils.canonical import input_digest
+
+from cases import CONSTRUCTION_COSTS, with_general
+
+
+def _float_year_wpi():
+    data = copy.deepcopy(wpi)
+    data["year"] = float(data["year"])
+    return data
+
+
+def _global_projects(count):
+    return [
+        (with_general(Input_global, analysis_period_years=40 + i), CONSTRUCTION_COSTS, None)
+        for i in range(count)
+    ]
+
+
+def _reordered(data):
+    """Same content, keys in reverse order at every level."""
+    if isinstance(data, dict):
+        return {key: _reordered(data[key]) for key in reversed(list(data))}
+    return data
+
+
+BROKEN = ({"general_parameters": {}}, CONSTRUCTION_COSTS, None)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_results_follow_input_order(max_workers):
+    projects = _global_projects(5) + [(Input, CONSTRUCTION_COSTS, wpi)]
+    batch = run_batch_lcc_analysis(projects, max_workers=max_workers, dedupe=False)
+
+    assert [r["index"] for r in batch["results"]] == list(range(len(projects)))
+    for record, project in zip(batch["results"], projects):
+        assert record["status"] == "ok"
+        assert record["result"] == run_full_lcc_analysis(project[0], project[1], wpi=project[2])
+    assert batch["summary"]["projects"] == len(projects)
+    assert batch["summary"]["succeeded"] == len(projects)
+
+
+def test_failed_project_is_recorded_not_raised():
+    projects = _global_projects(2)
+    projects.insert(1, BROKEN)
+    batch = run_batch_lcc_analysis(projects, max_workers=1)
+
+    ok, error, ok2 = batch["results"]
+    assert ok["status"] == ok2["status"] == "ok"
+    assert error["index"] == 1
+    assert error["status"] == "error"
+    assert error["error_type"] and error["error"]
+    assert "Traceback" in error["traceback"]
+    assert batch["summary"]["failed"] == 1
+    assert batch["summary"]["succeeded"] == 2
+
+
+def test_throughput_mode_omits_tracebacks():
+    batch = run_batch_lcc_analysis([BROKEN], max_workers=1, throughput=True)
+    [record] = batch["results"]
+    assert record["status"] == "error"
+    assert "traceback" not in record
+
+
+def test_rejects_invalid_pool_size():
+    with pytest.raises(ValueError):
+        run_batch_lcc_analysis(_global_projects(1), max_workers=-1)
+
+
+def test_dedupe_runs_identical_inputs_once():
+    first, second = _global_projects(2)
+    duplicate = (_reordered(first[0]), dict(reversed(list(first[1].items()))), None)
+    projects = [first, second, duplicate, first]
+
+    batch = run_batch_lcc_analysis(projects, max_workers=1)
+    fresh = run_batch_lcc_analysis(projects, max_workers=1, dedupe=False)
+
+    assert batch["summary"]["unique_projects"] == 2
+    assert batch["summary"]["dedup_ratio"] == 0.5
+    assert fresh["summary"]["unique_projects"] == 4
+    assert [r["index"] for r in batch["results"]] == [0, 1, 2, 3]
+    assert [r["result"] for r in batch["results"]] == [r["result"] for r in fresh["results"]]
+    # Duplicates get their own copy of the result.
+    assert batch["results"][0]["result"] is not batch["results"][3]["result"]
+
+
+def test_digest_ignores_key_order_and_dataclass_form():
+    from three_ps_lcca_core.inputs.wpi import WPIMetaData
+
+    assert input_digest(Input, CONSTRUCTION_COSTS, wpi) == input_digest(
+        _reordered(Input), CONSTRUCTION_COSTS, WPIMetaData.from_dict(wpi)
+    )
+
+
+def test_digest_keeps_ints_and_floats_apart():
+    assert input_digest(Input, CONSTRUCTION_COSTS, wpi) != input_digest(
+        Input, CONSTRUCTION_COSTS, _float_year_wpi()
+    )
+
+
+@pytest.mark.parametrize("float_first", [False, True])
+def test_dedupe_does_not_merge_int_and_float_year(float_first):
+    valid = (Input, CONSTRUCTION_COSTS, wpi)
+    invalid = (Input, CONSTRUCTION_COSTS, _float_year_wpi())
+    projects = [invalid, valid] if float_first else [valid, invalid]
+    valid_index, invalid_index = (1, 0) if float_first else (0, 1)
+
+    batch = run_batch_lcc_analysis(projects, max_workers=1)
+
+    # Each project's status depends only on its own input, not on the order.
+    results = batch["results"]
+    assert results[valid_index]["status"] == "ok"
+    assert results[invalid_index]["status"] == "error"
+    assert results[invalid_index]["error_type"] == "TypeError"
+    assert batch["summary"]["unique_projects"] == 2
+
+
+def test_debug_dir_gives_each_project_its_own_folder(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    projects = _global_projects(2) + [(Input, CONSTRUCTION_COSTS, wpi)]
+    out = tmp_path / "out"
+
+    batch = run_batch_lcc_analysis(
+        projects, max_workers=1, debug=True, debug_dir=str(out), dedupe=False
+    )
+
+    assert all(r["status"] == "ok" for r in batch["results"])
+    assert sorted(os.listdir(out)) == ["0", "1", "2"]
+    assert "A0_Core_Inputs.json" in os.listdir(out / "0")
+    # The detailed project also dumps its road user cost structures.
+    assert len(os.listdir(out / "2")) > len(os.listdir(out / "0"))
+    assert not (tmp_path / "debug").exists()
+
+
+def test_debug_dir_is_ignored_without_debug(tmp_path):
+    run_batch_lcc_analysis(_global_projects(1), max_workers=1, debug_dir=str(tmp_path / "out"))
+    assert not (tmp_path / "out").exists()
@@ -0,0 +1,95 @@
+import copy
+import itertools
+import math
+
+import pytest
+
+from three_ps_lcca_core.core.stage_cost.stage_cost import StageCostCalculator
+from three_ps_lcca_core.core.stage_cost.summary import SALVAGE_KEYS
+
+from cases import CASES, stage_inputs
+
+INPUTS = {name: stage_inputs(*case) for name, case in CASES.items()}
+
+# Stage parameter variants of the detailed example.
+GRID = list(
+    itertools.product(
+        (25, 50, 75, 100, 150),  # analysis period, years
+        (10, 30, 50, 75),  # service life, years
+        (0, 6, 7, 18),  # construction period, months
+        ((6.7, 8.0), (5.0, 5.0), (8.0, 4.0)),  # (inflation, discount) %
+    )
+)
+
+
+def _grid_inputs(period, life, months, rates):
+    stage_params, program_inputs = INPUTS["detailed"]
+    stage_params = copy.deepcopy(stage_params)
+    general = stage_params["general"]
+    general["analysis_period_years"] = period
+    general["service_life_years"] = life
+    general["construction_period_months"] = months
+    general["inflation_rate_percent"], general["discount_rate_percent"] = rates
+    return stage_params, program_inputs
+
+
+def _engine_results(calc):
+    return {
+        "initial_stage": calc.initial_cost_calculator(),
+        "use_stage": calc.use_stage_cost_calculator(),
+        "reconstruction": calc.reconstruction(),
+        "end_of_life": calc.end_of_life_stage_costs(),
+    }
+
+
+def _check_ledger(stage_params, program_inputs):
+    calc = StageCostCalculator(stage_params, program_inputs)
+    ledger = calc.cash_flow_ledger()
+    reduced = ledger.stage_results()
+    engine = _engine_results(calc)
+
+    assert len(ledger.years) == int(calc.analysis_period) + 1
+    assert reduced.keys() == engine.keys()
+
+    for category in ledger.categories:
+        summed = math.fsum(ledger.column(category.name))
+        # stage_results() is a reduction of the ledger, exactly.
+        assert reduced[category.stage][category.pillar][category.item] == summed
+
+        # The engine discounts with the present worth factor of the event
+        # kind rounded to 3 decimals, and rounds traffic costs to 2 decimals.
+        expected = engine[category.stage][category.pillar][category.item]
+        tolerance = 0.0005 * abs(category.amount) + 0.005 * category.traffic
+        assert abs(summed - expected) <= tolerance + 1e-9 * abs(expected), category.name
+
+    if "Note" in engine["reconstruction"]:
+        assert reduced["reconstruction"] == engine["reconstruction"]
+
+    # Net yearly totals add up to the reduced stage results.
+    net = math.fsum(
+        -value if item in SALVAGE_KEYS else value
+        for stage in reduced.values()
+        for pillar in stage.values()
+        if isinstance(pillar, dict)
+        for item, value in pillar.items()
+    )
+    assert math.fsum(ledger.year_totals()) == pytest.approx(net, rel=1e-12)
+
+
+@pytest.mark.parametrize("name", INPUTS)
+def test_ledger_reduces_to_stage_results(name):
+    _check_ledger(*INPUTS[name])
+
+
+@pytest.mark.parametrize("period,life,months,rates", GRID)
+def test_ledger_reduces_to_stage_results_over_grid(period, life, months, rates):
+    _check_ledger(*_grid_inputs(period, life, months, rates))
+
+
+def test_undiscounted_stage_results_sum_nominal_columns():
+    ledger = StageCostCalculator(*INPUTS["detailed.reconstruction"]).cash_flow_ledger()
+    nominal = ledger.stage_results(discounted=False)
+    for category in ledger.categories:
+        assert nominal[category.stage][category.pillar][category.item] == math.fsum(
+            ledger.column(category.name, discounted=False)
+        )
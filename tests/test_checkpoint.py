@@ -0,0 +1,136 @@
+import pytest
+
+from examples.from_dict.Input import Input
+from examples.from_dict.Input_global import Input_global
+from examples.from_dict.wpi import wpi
+
+from three_ps_lcca_core.core import batch as batch_module
+from three_ps_lcca_core.core import checkpoint as checkpoint_module
+from three_ps_lcca_core.core.batch import run_batch_lcc_analysis
+from three_ps_lcca_core.core.checkpoint import CheckpointStore
+
+from cases import CONSTRUCTION_COSTS, with_general
+
+PROJECTS = [
+    (with_general(Input_global, analysis_period_years=40 + i), CONSTRUCTION_COSTS, None)
+    for i in range(6)
+] + [(Input, CONSTRUCTION_COSTS, wpi)]
+
+
+def _interrupt_after(monkeypatch, count):
+    evaluate = batch_module._evaluate_project
+    calls = []
+
+    def interrupted(task):
+        if len(calls) == count:
+            raise KeyboardInterrupt
+        calls.append(task[0])
+        return evaluate(task)
+
+    monkeypatch.setattr(batch_module, "_evaluate_project", interrupted)
+    return calls
+
+
+@pytest.mark.parametrize("lean", [False, True])
+def test_resume_matches_fresh_run(tmp_path, monkeypatch, lean):
+    path = str(tmp_path / "run.ckpt")
+    fresh = run_batch_lcc_analysis(PROJECTS, max_workers=1, lean=lean)
+
+    with monkeypatch.context() as patch:
+        _interrupt_after(patch, 3)
+        with CheckpointStore(path, commit_every=100) as checkpoint:
+            with pytest.raises(KeyboardInterrupt):
+                run_batch_lcc_analysis(PROJECTS, max_workers=1, lean=lean, checkpoint=checkpoint)
+            # Completed projects are committed even though the batch died.
+            assert len(checkpoint) == 3
+
+    calls = _interrupt_after(monkeypatch, len(PROJECTS))
+    with CheckpointStore(path) as checkpoint:
+        resumed = run_batch_lcc_analysis(PROJECTS, max_workers=1, lean=lean, checkpoint=checkpoint)
+
+    assert calls == [3, 4, 5, 6]  # only the unfinished projects ran again
+    assert resumed["summary"]["restored_from_checkpoint"] == 3
+    assert resumed["results"] == fresh["results"]
+
+
+def test_failed_projects_are_retried(tmp_path):
+    broken = ({"general_parameters": {}}, CONSTRUCTION_COSTS, None)
+    path = str(tmp_path / "run.ckpt")
+    with CheckpointStore(path) as checkpoint:
+        first = run_batch_lcc_analysis(
+            [PROJECTS[0], broken], max_workers=1, checkpoint=checkpoint, project_ids=["a", "b"]
+        )
+        assert checkpoint.completed_ids() == {"a"}
+        second = run_batch_lcc_analysis(
+            [PROJECTS[0], broken], max_workers=1, checkpoint=checkpoint, project_ids=["a", "b"]
+        )
+    assert first["summary"]["failed"] == second["summary"]["failed"] == 1
+    assert second["summary"]["restored_from_checkpoint"] == 1
+
+
+def test_deduplicated_result_is_stored_under_every_id(tmp_path):
+    path = str(tmp_path / "run.ckpt")
+    projects = [PROJECTS[0], PROJECTS[1], PROJECTS[0]]
+    with CheckpointStore(path) as checkpoint:
+        first = run_batch_lcc_analysis(
+            projects, max_workers=1, checkpoint=checkpoint, project_ids=["a", "b", "c"]
+        )
+        assert first["summary"]["unique_projects"] == 2
+        assert checkpoint.completed_ids() == {"a", "b", "c"}
+
+        # The duplicate alone, under its own id, is restored.
+        alone = run_batch_lcc_analysis(
+            [PROJECTS[0]], max_workers=1, checkpoint=checkpoint, project_ids=["c"]
+        )
+    assert alone["summary"]["restored_from_checkpoint"] == 1
+    assert alone["results"][0]["result"] == first["results"][2]["result"]
+
+
+def test_restored_result_fills_missing_ids_of_its_group(tmp_path):
+    path = str(tmp_path / "run.ckpt")
+    with CheckpointStore(path) as checkpoint:
+        run_batch_lcc_analysis([PROJECTS[0]], max_workers=1, checkpoint=checkpoint, project_ids=["a"])
+        resumed = run_batch_lcc_analysis(
+            [PROJECTS[0], PROJECTS[0]], max_workers=1, checkpoint=checkpoint, project_ids=["a", "z"]
+        )
+    assert resumed["summary"]["restored_from_checkpoint"] == 1
+    with CheckpointStore(path) as checkpoint:
+        assert checkpoint.completed_ids() == {"a", "z"}
+
+
+def test_commits_in_windows(tmp_path):
+    with CheckpointStore(str(tmp_path / "run.ckpt"), commit_every=2, commit_seconds=3600) as store:
+        store.add("a", {"total": 1.0})
+        assert len(store) == 0
+        store.add("b", {"total": 2.0})
+        assert len(store) == 2
+        store.add("c", {"total": 3.0})
+        assert store.load(["a", "c", "x"]) == {"a": {"total": 1.0}}
+    with CheckpointStore(str(tmp_path / "run.ckpt")) as store:
+        assert store.completed_ids() == {"a", "b", "c"}
+
+
+def test_rejects_checkpoint_of_other_options(tmp_path):
+    path = str(tmp_path / "run.ckpt")
+    with CheckpointStore(path) as checkpoint:
+        run_batch_lcc_analysis(PROJECTS[:1], max_workers=1, checkpoint=checkpoint)
+    with CheckpointStore(path) as checkpoint:
+        with pytest.raises(ValueError):
+            run_batch_lcc_analysis(PROJECTS[:1], max_workers=1, lean=True, checkpoint=checkpoint)
+
+
+def test_rejects_checkpoint_of_other_engine(tmp_path, monkeypatch):
+    path = str(tmp_path / "run.ckpt")
+    with CheckpointStore(path) as store:
+        store.add("a", {"total": 1.0})
+
+    monkeypatch.setattr(checkpoint_module, "engine_version", lambda: "edited")
+    with pytest.raises(ValueError, match="stale"):
+        CheckpointStore(path)
+    with CheckpointStore(path, reset=True) as store:
+        assert len(store) == 0
+
+
+def test_rejects_invalid_limits(tmp_path):
+    with pytest.raises(ValueError):
+        CheckpointStore(str(tmp_path / "run.ckpt"), commit_every=0)
@@ -0,0 +1,121 @@
+import io
+import json
+
+import pytest
+
+from examples.from_dict.Input import Input
+from examples.from_dict.Input_global import Input_global
+from examples.from_dict.wpi import wpi
+
+from three_ps_lcca_core import cli
+from three_ps_lcca_core.core.main import run_full_lcc_analysis
+
+from cases import CONSTRUCTION_COSTS, with_general
+
+GLOBAL_LINES = [
+    {
+        "id": f"g{i}",
+        "input_data": with_general(Input_global, analysis_period_years=40 + i),
+        "construction_costs": CONSTRUCTION_COSTS,
+    }
+    for i in range(4)
+]
+DETAILED_LINE = {"id": "d", "input_data": Input, "construction_costs": CONSTRUCTION_COSTS}
+
+
+def _write_jsonl(path, lines):
+    path.write_text(
+        "".join((line if isinstance(line, str) else json.dumps(line)) + "\n" for line in lines),
+        encoding="utf-8",
+    )
+
+
+def _read_jsonl(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_exit_code_is_zero_when_every_project_succeeds(tmp_path):
+    _write_jsonl(tmp_path / "in.jsonl", GLOBAL_LINES + [DETAILED_LINE])
+    (tmp_path / "wpi.json").write_text(json.dumps(wpi), encoding="utf-8")
+
+    code = cli.main(
+        [
+            str(tmp_path / "in.jsonl"),
+            "-o", str(tmp_path / "out.jsonl"),
+            "--errors", str(tmp_path / "errors.jsonl"),
+            "--summary", str(tmp_path / "summary.json"),
+            "--wpi", str(tmp_path / "wpi.json"),
+            "-j", "1",
+        ]
+    )
+
+    assert code == 0
+    records = _read_jsonl(tmp_path / "out.jsonl")
+    assert [r["id"] for r in records] == ["g0", "g1", "g2", "g3", "d"]
+    assert records[-1]["result"] == json.loads(
+        json.dumps(run_full_lcc_analysis(Input, CONSTRUCTION_COSTS, wpi=wpi))
+    )
+    assert (tmp_path / "errors.jsonl").read_text(encoding="utf-8") == ""
+    summary = json.loads((tmp_path / "summary.json").read_text(encoding="utf-8"))
+    assert (summary["projects"], summary["failed"]) == (5, 0)
+
+
+def test_failures_set_exit_code_and_go_to_errors_file(tmp_path):
+    lines = [
+        GLOBAL_LINES[0],
+        "not json",
+        {"id": "no-costs", "input_data": Input_global},
+        "[1, 2]",
+        GLOBAL_LINES[1],
+    ]
+    _write_jsonl(tmp_path / "in.jsonl", lines)
+
+    code = cli.main(
+        [
+            str(tmp_path / "in.jsonl"),
+            "-o", str(tmp_path / "out.jsonl"),
+            "--errors", str(tmp_path / "errors.jsonl"),
+            "--summary", str(tmp_path / "summary.json"),
+            "-j", "1",
+        ]
+    )
+
+    assert code == 1
+    records = _read_jsonl(tmp_path / "out.jsonl")
+    assert [r["status"] for r in records] == ["ok", "error", "error", "error", "ok"]
+    errors = _read_jsonl(tmp_path / "errors.jsonl")
+    assert errors == [r for r in records if r["status"] == "error"]
+    assert [e["error_type"] for e in errors] == ["JSONDecodeError", "KeyError", "TypeError"]
+    assert errors[1]["id"] == "no-costs"
+    summary = json.loads((tmp_path / "summary.json").read_text(encoding="utf-8"))
+    assert (summary["succeeded"], summary["failed"]) == (2, 3)
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 3])
+def test_ordered_pool_run_keeps_input_order(max_in_flight):
+    source = io.StringIO("".join(json.dumps(line) + "\n\n" for line in GLOBAL_LINES))
+    sink = io.StringIO()
+
+    summary = cli.run(
+        source, sink, workers=2, max_in_flight=max_in_flight, ordered=True, options={"lean": True}
+    )
+
+    records = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert [r["index"] for r in records] == [0, 1, 2, 3]
+    assert [r["id"] for r in records] == ["g0", "g1", "g2", "g3"]
+    assert all("total" in r["result"] for r in records)
+    assert summary["projects"] == 4
+    assert summary["latency_seconds"]["max"] >= summary["latency_seconds"]["p50"]
+
+
+def test_rejects_invalid_worker_count():
+    with pytest.raises(ValueError):
+        cli.run([], io.StringIO(), workers=0)
+
+
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 11))
+    assert cli._percentile(values, 50) == 5
+    assert cli._percentile(values, 90) == 9
+    assert cli._percentile(values, 99) == 10
+    assert cli._percentile([], 50) is None
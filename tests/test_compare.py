@@ -0,0 +1,33 @@
+import pytest
+
+from examples.from_dict.Input import Input
+from examples.from_dict.wpi import wpi
+
+from three_ps_lcca_core.core.compare import compare_design_alternatives
+from three_ps_lcca_core.core.main import run_full_lcc_analysis
+
+from cases import CONSTRUCTION_COSTS
+
+CHEAPER = {key: value * 0.9 for key, value in CONSTRUCTION_COSTS.items()}
+
+
+def test_alternatives_match_separate_runs():
+    comparison = compare_design_alternatives(
+        Input, [("base", CONSTRUCTION_COSTS), ("cheaper", CHEAPER)], wpi=wpi
+    )
+
+    assert [row["alternative"] for row in comparison["ranking"]] == ["cheaper", "base"]
+    for name, costs in (("base", CONSTRUCTION_COSTS), ("cheaper", CHEAPER)):
+        assert comparison["results"][name] == run_full_lcc_analysis(Input, costs, wpi=wpi)
+
+
+def test_rejects_duplicate_names():
+    with pytest.raises(ValueError, match="Duplicate"):
+        compare_design_alternatives(
+            Input, [("base", CONSTRUCTION_COSTS), ("base", CHEAPER)], wpi=wpi
+        )
+
+
+def test_rejects_no_alternatives():
+    with pytest.raises(ValueError):
+        compare_design_alternatives(Input, {}, wpi=wpi)
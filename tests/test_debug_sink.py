@@ -0,0 +1,138 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+
+import pytest
+
+from three_ps_lcca_core.core.utils.debug_sink import (
+    BackgroundDebugWriter,
+    DebugSink,
+    DirectorySink,
+    MemorySink,
+)
+
+
+class _BlockingSink(MemorySink):
+    """MemorySink whose first write waits until release is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, name, data):
+        self.started.set()
+        self.release.wait(5)
+        super().write(name, data)
+
+
+class _FailingSink(DebugSink):
+    def __init__(self):
+        self.written = {}
+
+    def write(self, name, data):
+        if name == "bad.json":
+            raise OSError("disk full")
+        self.written[name] = json.loads(json.dumps(data))
+
+
+def test_writes_snapshot_taken_at_write_time():
+    sink = MemorySink()
+    payload = {"vehicles": [{"count": 1}], "pair": (1, 2)}
+    with BackgroundDebugWriter(sink) as writer:
+        writer.write("a.json", payload)
+        payload["vehicles"][0]["count"] = 2
+        payload["vehicles"].append({"count": 3})
+    assert sink.dumps["a.json"] == {"vehicles": [{"count": 1}], "pair": [1, 2]}
+    assert writer.stats()["written"] == 1
+
+
+def test_drops_dumps_when_queue_is_full():
+    sink = _BlockingSink()
+    writer = BackgroundDebugWriter(sink, maxsize=1)
+    writer.write("0.json", 0)
+    assert sink.started.wait(5)  # the worker holds dump 0
+    writer.write("1.json", 1)  # fills the queue
+    writer.write("2.json", 2)  # dropped
+    sink.release.set()
+    writer.close()
+
+    stats = writer.stats()
+    assert stats["dropped"] == 1
+    assert stats["written"] == 2
+    assert sorted(sink.dumps) == ["0.json", "1.json"]
+
+
+def test_blocking_writer_does_not_drop():
+    sink = _BlockingSink()
+    writer = BackgroundDebugWriter(sink, maxsize=1, block=True)
+    writer.write("0.json", 0)
+    assert sink.started.wait(5)
+    writer.write("1.json", 1)
+    sink.release.set()
+    writer.write("2.json", 2)  # waits for queue space
+    writer.close()
+    assert writer.stats()["dropped"] == 0
+    assert sorted(sink.dumps) == ["0.json", "1.json", "2.json"]
+
+
+def test_sink_errors_are_counted_and_kept():
+    sink = _FailingSink()
+    with BackgroundDebugWriter(sink) as writer:
+        writer.write("bad.json", {})
+        writer.write("unserialisable.json", {"value": object()})
+        writer.write("good.json", {"ok": True})
+
+    stats = writer.stats()
+    assert stats["errors"] == 2
+    assert stats["written"] == 1
+    assert isinstance(writer.last_error, TypeError)
+    assert sink.written == {"good.json": {"ok": True}}
+
+
+def test_write_after_close_raises():
+    writer = BackgroundDebugWriter(MemorySink())
+    writer.close()
+    writer.close()  # idempotent
+    with pytest.raises(ValueError):
+        writer.write("a.json", {})
+
+
+def test_rejects_empty_queue():
+    with pytest.raises(ValueError):
+        BackgroundDebugWriter(MemorySink(), maxsize=0)
+
+
+def test_flush_writes_pending_dumps(tmp_path):
+    writer = BackgroundDebugWriter(DirectorySink(str(tmp_path), compact=True))
+    for i in range(20):
+        writer.write(f"{i}.json", {"i": i})
+    writer.flush()
+    assert len(os.listdir(tmp_path)) == 20
+    writer.close()
+
+
+def test_pending_dumps_are_written_at_interpreter_exit(tmp_path):
+    script = textwrap.dedent(
+        f"""
+        from three_ps_lcca_core.core.utils.debug_sink import (
+            BackgroundDebugWriter,
+            DirectorySink,
+        )
+
+        writer = BackgroundDebugWriter(DirectorySink({str(tmp_path)!r}))
+        for i in range(50):
+            writer.write(f"{{i}}.json", {{"i": i}})
+        # No close(): the atexit hook flushes the queue.
+        """
+    )
+    src = os.path.join(os.path.dirname(__file__), os.pardir, "src")
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(src))
+    subprocess.run([sys.executable, "-c", script], env=env, check=True, timeout=60)
+
+    assert len(os.listdir(tmp_path)) == 50
+    with open(tmp_path / "49.json", encoding="utf-8") as f:
+        assert json.load(f) == {"i": 49}
@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from examples.from_dict.Input_global import Input_global
+
+from three_ps_lcca_core.core.main import run_full_lcc_analysis
+from three_ps_lcca_core.core.utils.instrumentation import (
+    NULL_INSTRUMENTATION,
+    Instrumentation,
+    resolve_instrumentation,
+)
+
+from cases import CONSTRUCTION_COSTS
+
+
+def test_concurrent_runs_report_their_own_timings():
+    shared = Instrumentation()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(
+            pool.map(
+                lambda _: run_full_lcc_analysis(
+                    Input_global, CONSTRUCTION_COSTS, instrumentation=shared
+                ),
+                range(32),
+            )
+        )
+
+    totals = shared.timings()
+    assert list(totals)[:2] == ["normalise", "validation"]
+    for name, total in totals.items():
+        per_run = [r["timings"][name] for r in results]
+        assert all(elapsed >= 0 for elapsed in per_run)
+        # The shared totals are the sum of the runs, nothing lost or shared.
+        assert total == pytest.approx(sum(per_run), rel=1e-9, abs=1e-12)
+
+
+def test_merge_adds_child_timings():
+    parent = Instrumentation()
+    with parent.span("a"):
+        pass
+    child = parent.child()
+    with child.span("a"):
+        pass
+    with child.span("b"):
+        pass
+    before = parent.timings()
+    parent.merge(child)
+
+    after = parent.timings()
+    assert list(after) == ["a", "b"]
+    assert after["a"] == before["a"] + child.timings()["a"]
+    assert after["b"] == child.timings()["b"]
+
+
+def test_child_shares_callback():
+    events = []
+    parent = resolve_instrumentation(events.append)
+    with parent.child().span("x"):
+        pass
+    assert [e["event"] for e in events] == ["start", "stop"]
+
+
+def test_null_instrumentation_has_no_timings():
+    assert NULL_INSTRUMENTATION.child() is NULL_INSTRUMENTATION
+    NULL_INSTRUMENTATION.merge(Instrumentation())
+    result = run_full_lcc_analysis(Input_global, CONSTRUCTION_COSTS)
+    assert "timings" not in result
@@ -0,0 +1,75 @@
+import pytest
+
+from examples.from_dict.Input import Input
+from examples.from_dict.Input_global import Input_global
+from examples.from_dict.wpi import wpi
+
+from three_ps_lcca_core.core.main import run_full_lcc_analysis
+from three_ps_lcca_core.core.stage_cost.summary import summarize_stage_costs
+from three_ps_lcca_core.core.utils.debug_sink import NullSink
+
+from cases import CASES, CONSTRUCTION_COSTS
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_lean_matches_summary_of_default(name):
+    input_data, case_wpi = CASES[name]
+
+    default = run_full_lcc_analysis(input_data, CONSTRUCTION_COSTS, wpi=case_wpi)
+    lean = run_full_lcc_analysis(input_data, CONSTRUCTION_COSTS, wpi=case_wpi, lean=True)
+
+    expected = summarize_stage_costs(default)
+    assert list(lean) == list(expected)
+    # Exact: lean mode adds the same costs in the same order.
+    assert lean == expected
+
+
+def test_lean_skips_stage_result_methods(monkeypatch):
+    from three_ps_lcca_core.core.stage_cost.stage_cost import StageCostCalculator
+
+    def fail(self):
+        raise AssertionError("stage result method called in lean mode")
+
+    for method in (
+        "initial_cost_calculator",
+        "use_stage_cost_calculator",
+        "reconstruction",
+        "end_of_life_stage_costs",
+    ):
+        monkeypatch.setattr(StageCostCalculator, method, fail)
+
+    lean = run_full_lcc_analysis(Input_global, CONSTRUCTION_COSTS, lean=True)
+    assert set(lean) >= {"economic", "environmental", "social", "total"}
+
+
+@pytest.mark.parametrize("name", ["detailed", "detailed.6L"])
+def test_lean_builds_no_wpi_debugger_blocks(name, monkeypatch):
+    from three_ps_lcca_core.core.road_user_cost.vehicle_operation_cost.utils import (
+        b_post_processor_for_VOC,
+        c_wpi_adjustment,
+    )
+
+    blocks = []
+
+    class CountingProcessor(c_wpi_adjustment.VOCPostProcessor):
+        def _apply_adjustment(self, cost_base, mult, path):
+            res = super()._apply_adjustment(cost_base, mult, path)
+            if "WPI_Debugger" in res:
+                blocks.append(path)
+            return res
+
+    monkeypatch.setattr(b_post_processor_for_VOC, "VOCPostProcessor", CountingProcessor)
+    input_data, case_wpi = CASES[name]
+
+    run_full_lcc_analysis(
+        input_data, CONSTRUCTION_COSTS, wpi=case_wpi, debug=True, debug_sink=NullSink()
+    )
+    assert blocks  # debug runs do build them
+    blocks.clear()
+    run_full_lcc_analysis(input_data, CONSTRUCTION_COSTS, wpi=case_wpi, lean=True)
+    assert blocks == []
+
+
+def test_lean_rejects_debug():
+    with pytest.raises(ValueError):
+        run_full_lcc_analysis(Input, CONSTRUCTION_COSTS, wpi=wpi, lean=True, debug=True)
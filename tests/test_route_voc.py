@@ -0,0 +1,78 @@
+import copy
+import random
+
+import pytest
+
+from examples.from_dict.Input import Input
+from examples.from_dict.wpi import wpi
+
+from three_ps_lcca_core.core.road_user_cost.carriage_width_info.carriagewayStandards import (
+    CarriagewayStandards,
+)
+from three_ps_lcca_core.core.road_user_cost.vehicle_operation_cost import core as VOC
+from three_ps_lcca_core.core.road_user_cost.vehicle_operation_cost import route
+
+GEOMETRY_FIELDS = (
+    "alternate_road_carriageway",
+    "carriage_width_in_m",
+    "road_roughness_mm_per_km",
+    "road_rise_m_per_km",
+    "road_fall_m_per_km",
+)
+
+LANE_TYPES, _ = CarriagewayStandards.list_types()
+
+
+def _segment(rng, lane_types=LANE_TYPES):
+    return {
+        "length_km": round(rng.uniform(0.05, 3), 3),
+        "alternate_road_carriageway": rng.choice(lane_types),
+        "carriage_width_in_m": round(rng.uniform(5.5, 25), 2),
+        "road_roughness_mm_per_km": round(rng.uniform(1000, 6000), 1),
+        "road_rise_m_per_km": round(rng.uniform(0, 20), 2),
+        "road_fall_m_per_km": round(rng.uniform(0, 20), 2),
+    }
+
+
+def _with_segments(segments):
+    traffic = copy.deepcopy(Input["traffic_and_road_data"])
+    traffic["additional_inputs"]["segments"] = segments
+    return traffic
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_vectorized_route_matches_segment_loop(seed, monkeypatch):
+    pytest.importorskip("numpy")
+    rng = random.Random(seed)
+    traffic = _with_segments(
+        [_segment(rng) for _ in range(rng.randint(route.VECTORIZE_MIN_SEGMENTS, 60))]
+    )
+    vectorized = VOC.main(traffic, wpi)
+    monkeypatch.setattr(route, "_has_numpy", lambda: False)
+    assert VOC.main(traffic, wpi) == vectorized
+
+
+def test_one_segment_route_equals_single_geometry():
+    single = Input["traffic_and_road_data"]
+    one_segment = _with_segments(
+        [
+            {
+                "length_km": 0.3,
+                **{field: single["additional_inputs"][field] for field in GEOMETRY_FIELDS},
+            }
+        ]
+    )
+    assert VOC.main(one_segment, wpi) == VOC.main(single, wpi)
+
+
+@pytest.mark.parametrize("count", [1, route.VECTORIZE_MIN_SEGMENTS])
+@pytest.mark.parametrize("has_numpy", [True, False])
+def test_zero_width_segment_raises(count, has_numpy, monkeypatch):
+    if has_numpy:
+        pytest.importorskip("numpy")
+    rng = random.Random(count)
+    segments = [_segment(rng) for _ in range(count)]
+    segments[-1]["carriage_width_in_m"] = 0
+    monkeypatch.setattr(route, "_has_numpy", lambda: has_numpy)
+    with pytest.raises(ValueError):
+        VOC.main(_with_segments(segments), wpi)
@@ -0,0 +1,142 @@
+import copy
+import pickle
+import types
+
+import pytest
+
+from examples.from_dict.Input import Input
+from examples.from_dict.wpi import wpi
+
+from three_ps_lcca_core.core.road_user_cost import cache as cache_module
+from three_ps_lcca_core.core.road_user_cost.cache import RUCCache
+from three_ps_lcca_core.core.road_user_cost.main import calculate_road_user_costs
+
+TRAFFIC = Input["traffic_and_road_data"]
+
+
+def _traffic(small_cars):
+    traffic = copy.deepcopy(TRAFFIC)
+    traffic["vehicle_data"]["small_cars"]["vehicles_per_day"] = small_cars
+    return traffic
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(cache_module, "time", types.SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+def test_memory_hit_returns_fresh_copy():
+    cache = RUCCache()
+    first = cache.get_or_compute(TRAFFIC, wpi)
+    first["total_daily_ruc"] = None
+    second = cache.get_or_compute(copy.deepcopy(TRAFFIC), wpi)
+
+    assert second == calculate_road_user_costs(TRAFFIC, wpi)
+    stats = cache.stats()
+    assert (stats["misses"], stats["memory_hits"], stats["disk_hits"]) == (1, 1, 0)
+    assert stats["disk_size"] == 0
+
+
+def test_key_covers_traffic_wpi_and_vehicle_order():
+    reordered = dict(wpi, WPI=dict(reversed(list(wpi["WPI"].items()))))
+    keys = {
+        RUCCache.key(TRAFFIC, wpi),
+        RUCCache.key(_traffic(1), wpi),
+        RUCCache.key(TRAFFIC, reordered),
+    }
+    assert len(keys) == 3
+    assert RUCCache.key(copy.deepcopy(TRAFFIC), copy.deepcopy(wpi)) == RUCCache.key(TRAFFIC, wpi)
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = RUCCache(memory_size=2)
+    for cars in (1, 2, 1, 3):
+        cache.get_or_compute(_traffic(cars), wpi)
+    stats = cache.stats()
+    assert stats["memory_size"] == 2
+    assert stats["memory_evictions"] == 1
+    cache.get_or_compute(_traffic(1), wpi)  # kept: used after 2
+    assert cache.stats()["memory_hits"] == 2
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    cache = RUCCache(path=str(tmp_path / "ruc.sqlite"), ttl_seconds=60)
+    cache.get_or_compute(TRAFFIC, wpi)
+    clock[0] += 60
+    cache.get_or_compute(TRAFFIC, wpi)
+    assert cache.stats()["memory_hits"] == 1
+
+    clock[0] += 1
+    cache.get_or_compute(TRAFFIC, wpi)
+    stats = cache.stats()
+    # Both tiers held the expired entry; it is computed again.
+    assert stats["expired"] == 2
+    assert stats["misses"] == 2
+
+
+def test_disk_tier_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "ruc.sqlite")
+    RUCCache(path=path).get_or_compute(TRAFFIC, wpi)
+
+    other = pickle.loads(pickle.dumps(RUCCache(path=path)))
+    assert other.get_or_compute(TRAFFIC, wpi) == calculate_road_user_costs(TRAFFIC, wpi)
+    other.get_or_compute(TRAFFIC, wpi)
+    stats = other.stats()
+    assert (stats["misses"], stats["disk_hits"], stats["memory_hits"]) == (0, 1, 1)
+    other.close()
+
+
+def test_disk_tier_keeps_max_entries(tmp_path, clock):
+    cache = RUCCache(path=str(tmp_path / "ruc.sqlite"), memory_size=0, max_entries=2)
+    for cars in (1, 2, 3):
+        clock[0] += 1
+        cache.get_or_compute(_traffic(cars), wpi)
+    stats = cache.stats()
+    assert stats["disk_size"] == 2
+    assert stats["disk_evictions"] == 1
+
+    cache.get_or_compute(_traffic(1), wpi)  # the oldest row was evicted
+    assert cache.stats()["misses"] == 4
+
+
+def test_engine_change_invalidates_disk_entries(tmp_path, monkeypatch):
+    path = str(tmp_path / "ruc.sqlite")
+    RUCCache(path=path).get_or_compute(TRAFFIC, wpi)
+    old_key = RUCCache.key(TRAFFIC, wpi)
+
+    monkeypatch.setattr(cache_module, "ruc_engine_version", lambda: "edited")
+    assert RUCCache.key(TRAFFIC, wpi) != old_key
+    cache = RUCCache(path=path)
+    assert cache.stats()["disk_size"] == 0  # stale rows purged on open
+    cache.get_or_compute(TRAFFIC, wpi)
+    assert cache.stats()["misses"] == 1
+
+
+def test_clear_drops_both_tiers(tmp_path):
+    cache = RUCCache(path=str(tmp_path / "ruc.sqlite"))
+    cache.get_or_compute(TRAFFIC, wpi)
+    cache.clear()
+    stats = cache.stats()
+    assert stats["memory_size"] == stats["disk_size"] == stats["misses"] == 0
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"memory_size": -1}, {"max_entries": -1}, {"ttl_seconds": -1}]
+)
+def test_rejects_negative_limits(kwargs):
+    with pytest.raises(ValueError):
+        RUCCache(**kwargs)
+
+
+def test_cached_analysis_equals_uncached():
+    from three_ps_lcca_core.core.main import run_full_lcc_analysis
+
+    from cases import CONSTRUCTION_COSTS
+
+    cache = RUCCache()
+    expected = run_full_lcc_analysis(Input, CONSTRUCTION_COSTS, wpi=wpi)
+    for _ in range(2):
+        assert run_full_lcc_analysis(Input, CONSTRUCTION_COSTS, wpi=wpi, ruc_cache=cache) == expected
+    assert cache.stats()["memory_hits"] == 1
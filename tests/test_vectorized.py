@@ -0,0 +1,88 @@
+import pytest
+
+from three_ps_lcca_core.core.stage_cost.stage_cost import StageCostCalculator
+from three_ps_lcca_core.core.stage_cost.summary import summarize_stage_costs
+from three_ps_lcca_core.core.stage_cost.vectorized import (
+    VECTOR_COSTS,
+    VECTOR_PARAMS,
+    VectorizedStageCostCalculator,
+)
+
+from cases import CASES, stage_inputs
+
+np = pytest.importorskip("numpy")
+
+POINTS = 500
+
+
+def _sweep(stage_params, program_inputs, points, seed):
+    rng = np.random.default_rng(seed)
+    general = dict(stage_params["general"])
+    general["discount_rate_percent"] = np.round(rng.uniform(0, 15, points), 2)
+    general["inflation_rate_percent"] = np.round(rng.uniform(0, 12, points), 2)
+    general["interest_rate_percent"] = np.round(rng.uniform(0, 12, points), 2)
+    general["service_life_years"] = rng.choice([20, 30, 50, 75, 100], points)
+    general["analysis_period_years"] = rng.choice([25, 50, 60, 100, 120], points)
+
+    costs = dict(program_inputs)
+    for key in VECTOR_COSTS:
+        costs[key] = program_inputs[key] * rng.uniform(0.5, 1.5, points)
+    return dict(stage_params, general=general), costs
+
+
+def _point(params, costs, k):
+    general = dict(params["general"])
+    for key in VECTOR_PARAMS:
+        general[key] = general[key][k].item()
+    program_inputs = dict(costs)
+    for key in VECTOR_COSTS:
+        program_inputs[key] = costs[key][k].item()
+    return dict(params, general=general), program_inputs
+
+
+def _scalar_summary(stage_params, program_inputs):
+    calc = StageCostCalculator(stage_params, program_inputs)
+    return summarize_stage_costs(
+        {
+            "initial_stage": calc.initial_cost_calculator(),
+            "use_stage": calc.use_stage_cost_calculator(),
+            "reconstruction": calc.reconstruction(),
+            "end_of_life": calc.end_of_life_stage_costs(),
+        }
+    )
+
+
+@pytest.mark.parametrize("name,seed", [("detailed", 0), ("global", 1)])
+def test_sweep_matches_scalar_engine(name, seed):
+    params, costs = _sweep(*stage_inputs(*CASES[name]), POINTS, seed)
+    summary = VectorizedStageCostCalculator(params, costs).summary()
+
+    for k in range(POINTS):
+        expected = _scalar_summary(*_point(params, costs, k))
+        # Exact: the sweep evaluates the same formulas element-wise.
+        assert {key: summary[key][k] for key in expected} == expected, k
+
+
+def test_sweep_broadcasts_to_grid_shape():
+    stage_params, program_inputs = stage_inputs(*CASES["detailed"])
+    general = dict(stage_params["general"])
+    general["discount_rate_percent"] = np.linspace(4, 12, 5)[:, None]
+    general["inflation_rate_percent"] = np.linspace(2, 8, 3)[None, :]
+    sweep = VectorizedStageCostCalculator(dict(stage_params, general=general), program_inputs)
+
+    total = sweep.summary()["total"]
+    assert total.shape == (5, 3)
+    assert sweep.size == 15
+
+    general = dict(general, discount_rate_percent=4.0, inflation_rate_percent=8.0)
+    expected = _scalar_summary(dict(stage_params, general=general), program_inputs)
+    assert total[0, 2] == expected["total"]
+
+
+def test_sweep_rejects_incompatible_shapes():
+    stage_params, program_inputs = stage_inputs(*CASES["detailed"])
+    general = dict(stage_params["general"])
+    general["discount_rate_percent"] = np.zeros(3)
+    general["inflation_rate_percent"] = np.zeros(4)
+    with pytest.raises(ValueError):
+        VectorizedStageCostCalculator(dict(stage_params, general=general), program_inputs)
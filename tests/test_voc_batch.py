@@ -0,0 +1,77 @@
+import copy
+
+import pytest
+
+from examples.from_dict.Input import Input
+from examples.from_dict.wpi import wpi
+
+from three_ps_lcca_core.core import standard_keys as c
+from three_ps_lcca_core.core.road_user_cost.carriage_width_info.carriagewayStandards import (
+    CarriagewayStandards,
+)
+from three_ps_lcca_core.core.road_user_cost.vehicle_operation_cost import core as VOC
+from three_ps_lcca_core.core.road_user_cost.vehicle_operation_cost.batch import (
+    compute_voc_batch,
+)
+
+np = pytest.importorskip("numpy")
+
+GEOMETRIES = 300
+
+
+def _geometries(count, seed):
+    rng = np.random.default_rng(seed)
+    lane_types, _ = CarriagewayStandards.list_types()
+    return {
+        "rg_roughness_factor": np.round(rng.uniform(1000, 6000, count), 1),
+        "fl_fall_factor": np.round(rng.uniform(0, 20, count), 2),
+        "rs_rise_factor": np.round(rng.uniform(0, 20, count), 2),
+        "carriageway_width": np.round(rng.uniform(5.5, 25, count), 2),
+        "lane_type": rng.choice(lane_types, count),
+        "pwr": {c.HCV: rng.uniform(1, 12, count), c.MCV: rng.uniform(1, 12, count)},
+    }
+
+
+def _traffic_input(geometry, k):
+    traffic = copy.deepcopy(Input["traffic_and_road_data"])
+    for vehicle, data in traffic["vehicle_data"].items():
+        data["vehicles_per_day"] = 1
+        if vehicle in geometry["pwr"]:
+            data["pwr"] = geometry["pwr"][vehicle][k].item()
+    traffic["additional_inputs"].update(
+        {
+            "road_roughness_mm_per_km": geometry["rg_roughness_factor"][k].item(),
+            "road_fall_m_per_km": geometry["fl_fall_factor"][k].item(),
+            "road_rise_m_per_km": geometry["rs_rise_factor"][k].item(),
+            "carriage_width_in_m": geometry["carriageway_width"][k].item(),
+            "alternate_road_carriageway": geometry["lane_type"][k].item(),
+        }
+    )
+    return traffic
+
+
+def test_batch_matches_single_geometry_runs():
+    geometry = _geometries(GEOMETRIES, seed=0)
+    batch = compute_voc_batch(
+        wpi,
+        geometry["rg_roughness_factor"],
+        geometry["fl_fall_factor"],
+        geometry["rs_rise_factor"],
+        geometry["carriageway_width"],
+        geometry["lane_type"],
+        power_weight_ratio_pwr=geometry["pwr"],
+    )
+
+    for k in range(GEOMETRIES):
+        expected, _ = VOC.main(_traffic_input(geometry, k), wpi)
+        for cost_type, vehicles in expected.items():
+            for vehicle, costs in vehicles.items():
+                if not isinstance(costs, dict):
+                    continue
+                for key, value in costs.items():
+                    assert batch[cost_type][vehicle][key][k] == value, (
+                        k,
+                        cost_type,
+                        vehicle,
+                        key,
+                    )